@@ -1,46 +1,183 @@
 """
 SQLite database management for log indexing
 """
+import queue
 import sqlite3
 import threading
+import time
+from itertools import islice
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Thread-local storage for database connections
-_thread_local = threading.local()
+# Open connection pools, one per database path
+_pools: Dict[str, '_ConnectionPool'] = {}
+_pools_lock = threading.Lock()
 
+# Read connections kept open per database; readers beyond this wait for a
+# connection to be returned
+READ_POOL_SIZE = 8
 
-def get_db_connection(db_path: str) -> sqlite3.Connection:
+# Shortest search term the trigram full-text index can match; shorter
+# terms are searched with LIKE
+FTS_MIN_TERM_LENGTH = 3
+
+# Seconds between forced WAL checkpoints for each initialized database
+WAL_CHECKPOINT_INTERVAL = 60
+
+# Size (bytes) the -wal file is truncated to after an automatic checkpoint
+WAL_SIZE_LIMIT = 64 * 1024 * 1024
+
+# Databases checkpointed by the background checkpoint thread
+_checkpoint_paths = set()
+_checkpoint_thread: Optional[threading.Thread] = None
+_checkpoint_lock = threading.Lock()
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+CACHED_STATEMENTS = 256
+
+# Log entry insert; one shared string so every insert hits the
+# connection's statement cache
+INSERT_LOG_SQL = (
+    "INSERT INTO log_entries (job_id, job_name, timestamp, level, message, file_path, line_number) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _connect(db_path: str, readonly: bool = False) -> sqlite3.Connection:
+    """Open a connection with the pragmas every pooled connection uses"""
+    conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS)
+    conn.row_factory = sqlite3.Row  # Enable dict-like access
+
+    # Larger pages for a new database; page size is fixed once the
+    # file has content (and can't change at all in WAL mode)
+    if conn.execute('PRAGMA page_count').fetchone()[0] == 0:
+        conn.execute('PRAGMA page_size=8192')
+
+    # Enable WAL mode for better concurrency
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')  # Faster writes
+    conn.execute('PRAGMA busy_timeout=30000')  # 30 second timeout
+    conn.execute('PRAGMA cache_size=-65536')  # 64 MB page cache
+    conn.execute('PRAGMA temp_store=MEMORY')  # Sorts and temp indexes in memory
+
+    # Read through a memory map of up to 1 GB instead of copying pages
+    # into the page cache; counts toward RSS only for pages touched
+    conn.execute('PRAGMA mmap_size=1073741824')
+
+    # Checkpoint the WAL every 10000 pages instead of 1000 so bursts of
+    # indexer writes aren't interrupted by checkpoints
+    conn.execute('PRAGMA wal_autocheckpoint=10000')
+
+    # Automatic checkpoints never shrink the -wal file; truncate it back to
+    # this size after each one so a burst doesn't leave a huge file behind
+    conn.execute(f'PRAGMA journal_size_limit={WAL_SIZE_LIMIT}')
+
+    if readonly:
+        # Writes belong on the pool's write connection; fail fast on a
+        # reader instead of racing it for the database lock
+        conn.execute('PRAGMA query_only=1')
+
+    return conn
+
+
+class _ConnectionPool:
     """
-    Get database connection for current thread.
-    Connections are thread-local to avoid sqlite threading issues.
+    One write connection and READ_POOL_SIZE read connections for a database
+
+    WAL lets readers run alongside the single writer, so writes are
+    serialized on one connection while reads take any free reader. The
+    write lock is reentrant so a write helper can run inside an open
+    write block on the same thread and join its transaction.
+
+    Readers are opened on demand, so a database only ever read by one
+    thread at a time keeps a single read connection (and page cache).
     """
-    if not hasattr(_thread_local, 'connection') or _thread_local.connection is None:
-        conn = sqlite3.connect(db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
 
-        # Enable WAL mode for better concurrency
-        conn.execute('PRAGMA journal_mode=WAL')
-        conn.execute('PRAGMA synchronous=NORMAL')  # Faster writes
-        conn.execute('PRAGMA busy_timeout=30000')  # 30 second timeout
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        # The writer is opened first so it sets up a new database file
+        self.writer = _connect(db_path)
+        self.write_lock = threading.RLock()
+        self.readers: queue.Queue = queue.Queue(maxsize=READ_POOL_SIZE)
+        self._readers_opened = 0
+        self._readers_lock = threading.Lock()
+
+    def acquire_reader(self) -> sqlite3.Connection:
+        """Take a free read connection, opening one if the pool isn't full yet"""
+        try:
+            return self.readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._readers_lock:
+            open_new = self._readers_opened < READ_POOL_SIZE
+            if open_new:
+                self._readers_opened += 1
+        if not open_new:
+            return self.readers.get()
+
+        try:
+            return _connect(self.db_path, readonly=True)
+        except Exception:
+            with self._readers_lock:
+                self._readers_opened -= 1
+            raise
+
+    def release_reader(self, conn: sqlite3.Connection) -> None:
+        self.readers.put(conn)
 
-        _thread_local.connection = conn
-        logger.info(f"Created database connection for thread {threading.current_thread().name}")
+    def close(self) -> None:
+        with self.write_lock:
+            self.writer.close()
+        while True:
+            try:
+                self.readers.get_nowait().close()
+            except queue.Empty:
+                break
 
-    return _thread_local.connection
+
+def _get_pool(db_path: str) -> _ConnectionPool:
+    """Return the connection pool for a database, opening it on first use"""
+    pool = _pools.get(db_path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(db_path)
+            if pool is None:
+                pool = _ConnectionPool(db_path)
+                _pools[db_path] = pool
+                logger.info(f"Opened database connection pool for {db_path}")
+    return pool
 
 
 @contextmanager
-def get_db(db_path: str):
+def get_db(db_path: str, write: bool = False):
     """
     Context manager for database operations.
     Automatically commits on success, rollbacks on error.
+
+    Args:
+        db_path: Path to the database
+        write: Use the pool's write connection (held exclusively for the
+            block) instead of a shared read connection
     """
-    conn = get_db_connection(db_path)
+    pool = _get_pool(db_path)
+    if write:
+        with pool.write_lock:
+            yield from _transaction(pool.writer)
+    else:
+        conn = pool.acquire_reader()
+        try:
+            yield from _transaction(conn)
+        finally:
+            pool.release_reader(conn)
+
+
+def _transaction(conn: sqlite3.Connection):
+    """Yield conn, then commit, or roll back if the block raised"""
     try:
         yield conn
         conn.commit()
@@ -50,6 +187,41 @@ def get_db(db_path: str):
         raise
 
 
+def bulk_insert_log_entries(db_path: str, rows: Iterable[Tuple], chunk_size: int = 1000) -> int:
+    """
+    Insert log entries in a single write transaction
+
+    Rows are passed to executemany() chunk_size at a time, so a generator
+    is never materialized in full, and everything is committed once at
+    the end. BEGIN IMMEDIATE takes the write lock up front instead of
+    upgrading a read transaction midway.
+
+    Args:
+        db_path: Path to the database
+        rows: Tuples of (job_id, job_name, timestamp, level, message, file_path, line_number)
+        chunk_size: Rows per executemany() call
+
+    Returns:
+        Number of rows inserted
+    """
+    rows = iter(rows)
+    chunk = list(islice(rows, chunk_size))
+    if not chunk:
+        return 0
+
+    inserted = 0
+    with get_db(db_path, write=True) as conn:
+        if not conn.in_transaction:
+            conn.execute('BEGIN IMMEDIATE')
+
+        while chunk:
+            conn.executemany(INSERT_LOG_SQL, chunk)
+            inserted += len(chunk)
+            chunk = list(islice(rows, chunk_size))
+
+    return inserted
+
+
 def initialize_database(db_path: str) -> None:
     """
     Initialize database schema if not exists.
@@ -60,7 +232,7 @@ def initialize_database(db_path: str) -> None:
     # Create data directory if it doesn't exist
     db_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with get_db(db_path) as conn:
+    with get_db(db_path, write=True) as conn:
         cursor = conn.cursor()
 
         # Create log_entries table
@@ -79,10 +251,14 @@ def initialize_database(db_path: str) -> None:
         ''')
 
         # Create indexes for performance
+        # "Recent lines for job X" is read straight from this index in
+        # timestamp order, so it needs neither a sort nor a separate
+        # job_id index
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_job_id
-            ON log_entries(job_id)
+            CREATE INDEX IF NOT EXISTS idx_job_time_covering
+            ON log_entries(job_id, timestamp DESC, level, message)
         ''')
+        cursor.execute('DROP INDEX IF EXISTS idx_job_id')
 
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_timestamp
@@ -99,6 +275,9 @@ def initialize_database(db_path: str) -> None:
             ON log_entries(indexed_at DESC)
         ''')
 
+        # Full-text index for log message search
+        _create_log_search_index(cursor)
+
         # Create indexer checkpoint table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS indexer_checkpoints (
@@ -110,23 +289,7 @@ def initialize_database(db_path: str) -> None:
         ''')
 
         # Create error_events table (Task 6.5)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS error_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                severity TEXT CHECK(severity IN ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')),
-                component TEXT NOT NULL,
-                error_type TEXT NOT NULL,
-                message TEXT NOT NULL,
-                details TEXT,
-                job_id TEXT,
-                job_name TEXT,
-                stack_trace TEXT,
-                resolved BOOLEAN DEFAULT 0,
-                resolved_at DATETIME,
-                indexed_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        _create_error_events(cursor)
 
         # Create indexes for error_events
         cursor.execute('''
@@ -134,10 +297,13 @@ def initialize_database(db_path: str) -> None:
             ON error_events(timestamp DESC)
         ''')
 
+        # The per-job and per-severity panels read their newest errors
+        # straight from these in timestamp order, with no sort
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_error_severity
-            ON error_events(severity)
+            CREATE INDEX IF NOT EXISTS idx_error_severity_time
+            ON error_events(severity, timestamp DESC)
         ''')
+        cursor.execute('DROP INDEX IF EXISTS idx_error_severity')
 
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_error_component
@@ -145,21 +311,243 @@ def initialize_database(db_path: str) -> None:
         ''')
 
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_error_job_id
-            ON error_events(job_id)
+            CREATE INDEX IF NOT EXISTS idx_error_job_time
+            ON error_events(job_id, timestamp DESC)
         ''')
+        cursor.execute('DROP INDEX IF EXISTS idx_error_job_id')
 
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_error_resolved
             ON error_events(resolved, timestamp DESC)
         ''')
 
+        # Stack traces live in their own table so the multi-KB text isn't
+        # read by every error list query
+        _create_error_stack_traces(cursor)
+
         logger.info(f"Database initialized at {db_path}")
 
+    _schedule_checkpoints(db_path)
+
+
+# Severity is stored as its ErrorEvent.SEVERITY_CODES value
+_ERROR_EVENTS_SQL = '''
+    CREATE TABLE {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        severity INTEGER CHECK(severity BETWEEN 0 AND 3),
+        component TEXT NOT NULL,
+        error_type TEXT NOT NULL,
+        message TEXT NOT NULL,
+        details TEXT,
+        job_id TEXT,
+        job_name TEXT,
+        stack_trace TEXT,
+        resolved BOOLEAN DEFAULT 0,
+        resolved_at DATETIME,
+        indexed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+
+def _create_error_events(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the error_events table
+
+    Severities are stored as small integers rather than their names, so
+    the (severity, timestamp) index is smaller and severity filters
+    compare integers. A table from an older schema, with text
+    severities, is rebuilt with its rows converted; its indexes and
+    triggers are recreated by initialize_database().
+    """
+    row = cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'error_events'"
+    ).fetchone()
+    if row is None:
+        cursor.execute(_ERROR_EVENTS_SQL.format(table='error_events'))
+        return
+    if 'severity INTEGER' in row[0]:
+        return
+
+    # Left behind if a previous rebuild was interrupted before its commit
+    cursor.execute('DROP TABLE IF EXISTS error_events_new')
+    cursor.execute(_ERROR_EVENTS_SQL.format(table='error_events_new'))
+    cursor.execute('''
+        INSERT INTO error_events_new (
+            id, timestamp, severity, component, error_type, message, details,
+            job_id, job_name, stack_trace, resolved, resolved_at, indexed_at
+        )
+        SELECT id, timestamp,
+               CASE severity WHEN 'LOW' THEN 0 WHEN 'MEDIUM' THEN 1 WHEN 'HIGH' THEN 2 WHEN 'CRITICAL' THEN 3 END,
+               component, error_type, message, details,
+               job_id, job_name, stack_trace, resolved, resolved_at, indexed_at
+        FROM error_events
+    ''')
+    copied = cursor.rowcount
+
+    # Keep the AUTOINCREMENT high-water mark so deleted IDs aren't reused
+    seq = cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'error_events'").fetchone()
+    cursor.execute('DROP TABLE error_events')
+    cursor.execute('ALTER TABLE error_events_new RENAME TO error_events')
+    if seq:
+        cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'error_events'")
+        cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('error_events', ?)", seq)
+    logger.info(f"Converted severities of {copied} error events to integer codes")
+
+
+def _create_error_stack_traces(cursor: sqlite3.Cursor) -> None:
+    """Create the stack trace table and move any inline traces into it"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS error_stack_traces (
+            error_id INTEGER PRIMARY KEY,
+            trace TEXT NOT NULL
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS error_events_ad AFTER DELETE ON error_events BEGIN
+            DELETE FROM error_stack_traces WHERE error_id = old.id;
+        END
+    ''')
+
+    # Databases from before the split keep traces in error_events
+    cursor.execute('''
+        INSERT OR IGNORE INTO error_stack_traces (error_id, trace)
+        SELECT id, stack_trace FROM error_events WHERE stack_trace IS NOT NULL
+    ''')
+    if cursor.rowcount:
+        cursor.execute('UPDATE error_events SET stack_trace = NULL WHERE stack_trace IS NOT NULL')
+        logger.info(f"Moved {cursor.rowcount} error stack traces to error_stack_traces")
+
+
+def checkpoint_wal(db_path: str) -> Tuple[int, int, int]:
+    """
+    Checkpoint the WAL into the database file and truncate it
+
+    Returns:
+        Tuple of (busy, wal pages, pages checkpointed); busy is 1 if a
+        reader or writer kept the checkpoint from completing
+    """
+    with get_db(db_path, write=True) as conn:
+        busy, wal_pages, checkpointed = conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchone()
+
+    if busy:
+        logger.warning(
+            f"WAL checkpoint of {db_path} blocked by an open transaction "
+            f"({checkpointed}/{wal_pages} pages copied)"
+        )
+    return busy, wal_pages, checkpointed
+
+
+def _schedule_checkpoints(db_path: str) -> None:
+    """Add a database to the background checkpoint thread, starting it if needed"""
+    global _checkpoint_thread
+    with _checkpoint_lock:
+        _checkpoint_paths.add(db_path)
+        if _checkpoint_thread is None:
+            _checkpoint_thread = threading.Thread(target=_checkpoint_loop, daemon=True, name="WalCheckpointer")
+            _checkpoint_thread.start()
+
+
+def _checkpoint_loop() -> None:
+    """Periodically checkpoint every scheduled database that has an open pool"""
+    while True:
+        time.sleep(WAL_CHECKPOINT_INTERVAL)
+        with _checkpoint_lock:
+            paths = list(_checkpoint_paths)
+        for db_path in paths:
+            # Closed databases are left alone rather than reopened
+            if db_path not in _pools:
+                continue
+            try:
+                checkpoint_wal(db_path)
+            except Exception as e:
+                logger.error(f"WAL checkpoint of {db_path} failed: {e}")
+
+
+def _create_log_search_index(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the FTS5 index over log_entries.message
+
+    The trigram tokenizer lets LIKE '%term%' on the index stand in for a
+    case-insensitive substring scan of log_entries. The index is
+    external-content (message text is only stored in log_entries) and
+    detail=none (no token positions), which roughly halves its size; FTS5
+    rechecks candidate rows against the text, so results stay exact.
+    Triggers keep the index in sync with log_entries, and an index added
+    to an existing database is built from the rows already there. An
+    index from an older schema is rebuilt. Skipped if SQLite was built
+    without FTS5.
+    """
+    row = cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'log_entries_fts'"
+    ).fetchone()
+    if row:
+        if 'detail=none' in row[0].replace(' ', ''):
+            return
+        for trigger in ('log_entries_ai', 'log_entries_ad', 'log_entries_au'):
+            cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        cursor.execute('DROP TABLE log_entries_fts')
+
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE log_entries_fts USING fts5(
+                message,
+                content='log_entries',
+                content_rowid='id',
+                tokenize='trigram',
+                detail=none
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text log search unavailable, falling back to LIKE: {e}")
+        return
+
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS log_entries_ai AFTER INSERT ON log_entries BEGIN
+            INSERT INTO log_entries_fts(rowid, message) VALUES (new.id, new.message);
+        END
+    ''')
+
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS log_entries_ad AFTER DELETE ON log_entries BEGIN
+            INSERT INTO log_entries_fts(log_entries_fts, rowid, message) VALUES ('delete', old.id, old.message);
+        END
+    ''')
+
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS log_entries_au AFTER UPDATE ON log_entries BEGIN
+            INSERT INTO log_entries_fts(log_entries_fts, rowid, message) VALUES ('delete', old.id, old.message);
+            INSERT INTO log_entries_fts(rowid, message) VALUES (new.id, new.message);
+        END
+    ''')
+
+    cursor.execute("INSERT INTO log_entries_fts(log_entries_fts) VALUES ('rebuild')")
+
+
+def has_log_search_index(conn: sqlite3.Connection) -> bool:
+    """Check whether the log_entries_fts full-text index exists"""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'log_entries_fts'"
+    ).fetchone() is not None
+
+
+def has_like_wildcards(term: str) -> bool:
+    """Check whether a search term contains LIKE wildcard or escape characters"""
+    return any(c in term for c in '%_\\')
+
+
+def like_pattern(term: str) -> str:
+    """Build a LIKE pattern matching term anywhere, for use with ESCAPE '\\'"""
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
 
 def close_connection():
-    """Close the thread-local database connection"""
-    if hasattr(_thread_local, 'connection') and _thread_local.connection:
-        _thread_local.connection.close()
-        _thread_local.connection = None
-        logger.info(f"Closed database connection for thread {threading.current_thread().name}")
+    """Close every pooled database connection"""
+    with _pools_lock:
+        pools = list(_pools.items())
+        _pools.clear()
+    for db_path, pool in pools:
+        pool.close()
+        logger.info(f"Closed database connection pool for {db_path}")
@@ -3,10 +3,12 @@ Error Recovery Strategies (Task 6.3)
 Implements automatic recovery mechanisms for common failure scenarios
 """
 import logging
+import random
+import threading
 import time
 import functools
 from typing import Callable, Any, Optional, Tuple
-from core.error_repository import get_error_repository
+from core import error_sink
 from models.error_event import ErrorEvent
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,10 @@ logger = logging.getLogger(__name__)
 class RecoveryStrategy:
     """Base class for error recovery strategies"""
 
+    # Exceptions worth retrying; OSError covers IOError, TimeoutError,
+    # ConnectionError and BlockingIOError
+    TRANSIENT_ERRORS = (OSError,)
+
     def __init__(self, max_retries: int = 3, initial_delay: float = 1.0):
         """
         Initialize recovery strategy
@@ -26,6 +32,9 @@ class RecoveryStrategy:
         self.max_retries = max_retries
         self.initial_delay = initial_delay
 
+        # Base delay for each attempt: 1s, 2s, 4s, 8s, ...
+        self._delays = tuple(initial_delay * (1 << i) for i in range(max_retries + 1))
+
     def should_retry(self, exception: Exception, attempt: int) -> bool:
         """
         Determine if operation should be retried
@@ -37,32 +46,25 @@ class RecoveryStrategy:
         Returns:
             True if should retry, False otherwise
         """
-        # Don't retry if max attempts reached
-        if attempt > self.max_retries:
-            return False
-
-        # Retry transient errors
-        transient_errors = (
-            IOError,
-            OSError,
-            TimeoutError,
-            ConnectionError,
-        )
-
-        return isinstance(exception, transient_errors)
+        # Retry transient errors until max attempts is reached
+        return attempt <= self.max_retries and isinstance(exception, self.TRANSIENT_ERRORS)
 
     def get_retry_delay(self, attempt: int) -> float:
         """
         Calculate delay before next retry using exponential backoff
 
+        The base delay is scaled by a random factor between 0.5 and 1.5 so
+        callers that failed together (e.g. several writers hitting the same
+        locked file) don't all retry at the same moment.
+
         Args:
             attempt: Current attempt number (1-indexed)
 
         Returns:
             Delay in seconds
         """
-        # Exponential backoff: 1s, 2s, 4s, 8s, ...
-        return self.initial_delay * (2 ** (attempt - 1))
+        base = self._delays[min(max(attempt, 1), len(self._delays)) - 1]
+        return base * (0.5 + random.random())
 
 
 class ExponentialBackoffRetry:
@@ -98,11 +100,23 @@ class ExponentialBackoffRetry:
         Returns:
             Decorated function
         """
+        # Nothing to retry or report: the wrapper would only add overhead
+        if self.strategy.max_retries == 0 and not self.log_errors:
+            return func
+
+        # Bound once here so each call reads closure variables instead of
+        # attribute chains on self
+        max_retries = self.strategy.max_retries
+        should_retry = self.strategy.should_retry
+        get_retry_delay = self.strategy.get_retry_delay
+        component = self.component
+        log_errors = self.log_errors
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             last_exception = None
 
-            for attempt in range(1, self.strategy.max_retries + 2):
+            for attempt in range(1, max_retries + 2):
                 try:
                     # Try to execute the function
                     return func(*args, **kwargs)
@@ -111,34 +125,30 @@ class ExponentialBackoffRetry:
                     last_exception = e
 
                     # Check if we should retry
-                    if attempt <= self.strategy.max_retries and self.strategy.should_retry(e, attempt):
-                        delay = self.strategy.get_retry_delay(attempt)
+                    if attempt <= max_retries and should_retry(e, attempt):
+                        delay = get_retry_delay(attempt)
                         logger.warning(
-                            f"{self.component}: {func.__name__} failed (attempt {attempt}/{self.strategy.max_retries}). "
-                            f"Retrying in {delay}s. Error: {str(e)}"
+                            f"{component}: {func.__name__} failed (attempt {attempt}/{max_retries}). "
+                            f"Retrying in {delay:.2f}s. Error: {str(e)}"
                         )
                         time.sleep(delay)
                         continue
 
                     # Max retries reached or non-retriable error
                     logger.error(
-                        f"{self.component}: {func.__name__} failed after {attempt} attempts. "
+                        f"{component}: {func.__name__} failed after {attempt} attempts. "
                         f"Error: {str(e)}"
                     )
 
-                    # Log to error database
-                    if self.log_errors:
-                        try:
-                            error_repo = get_error_repository()
-                            error_event = ErrorEvent.from_exception(
-                                exception=e,
-                                severity=ErrorEvent.SEVERITY_MEDIUM,
-                                component=self.component,
-                                message=f"{func.__name__} failed after {attempt} retry attempts"
-                            )
-                            error_repo.log_error(error_event)
-                        except Exception as log_err:
-                            logger.error(f"Failed to log error event: {log_err}")
+                    # Queue for the error database (traceback formatted by
+                    # the writer thread)
+                    if log_errors:
+                        error_sink.enqueue_exception(
+                            e,
+                            severity=ErrorEvent.SEVERITY_MEDIUM,
+                            component=component,
+                            message=f"{func.__name__} failed after {attempt} retry attempts"
+                        )
 
                     # Re-raise the last exception
                     raise
@@ -216,8 +226,15 @@ class CircuitBreaker:
 
         self.state = self.STATE_CLOSED
         self.failure_count = 0
+        # time.monotonic() of the last failure; wall-clock jumps (NTP,
+        # suspend) must not shorten or stretch the recovery timeout
         self.last_failure_time = 0.0
 
+        # Guards the state fields; never held while the wrapped function runs
+        self._lock = threading.Lock()
+        # Set while the single HALF_OPEN recovery probe is running
+        self._half_open_in_flight = False
+
     def call(self, func: Callable, *args, **kwargs) -> Tuple[bool, Any]:
         """
         Execute function through circuit breaker
@@ -231,63 +248,81 @@ class CircuitBreaker:
             Tuple of (success, result)
         """
         # Check circuit state
-        if self.state == self.STATE_OPEN:
-            # Check if recovery timeout has passed
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                logger.info(f"{self.component}: Circuit breaker entering HALF_OPEN state")
-                self.state = self.STATE_HALF_OPEN
-            else:
-                # Circuit still open, reject immediately
-                logger.warning(f"{self.component}: Circuit breaker OPEN, rejecting request")
-                return False, None
+        probe = False
+        with self._lock:
+            if self.state == self.STATE_OPEN:
+                # Check if recovery timeout has passed
+                if time.monotonic() - self.last_failure_time >= self.recovery_timeout:
+                    logger.info(f"{self.component}: Circuit breaker entering HALF_OPEN state")
+                    self.state = self.STATE_HALF_OPEN
+                else:
+                    # Circuit still open, reject immediately
+                    logger.warning(f"{self.component}: Circuit breaker OPEN, rejecting request")
+                    return False, None
+
+            if self.state == self.STATE_HALF_OPEN:
+                # Only one request tests recovery; the rest are rejected
+                # until it finishes
+                if self._half_open_in_flight:
+                    logger.warning(f"{self.component}: Circuit breaker HALF_OPEN, recovery probe in flight")
+                    return False, None
+                self._half_open_in_flight = probe = True
 
         # Try to execute function
         try:
             result = func(*args, **kwargs)
 
-            # Success - reset circuit
-            if self.state == self.STATE_HALF_OPEN:
-                logger.info(f"{self.component}: Circuit breaker entering CLOSED state (recovered)")
-                self.state = self.STATE_CLOSED
-                self.failure_count = 0
-
-            return True, result
-
         except Exception as e:
             # Failure - increment counter
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-
-            logger.error(f"{self.component}: Circuit breaker failure #{self.failure_count}: {str(e)}")
+            with self._lock:
+                self.failure_count += 1
+                self.last_failure_time = time.monotonic()
+                failure_count = self.failure_count
 
-            # Check if threshold reached
-            if self.failure_count >= self.failure_threshold:
-                logger.error(
-                    f"{self.component}: Circuit breaker OPENED after {self.failure_count} failures. "
-                    f"Will retry in {self.recovery_timeout}s"
-                )
-                self.state = self.STATE_OPEN
+                logger.error(f"{self.component}: Circuit breaker failure #{failure_count}: {str(e)}")
 
-                # Log to error database
-                try:
-                    error_repo = get_error_repository()
-                    error_event = ErrorEvent.from_exception(
-                        exception=e,
-                        severity=ErrorEvent.SEVERITY_HIGH,
-                        component=self.component,
-                        message=f"Circuit breaker opened after {self.failure_count} failures"
+                # Check if threshold reached; concurrent failures past the
+                # threshold don't reopen (and re-report) an open circuit
+                opened = failure_count >= self.failure_threshold and self.state != self.STATE_OPEN
+                if opened:
+                    logger.error(
+                        f"{self.component}: Circuit breaker OPENED after {failure_count} failures. "
+                        f"Will retry in {self.recovery_timeout}s"
                     )
-                    error_repo.log_error(error_event)
-                except Exception as log_err:
-                    logger.error(f"Failed to log error event: {log_err}")
+                    self.state = self.STATE_OPEN
+
+            # Queue for the error database
+            if opened:
+                error_sink.enqueue_exception(
+                    e,
+                    severity=ErrorEvent.SEVERITY_HIGH,
+                    component=self.component,
+                    message=f"Circuit breaker opened after {failure_count} failures"
+                )
 
             return False, None
 
+        finally:
+            if probe:
+                with self._lock:
+                    self._half_open_in_flight = False
+
+        # Success - reset circuit
+        with self._lock:
+            if self.state == self.STATE_HALF_OPEN:
+                logger.info(f"{self.component}: Circuit breaker entering CLOSED state (recovered)")
+                self.state = self.STATE_CLOSED
+                self.failure_count = 0
+
+        return True, result
+
     def reset(self):
         """Reset circuit breaker to closed state"""
-        self.state = self.STATE_CLOSED
-        self.failure_count = 0
-        self.last_failure_time = 0.0
+        with self._lock:
+            self.state = self.STATE_CLOSED
+            self.failure_count = 0
+            self.last_failure_time = 0.0
+            self._half_open_in_flight = False
         logger.info(f"{self.component}: Circuit breaker manually reset")
 
 
@@ -351,24 +386,20 @@ class GracefulDegradation:
                 )
                 self.is_degraded = True
 
-                # Log to error database
-                try:
-                    error_repo = get_error_repository()
-                    error_event = ErrorEvent.from_exception(
-                        exception=e,
-                        severity=ErrorEvent.SEVERITY_MEDIUM,
-                        component=self.component,
-                        message=f"Component degraded, using fallback value"
-                    )
-                    error_repo.log_error(error_event)
-                except Exception as log_err:
-                    logger.error(f"Failed to log error event: {log_err}")
+                # Queue for the error database
+                error_sink.enqueue_exception(
+                    e,
+                    severity=ErrorEvent.SEVERITY_MEDIUM,
+                    component=self.component,
+                    message="Component degraded, using fallback value"
+                )
 
             return self.fallback_value
 
 
 # Global circuit breakers for common components
 _circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
 
 
 def get_circuit_breaker(component: str, **kwargs) -> CircuitBreaker:
@@ -382,6 +413,7 @@ def get_circuit_breaker(component: str, **kwargs) -> CircuitBreaker:
     Returns:
         CircuitBreaker instance
     """
-    if component not in _circuit_breakers:
-        _circuit_breakers[component] = CircuitBreaker(component=component, **kwargs)
-    return _circuit_breakers[component]
+    with _circuit_breakers_lock:
+        if component not in _circuit_breakers:
+            _circuit_breakers[component] = CircuitBreaker(component=component, **kwargs)
+        return _circuit_breakers[component]
@@ -2,9 +2,11 @@
 Error Event Repository for storing and retrieving error events
 """
 import logging
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from core.database import get_db, initialize_database
 from core.paths import get_data_dir
 from models.error_event import ErrorEvent
@@ -15,6 +17,83 @@ logger = logging.getLogger(__name__)
 class ErrorEventRepository:
     """Repository for managing error events in SQLite database"""
 
+    # executemany() discards RETURNING rows, so batches use the plain
+    # INSERT and derive their IDs from last_insert_rowid()
+    _INSERT_MANY_SQL = '''
+        INSERT INTO error_events (
+            timestamp, severity, component, error_type,
+            message, details, job_id, job_name,
+            resolved, resolved_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _INSERT_SQL = _INSERT_MANY_SQL + ' RETURNING id'
+    _INSERT_TRACE_SQL = 'INSERT INTO error_stack_traces (error_id, trace) VALUES (?, ?)'
+
+    # Query text is defined once so every call reuses the pooled
+    # connection's cached prepared statement. Lists leave out the stack
+    # trace (NULL keeps the column positions); get_error() and
+    # get_stack_trace() read it from error_stack_traces.
+    _SELECT_SQL = '''
+        SELECT id, timestamp, severity, component, error_type,
+               message, details, job_id, job_name, NULL,
+               resolved, resolved_at
+        FROM error_events
+    '''
+    _GET_BY_ID_SQL = '''
+        SELECT e.id, e.timestamp, e.severity, e.component, e.error_type,
+               e.message, e.details, e.job_id, e.job_name, t.trace,
+               e.resolved, e.resolved_at
+        FROM error_events e
+        LEFT JOIN error_stack_traces t ON t.error_id = e.id
+        WHERE e.id = ?
+    '''
+    _GET_TRACE_SQL = 'SELECT trace FROM error_stack_traces WHERE error_id = ?'
+    _RECENT_SQL = _SELECT_SQL + 'ORDER BY timestamp DESC LIMIT ?'
+    _RECENT_BY_RESOLVED_SQL = _SELECT_SQL + 'WHERE resolved = ? ORDER BY timestamp DESC LIMIT ?'
+    _BY_JOB_SQL = _SELECT_SQL + 'WHERE job_id = ? ORDER BY timestamp DESC LIMIT ?'
+    _BY_SEVERITY_SQL = _SELECT_SQL + 'WHERE severity = ? ORDER BY timestamp DESC LIMIT ?'
+
+    _RESOLVE_SQL = 'UPDATE error_events SET resolved = 1, resolved_at = ? WHERE id = ?'
+
+    # One pass over the table, grouped by severity; the per-severity rows
+    # are summed for the totals
+    _STATS_SQL = '''
+        SELECT severity,
+               COUNT(*),
+               IFNULL(SUM(resolved = 0), 0),
+               IFNULL(SUM(timestamp >= ?), 0)
+        FROM error_events
+        GROUP BY severity
+    '''
+
+    # Timestamps are ISO strings, so a bucket is a fixed-length prefix:
+    # 'YYYY-MM-DD' for a day, 'YYYY-MM-DDTHH' for an hour
+    _HISTOGRAM_SQL = '''
+        SELECT substr(timestamp, 1, ?), severity, COUNT(*)
+        FROM error_events
+        WHERE timestamp >= ?
+        GROUP BY 1, 2
+        ORDER BY 1
+    '''
+    _HISTOGRAM_BUCKETS = {'hour': 13, 'day': 10}
+
+    _DELETE_OLD_SQL = '''
+        DELETE FROM error_events
+        WHERE id IN (
+            SELECT id FROM error_events
+            WHERE resolved = 1 AND timestamp < ?
+            LIMIT ?
+        )
+    '''
+
+    # Maximum age of the cached get_error_stats() result in seconds; writes
+    # through this repository invalidate it immediately
+    STATS_CACHE_TTL = 1.0
+
+    # Rows removed per transaction by delete_old_errors(), so a large
+    # cleanup doesn't hold the write connection away from log_error()
+    DELETE_BATCH_SIZE = 1000
+
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize ErrorEventRepository
@@ -30,6 +109,10 @@ class ErrorEventRepository:
         # Initialize database schema
         initialize_database(self.db_path)
 
+        # get_error_stats() cache: (write version, time, stats)
+        self._write_version = 0
+        self._stats_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
+
     def log_error(self, error_event: ErrorEvent) -> int:
         """
         Log an error event to the database
@@ -41,37 +124,73 @@ class ErrorEventRepository:
             ID of inserted error event
         """
         try:
-            with get_db(self.db_path) as conn:
-                cursor = conn.cursor()
+            with get_db(self.db_path, write=True) as conn:
+                event_id = self._insert_event(conn.cursor(), error_event)
 
-                cursor.execute('''
-                    INSERT INTO error_events (
-                        timestamp, severity, component, error_type,
-                        message, details, job_id, job_name,
-                        stack_trace, resolved, resolved_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    error_event.timestamp.isoformat() if isinstance(error_event.timestamp, datetime) else error_event.timestamp,
-                    error_event.severity,
-                    error_event.component,
-                    error_event.error_type,
-                    error_event.message,
-                    error_event.details,
-                    error_event.job_id,
-                    error_event.job_name,
-                    error_event.stack_trace,
-                    1 if error_event.resolved else 0,
-                    error_event.resolved_at.isoformat() if error_event.resolved_at else None
-                ))
-
-                event_id = cursor.lastrowid
-                logger.info(f"Logged error event #{event_id}: {error_event.severity} - {error_event.message}")
-                return event_id
+            self._errors_changed()
+            logger.info(f"Logged error event #{event_id}: {error_event.severity} - {error_event.message}")
+            return event_id
 
         except Exception as e:
             logger.error(f"Failed to log error event: {e}")
             raise
 
+    def log_errors(self, error_events: List[ErrorEvent]) -> int:
+        """
+        Log several error events in one transaction
+
+        Args:
+            error_events: ErrorEvent instances to log
+
+        Returns:
+            Number of events inserted
+        """
+        if not error_events:
+            return 0
+
+        try:
+            with get_db(self.db_path, write=True) as conn:
+                cursor = conn.cursor()
+                cursor.executemany(self._INSERT_MANY_SQL, [self._event_row(event) for event in error_events])
+
+                traced = [(i, event.stack_trace) for i, event in enumerate(error_events) if event.stack_trace]
+                if traced:
+                    # AUTOINCREMENT hands out consecutive IDs while this
+                    # transaction holds the write lock
+                    first_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0] - len(error_events) + 1
+                    cursor.executemany(self._INSERT_TRACE_SQL, [(first_id + i, trace) for i, trace in traced])
+
+            self._errors_changed()
+            logger.info(f"Logged {len(error_events)} error events")
+            return len(error_events)
+
+        except Exception as e:
+            logger.error(f"Failed to log error events: {e}")
+            raise
+
+    def _insert_event(self, cursor, error_event: ErrorEvent) -> int:
+        """Insert an event and its stack trace (if any); returns the event ID"""
+        event_id = cursor.execute(self._INSERT_SQL, self._event_row(error_event)).fetchone()[0]
+        if error_event.stack_trace:
+            cursor.execute(self._INSERT_TRACE_SQL, (event_id, error_event.stack_trace))
+        return event_id
+
+    @staticmethod
+    def _event_row(error_event: ErrorEvent) -> tuple:
+        """Column values for inserting an error event"""
+        return (
+            error_event.timestamp.isoformat() if isinstance(error_event.timestamp, datetime) else error_event.timestamp,
+            ErrorEvent.SEVERITY_CODES[error_event.severity],
+            error_event.component,
+            error_event.error_type,
+            error_event.message,
+            error_event.details,
+            error_event.job_id,
+            error_event.job_name,
+            1 if error_event.resolved else 0,
+            error_event.resolved_at.isoformat() if error_event.resolved_at else None
+        )
+
     def get_error(self, error_id: int) -> Optional[ErrorEvent]:
         """
         Get a specific error event by ID
@@ -83,25 +202,33 @@ class ErrorEventRepository:
             ErrorEvent instance or None if not found
         """
         try:
-            with get_db(self.db_path) as conn:
-                cursor = conn.cursor()
+            events = self._fetch_events(self._GET_BY_ID_SQL, (error_id,))
+            return events[0] if events else None
 
-                cursor.execute('''
-                    SELECT id, timestamp, severity, component, error_type,
-                           message, details, job_id, job_name, stack_trace,
-                           resolved, resolved_at
-                    FROM error_events
-                    WHERE id = ?
-                ''', (error_id,))
+        except Exception as e:
+            logger.error(f"Failed to get error event {error_id}: {e}")
+            return None
+
+    def get_stack_trace(self, error_id: int) -> Optional[str]:
+        """
+        Get the stack trace of an error event
 
-                row = cursor.fetchone()
-                if row:
-                    return self._row_to_error_event(row)
+        Events returned by the list methods don't include their trace;
+        fetch it here when it is actually shown.
 
-                return None
+        Args:
+            error_id: Error event ID
+
+        Returns:
+            Stack trace text, or None if the event has none
+        """
+        try:
+            with get_db(self.db_path) as conn:
+                row = conn.execute(self._GET_TRACE_SQL, (error_id,)).fetchone()
+            return row[0] if row else None
 
         except Exception as e:
-            logger.error(f"Failed to get error event {error_id}: {e}")
+            logger.error(f"Failed to get stack trace for error {error_id}: {e}")
             return None
 
     def get_recent_errors(self, limit: int = 100, resolved: Optional[bool] = None) -> List[ErrorEvent]:
@@ -116,33 +243,11 @@ class ErrorEventRepository:
             List of ErrorEvent instances
         """
         try:
-            with get_db(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                if resolved is None:
-                    # Get all errors
-                    cursor.execute('''
-                        SELECT id, timestamp, severity, component, error_type,
-                               message, details, job_id, job_name, stack_trace,
-                               resolved, resolved_at
-                        FROM error_events
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                    ''', (limit,))
-                else:
-                    # Filter by resolved status
-                    cursor.execute('''
-                        SELECT id, timestamp, severity, component, error_type,
-                               message, details, job_id, job_name, stack_trace,
-                               resolved, resolved_at
-                        FROM error_events
-                        WHERE resolved = ?
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                    ''', (1 if resolved else 0, limit))
-
-                rows = cursor.fetchall()
-                return [self._row_to_error_event(row) for row in rows]
+            if resolved is None:
+                # Get all errors
+                return self._fetch_events(self._RECENT_SQL, (limit,))
+            # Filter by resolved status
+            return self._fetch_events(self._RECENT_BY_RESOLVED_SQL, (1 if resolved else 0, limit))
 
         except Exception as e:
             logger.error(f"Failed to get recent errors: {e}")
@@ -160,21 +265,7 @@ class ErrorEventRepository:
             List of ErrorEvent instances
         """
         try:
-            with get_db(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                cursor.execute('''
-                    SELECT id, timestamp, severity, component, error_type,
-                           message, details, job_id, job_name, stack_trace,
-                           resolved, resolved_at
-                    FROM error_events
-                    WHERE job_id = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                ''', (job_id, limit))
-
-                rows = cursor.fetchall()
-                return [self._row_to_error_event(row) for row in rows]
+            return self._fetch_events(self._BY_JOB_SQL, (job_id, limit))
 
         except Exception as e:
             logger.error(f"Failed to get errors for job {job_id}: {e}")
@@ -192,26 +283,27 @@ class ErrorEventRepository:
             List of ErrorEvent instances
         """
         try:
-            with get_db(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                cursor.execute('''
-                    SELECT id, timestamp, severity, component, error_type,
-                           message, details, job_id, job_name, stack_trace,
-                           resolved, resolved_at
-                    FROM error_events
-                    WHERE severity = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                ''', (severity, limit))
-
-                rows = cursor.fetchall()
-                return [self._row_to_error_event(row) for row in rows]
+            code = ErrorEvent.SEVERITY_CODES.get(severity)
+            return self._fetch_events(self._BY_SEVERITY_SQL, (code, limit))
 
         except Exception as e:
             logger.error(f"Failed to get errors by severity {severity}: {e}")
             return []
 
+    def _fetch_events(self, sql: str, params: tuple) -> List[ErrorEvent]:
+        """Run a query built on _SELECT_SQL and convert its rows"""
+        with get_db(self.db_path) as conn:
+            return self._query_events(conn, sql, params)
+
+    @classmethod
+    def _query_events(cls, conn, sql: str, params: tuple) -> List[ErrorEvent]:
+        """Run a query built on _SELECT_SQL on an open connection"""
+        # Plain tuples; the columns are unpacked by position
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        rows = cursor.execute(sql, params).fetchall()
+        return [cls._row_to_error_event(row) for row in rows]
+
     def mark_resolved(self, error_id: int) -> bool:
         """
         Mark an error event as resolved
@@ -222,66 +314,62 @@ class ErrorEventRepository:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            with get_db(self.db_path) as conn:
-                cursor = conn.cursor()
+        return self.mark_resolved_bulk([error_id]) > 0
+
+    def mark_resolved_bulk(self, error_ids: List[int]) -> int:
+        """
+        Mark several error events as resolved in one transaction
+
+        Every event gets the same resolved_at, and the batch is committed
+        (and synced) once rather than once per event.
+
+        Args:
+            error_ids: Error event IDs
+
+        Returns:
+            Number of events marked resolved
+        """
+        if not error_ids:
+            return 0
 
-                cursor.execute('''
-                    UPDATE error_events
-                    SET resolved = 1, resolved_at = ?
-                    WHERE id = ?
-                ''', (datetime.now().isoformat(), error_id))
+        resolved_at = datetime.now().isoformat()
+        try:
+            with get_db(self.db_path, write=True) as conn:
+                # Reuses the cached single-row statement; an IN (...) list
+                # would prepare a new statement for every batch size
+                cursor = conn.executemany(self._RESOLVE_SQL, [(resolved_at, error_id) for error_id in error_ids])
 
-                logger.info(f"Marked error event #{error_id} as resolved")
-                return cursor.rowcount > 0
+            self._errors_changed()
+            logger.info(f"Marked {cursor.rowcount} error events as resolved")
+            return cursor.rowcount
 
         except Exception as e:
-            logger.error(f"Failed to mark error {error_id} as resolved: {e}")
-            return False
+            logger.error(f"Failed to mark errors {error_ids} as resolved: {e}")
+            return 0
 
     def get_error_stats(self) -> Dict[str, Any]:
         """
         Get error statistics
+        Cached for STATS_CACHE_TTL seconds, or until the next write through
+        this repository.
 
         Returns:
             Dictionary with error statistics
         """
+        # Read the version before querying, so a write that lands while
+        # the query runs leaves the stored result already stale
+        version = self._write_version
+        cached = self._stats_cache
+        now = time.monotonic()
+        if cached is not None and cached[0] == version and now - cached[1] < self.STATS_CACHE_TTL:
+            return cached[2]
+
         try:
             with get_db(self.db_path) as conn:
-                cursor = conn.cursor()
+                stats = self._query_stats(conn)
 
-                # Total errors
-                cursor.execute('SELECT COUNT(*) FROM error_events')
-                total = cursor.fetchone()[0]
-
-                # Unresolved errors
-                cursor.execute('SELECT COUNT(*) FROM error_events WHERE resolved = 0')
-                unresolved = cursor.fetchone()[0]
-
-                # By severity
-                cursor.execute('''
-                    SELECT severity, COUNT(*) as count
-                    FROM error_events
-                    WHERE resolved = 0
-                    GROUP BY severity
-                ''')
-                by_severity = {row[0]: row[1] for row in cursor.fetchall()}
-
-                # Recent errors (last 24 hours)
-                cursor.execute('''
-                    SELECT COUNT(*)
-                    FROM error_events
-                    WHERE datetime(timestamp) >= datetime('now', '-1 day')
-                ''')
-                recent_24h = cursor.fetchone()[0]
-
-                return {
-                    'total': total,
-                    'unresolved': unresolved,
-                    'resolved': total - unresolved,
-                    'by_severity': by_severity,
-                    'recent_24h': recent_24h
-                }
+            self._stats_cache = (version, now, stats)
+            return stats
 
         except Exception as e:
             logger.error(f"Failed to get error stats: {e}")
@@ -293,6 +381,103 @@ class ErrorEventRepository:
                 'recent_24h': 0
             }
 
+    def get_dashboard_snapshot(self, recent_limit: int = 50, resolved: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Get error statistics and the most recent errors together
+
+        Both queries run in one read transaction on one pooled connection,
+        so the counts and the list always agree. The statistics also
+        refresh the get_error_stats() cache.
+
+        Args:
+            recent_limit: Maximum number of recent events to return
+            resolved: Filter recent events by resolved status, as in get_recent_errors()
+
+        Returns:
+            Dict with 'stats' (as from get_error_stats()) and 'recent'
+            (list of ErrorEvent, newest first)
+        """
+        version = self._write_version
+        now = time.monotonic()
+        try:
+            with get_db(self.db_path) as conn:
+                conn.execute('BEGIN')
+                stats = self._query_stats(conn)
+                if resolved is None:
+                    recent = self._query_events(conn, self._RECENT_SQL, (recent_limit,))
+                else:
+                    recent = self._query_events(conn, self._RECENT_BY_RESOLVED_SQL, (1 if resolved else 0, recent_limit))
+
+            self._stats_cache = (version, now, stats)
+            return {'stats': stats, 'recent': recent}
+
+        except Exception as e:
+            logger.error(f"Failed to get error dashboard snapshot: {e}")
+            return {
+                'stats': {
+                    'total': 0,
+                    'unresolved': 0,
+                    'resolved': 0,
+                    'by_severity': {},
+                    'recent_24h': 0
+                },
+                'recent': []
+            }
+
+    def get_error_histogram(self, bucket: str = 'hour', days: int = 1) -> Dict[str, Dict[str, int]]:
+        """
+        Count errors per time bucket and severity
+
+        Counted by SQLite in one grouped query over the timestamp index,
+        rather than by fetching the events and grouping them here.
+
+        Args:
+            bucket: 'hour' or 'day'
+            days: Only count errors from the last N days
+
+        Returns:
+            Dict mapping each bucket ('YYYY-MM-DDTHH' or 'YYYY-MM-DD', oldest
+            first) to a dict of severity -> count; buckets and severities
+            with no errors are left out
+        """
+        if bucket not in self._HISTOGRAM_BUCKETS:
+            raise ValueError(f"Invalid bucket '{bucket}'. Must be one of: {', '.join(self._HISTOGRAM_BUCKETS)}")
+
+        histogram: Dict[str, Dict[str, int]] = {}
+        try:
+            with get_db(self.db_path) as conn:
+                rows = conn.execute(
+                    self._HISTOGRAM_SQL, (self._HISTOGRAM_BUCKETS[bucket], self._cutoff(days=days))
+                ).fetchall()
+
+            for key, severity, count in rows:
+                histogram.setdefault(key, {})[ErrorEvent.VALID_SEVERITIES[severity]] = count
+            return histogram
+
+        except Exception as e:
+            logger.error(f"Failed to get error histogram: {e}")
+            return {}
+
+    def _query_stats(self, conn) -> Dict[str, Any]:
+        """Compute error statistics on an open connection"""
+        total = unresolved = recent_24h = 0
+        by_severity = {}
+        rows = conn.execute(self._STATS_SQL, (self._cutoff(days=1),)).fetchall()
+        for severity, count, severity_unresolved, severity_recent in rows:
+            total += count
+            unresolved += severity_unresolved
+            recent_24h += severity_recent
+            if severity_unresolved:
+                by_severity[ErrorEvent.VALID_SEVERITIES[severity]] = severity_unresolved
+
+        return {
+            'total': total,
+            'unresolved': unresolved,
+            'resolved': total - unresolved,
+            'by_severity': by_severity,
+            'recent_24h': recent_24h
+        }
+
     def delete_old_errors(self, days: int = 30) -> int:
         """
         Delete resolved errors older than specified days
@@ -303,60 +488,73 @@ class ErrorEventRepository:
         Returns:
             Number of errors deleted
         """
+        cutoff = self._cutoff(days=days)
+        deleted = 0
         try:
-            with get_db(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                cursor.execute('''
-                    DELETE FROM error_events
-                    WHERE resolved = 1
-                    AND datetime(timestamp) < datetime('now', '-' || ? || ' days')
-                ''', (days,))
+            while True:
+                with get_db(self.db_path, write=True) as conn:
+                    batch = conn.execute(self._DELETE_OLD_SQL, (cutoff, self.DELETE_BATCH_SIZE)).rowcount
+                deleted += batch
+                if batch < self.DELETE_BATCH_SIZE:
+                    break
 
-                deleted = cursor.rowcount
-                logger.info(f"Deleted {deleted} old resolved errors (older than {days} days)")
-                return deleted
+            self._errors_changed()
+            logger.info(f"Deleted {deleted} old resolved errors (older than {days} days)")
+            return deleted
 
         except Exception as e:
             logger.error(f"Failed to delete old errors: {e}")
-            return 0
+            # Earlier batches stay committed
+            if deleted:
+                self._errors_changed()
+            return deleted
 
-    def _row_to_error_event(self, row) -> ErrorEvent:
+    def _errors_changed(self) -> None:
+        """Invalidate cached stats after a write"""
+        self._write_version += 1
+
+    @staticmethod
+    def _cutoff(days: int) -> str:
+        """
+        Stored timestamp for `days` ago
+
+        Timestamps are stored as local-time ISO strings, which sort in time
+        order, so range filters compare the column against this directly
+        and can seek on the (resolved, timestamp) index instead of calling
+        datetime() on every row.
+        """
+        return (datetime.now() - timedelta(days=days)).isoformat()
+
+    @staticmethod
+    def _row_to_error_event(row, _fromisoformat=datetime.fromisoformat,
+                            _severities=tuple(ErrorEvent.VALID_SEVERITIES)) -> ErrorEvent:
         """
         Convert database row to ErrorEvent instance
 
         Args:
-            row: SQLite row object
+            row: Row with the columns of _SELECT_SQL, in order
 
         Returns:
             ErrorEvent instance
         """
-        timestamp = row['timestamp']
-        if timestamp and isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp)
+        (event_id, timestamp, severity, component, error_type, message, details,
+         job_id, job_name, stack_trace, resolved, resolved_at) = row
 
-        resolved_at = row['resolved_at']
+        if timestamp and isinstance(timestamp, str):
+            timestamp = _fromisoformat(timestamp)
         if resolved_at and isinstance(resolved_at, str):
-            resolved_at = datetime.fromisoformat(resolved_at)
+            resolved_at = _fromisoformat(resolved_at)
 
         return ErrorEvent(
-            event_id=row['id'],
-            timestamp=timestamp,
-            severity=row['severity'],
-            component=row['component'],
-            error_type=row['error_type'],
-            message=row['message'],
-            details=row['details'],
-            job_id=row['job_id'],
-            job_name=row['job_name'],
-            stack_trace=row['stack_trace'],
-            resolved=bool(row['resolved']),
-            resolved_at=resolved_at
+            _severities[severity], component, error_type, message, details, job_id, job_name,
+            stack_trace, event_id, timestamp, bool(resolved), resolved_at
         )
 
 
 # Global singleton instance
 _error_repo = None
+# Guards first construction so concurrent callers share one instance
+_error_repo_lock = threading.Lock()
 
 
 def get_error_repository() -> ErrorEventRepository:
@@ -368,5 +566,7 @@ def get_error_repository() -> ErrorEventRepository:
     """
     global _error_repo
     if _error_repo is None:
-        _error_repo = ErrorEventRepository()
+        with _error_repo_lock:
+            if _error_repo is None:
+                _error_repo = ErrorEventRepository()
     return _error_repo
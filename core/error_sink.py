@@ -0,0 +1,164 @@
+"""
+Background writer for error events
+
+Recovery code reports failures from request and worker threads, often
+many at once when a dependency goes down. Events are queued and a daemon
+thread writes them to the error database in batches, so callers don't
+wait on a SQLite insert (or pile onto the write lock) while failing.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Union
+
+from core.error_repository import get_error_repository
+from models.error_event import ErrorEvent
+
+logger = logging.getLogger(__name__)
+
+# Events waiting to be written; when full, new events are dropped rather
+# than blocking the caller
+MAX_QUEUED_EVENTS = 10000
+
+# A batch is written once it has this many events or its first event has
+# waited this long (seconds), whichever comes first
+FLUSH_BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.1
+
+
+class _RawErrorEvent(NamedTuple):
+    """An exception queued by enqueue_exception(), formatted by the writer thread"""
+    exception: BaseException
+    severity: str
+    component: str
+    message: str
+    job_id: Optional[str]
+    job_name: Optional[str]
+    timestamp: datetime
+
+
+_queue: "queue.Queue[Union[ErrorEvent, _RawErrorEvent]]" = queue.Queue(maxsize=MAX_QUEUED_EVENTS)
+_flusher_thread = None
+_flusher_lock = threading.Lock()
+
+
+def enqueue(error_event: ErrorEvent) -> bool:
+    """
+    Queue an error event to be written to the error database
+
+    Args:
+        error_event: ErrorEvent to log
+
+    Returns:
+        True if queued, False if the queue was full and the event dropped
+    """
+    return _put(error_event)
+
+
+def enqueue_exception(
+    exception: BaseException,
+    severity: str,
+    component: str,
+    message: str,
+    job_id: Optional[str] = None,
+    job_name: Optional[str] = None
+) -> bool:
+    """
+    Queue an exception to be logged as an ErrorEvent
+
+    Equivalent to enqueue(ErrorEvent.from_exception(...)), except the stack
+    trace is formatted on the writer thread instead of the failing one.
+
+    Args:
+        exception: The exception that occurred (its traceback is kept)
+        severity: Error severity level
+        component: Component where error occurred
+        message: Human-readable context message
+        job_id: Associated job ID (if applicable)
+        job_name: Associated job name (if applicable)
+
+    Returns:
+        True if queued, False if the queue was full and the event dropped
+    """
+    return _put(_RawErrorEvent(exception, severity, component, message, job_id, job_name, datetime.now()))
+
+
+def _put(item: Union[ErrorEvent, _RawErrorEvent]) -> bool:
+    """Queue an item for the writer thread, dropping it if the queue is full"""
+    _start_flusher()
+    try:
+        _queue.put_nowait(item)
+        return True
+    except queue.Full:
+        logger.warning(f"Error event queue full, dropping: {item.severity} - {item.message}")
+        return False
+
+
+def flush() -> None:
+    """Wait until every queued error event has been written"""
+    if _flusher_thread is not None:
+        _queue.join()
+
+
+def _start_flusher() -> None:
+    """Start the flusher thread on first use"""
+    global _flusher_thread
+    if _flusher_thread is not None:
+        return
+
+    with _flusher_lock:
+        if _flusher_thread is None:
+            thread = threading.Thread(target=_flush_loop, daemon=True, name="ErrorEventWriter")
+            thread.start()
+            _flusher_thread = thread
+            # Write whatever is still queued on exit
+            atexit.register(flush)
+
+
+def _flush_loop() -> None:
+    """Collect queued events into batches and write them"""
+    while True:
+        batch = [_queue.get()]
+        deadline = time.monotonic() + FLUSH_INTERVAL
+
+        while len(batch) < FLUSH_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        _write_batch(batch)
+        for _ in batch:
+            _queue.task_done()
+
+
+def _write_batch(batch: List[Union[ErrorEvent, _RawErrorEvent]]) -> None:
+    """Write a batch of events, logging (not raising) on failure"""
+    events = []
+    for item in batch:
+        if isinstance(item, ErrorEvent):
+            events.append(item)
+            continue
+        try:
+            events.append(ErrorEvent.from_exception(
+                exception=item.exception,
+                severity=item.severity,
+                component=item.component,
+                message=item.message,
+                job_id=item.job_id,
+                job_name=item.job_name,
+                timestamp=item.timestamp
+            ))
+        except Exception as e:
+            logger.error(f"Failed to build error event: {e}")
+
+    try:
+        get_error_repository().log_errors(events)
+    except Exception as e:
+        logger.error(f"Failed to log {len(events)} error events: {e}")
@@ -1,40 +1,62 @@
 """
 Job Manager - Central controller for all backup jobs
 """
+import logging
+import queue
 import time
 import threading
 from typing import Dict, List, Optional, Tuple
 from models.job import Job
 from storage.job_storage import JobStorage
-from engines.rsync_engine import RsyncEngine
-from utils.validation import validate_job_before_start
-from utils.safety_checks import validate_deletion_safety
-from utils.deletion_logger import DeletionLogger
 from core.error_recovery import GracefulDegradation, get_circuit_breaker
 from core.error_repository import get_error_repository
 from models.error_event import ErrorEvent
 from utils.rwlock import ReadWriteLock
 
+logger = logging.getLogger(__name__)
+
 
 class JobManager:
     """Singleton manager for all backup jobs"""
 
     _instance = None
     _initialized = False
+    # Guards first construction so concurrent callers share one instance
+    _instance_lock = threading.Lock()
+
+    # Maximum age of the cached list_jobs() result in seconds; matches the
+    # default UI refresh interval (live progress is overlaid on cache hits)
+    JOB_LIST_CACHE_TTL = 2.0
+
+    # A running job's progress is saved when its percentage moves by
+    # PROGRESS_SAVE_PERCENT points, or when it has changed at all and
+    # PROGRESS_SAVE_INTERVAL seconds have passed since the last save
+    PROGRESS_SAVE_PERCENT = 1
+    PROGRESS_SAVE_INTERVAL = 1.0
 
     def __new__(cls):
         """Enforce singleton pattern"""
         if cls._instance is None:
-            cls._instance = super(JobManager, cls).__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(JobManager, cls).__new__(cls)
         return cls._instance
 
     def __init__(self):
         """Initialize JobManager (only once due to singleton)"""
-        if not JobManager._initialized:
+        if JobManager._initialized:
+            return
+
+        with JobManager._instance_lock:
+            if JobManager._initialized:
+                return
+
             self.storage = JobStorage()
             self.engines: Dict[str, any] = {}  # job_id -> engine instance
-            self.last_progress_save: Dict[str, Tuple[float, int]] = {}  # job_id -> (timestamp, percent)
+            self.last_progress_save: Dict[str, Tuple[float, int, int]] = {}  # job_id -> (timestamp, percent, bytes)
             self.engine_stop_times: Dict[str, float] = {}  # job_id -> timestamp when engine stopped
+            # (job_id, engine, stop time) queued by each engine's exit hook
+            self._finished_engines: queue.Queue = queue.Queue()
             
             # TASK 7.4: Use read-write lock for better concurrency
             # Replace single RLock with ReadWriteLock for improved read performance
@@ -43,9 +65,14 @@ class JobManager:
             self._lock = self._rwlock  # For backward compatibility
             self._engines_lock = threading.Lock()  # Protect engines dict access
 
+            # Jobs by ID and the jobs file signature they were loaded at;
+            # see _jobs()
+            self._job_cache: Optional[Tuple[Optional[tuple], Dict[str, Job]]] = None
+
             # Job list cache (Task 7.1)
             self._job_list_cache: Optional[List[Dict]] = None
             self._job_list_cache_time: float = 0.0
+            self._job_list_cache_key: Optional[tuple] = None
             self._job_list_dirty: bool = True
 
             JobManager._initialized = True
@@ -90,6 +117,7 @@ class JobManager:
 
                 # Save to storage
                 if self.storage.save_job(job):
+                    self._cache_job(job)
                     self._mark_job_list_dirty()  # Invalidate cache
                     return True, f"Job '{name}' created successfully", job
                 else:
@@ -116,14 +144,12 @@ class JobManager:
                     if job_id in self.engines and self.engines[job_id].is_running():
                         return False, "Job is already running"
 
-                # Load job from storage
-                job = self.storage.get_job(job_id)
+                job = self._get_job(job_id)
                 if not job:
                     return False, f"Job {job_id} not found"
 
                 # Enforce valid status transitions
-                valid_start_statuses = [Job.STATUS_PENDING, Job.STATUS_PAUSED, Job.STATUS_FAILED]
-                if job.status not in valid_start_statuses:
+                if job.status not in Job.STARTABLE_STATUSES:
                     if job.status == Job.STATUS_RUNNING:
                         return False, "Job is already running"
                     elif job.status == Job.STATUS_COMPLETED:
@@ -136,6 +162,13 @@ class JobManager:
                 if not valid:
                     return False, f"Path validation failed: {error_msg}"
 
+                # Start-only dependencies are imported here so listing and
+                # reading jobs doesn't load the engines and validators
+                from engines.rsync_engine import RsyncEngine
+                from utils.validation import validate_job_before_start
+                from utils.safety_checks import validate_deletion_safety
+                from utils.deletion_logger import DeletionLogger
+
                 # Comprehensive validation (disk space, permissions, etc.)
                 valid, error_msg = validate_job_before_start(job.source, job.dest, job.type)
                 if not valid:
@@ -206,24 +239,28 @@ class JobManager:
                 else:
                     return False, f"Unknown job type: {job.type}"
 
+                # Queue the engine for cleanup once its process has exited
+                engine.on_exit(lambda: self._finished_engines.put((job_id, engine, time.time())))
+
                 # Start engine
                 if engine.start():
                     engine_started = True
                     try:
                         with self._engines_lock:
                             self.engines[job_id] = engine
+                            # Drop any stop time left by this job's previous engine
+                            self.engine_stop_times.pop(job_id, None)
                             # Initialize progress tracking for periodic persistence
-                            self.last_progress_save[job_id] = (time.time(), 0)
+                            self.last_progress_save[job_id] = (time.time(), 0, 0)
 
                         job.update_status(Job.STATUS_RUNNING)
-                        self.storage.update_job(job)
+                        self._save_job(job)
                         self._mark_job_list_dirty()  # Invalidate cache when status changes
 
                         return True, f"Job '{job.name}' started successfully"
                     except Exception as e:
                         # Clean up engine if post-start operations failed
-                        import logging
-                        logging.error(f"Post-start failure for job {job_id}, cleaning up engine: {e}")
+                        logger.error(f"Post-start failure for job {job_id}, cleaning up engine: {e}")
                         with self._engines_lock:
                             if job_id in self.engines:
                                 try:
@@ -262,13 +299,13 @@ class JobManager:
                 # Stop engine
                 if engine.stop():
                     # Update job status
-                    job = self.storage.get_job(job_id)
+                    job = self._get_job(job_id)
                     if job:
                         # Get final progress from engine
                         final_progress = engine.get_progress()
                         job.update_progress(final_progress)
                         job.update_status(Job.STATUS_PAUSED)
-                        self.storage.update_job(job)
+                        self._save_job(job)
                         self._mark_job_list_dirty()  # Invalidate cache when status changes
 
                     # Clean up engine from memory
@@ -301,39 +338,47 @@ class JobManager:
         # TASK 7.4: Use read lock for status queries (allows concurrent reads)
         with self._rwlock.read_lock():
             try:
-                job = self.storage.get_job(job_id)
+                job = self._jobs().get(job_id)
                 if not job:
                     return None
 
-                # If job is running, get live progress from engine (read-only)
-                live_progress = None
-                with self._engines_lock:
-                    if job_id in self.engines:
-                        engine = self.engines[job_id]
-                        if engine.is_running():
-                            live_progress = engine.get_progress()
-
-                # Return job data with live progress if available
-                result = {
-                    'id': job.id,
-                    'name': job.name,
-                    'source': job.source,
-                    'dest': job.dest,
-                    'type': job.type,
-                    'status': job.status,
-                    'progress': live_progress if live_progress else job.progress,
-                    'settings': job.settings,
-                    'created_at': job.created_at,
-                    'updated_at': job.updated_at
-                }
-
-                return result
+                return self._job_info(job)
 
             except Exception as e:
-                import logging
-                logging.error(f"Error getting job status: {e}")
+                logger.exception(f"Error getting job status for {job_id}: {e}")
                 return None
 
+    def _job_info(self, job: Job) -> Dict:
+        """
+        Build the job info dict returned by the query methods
+
+        Args:
+            job: Job loaded from storage
+
+        Returns:
+            Dict with job info, using live engine progress if the job is running
+        """
+        # If job is running, get live progress from engine (read-only)
+        live_progress = None
+        with self._engines_lock:
+            engine = self.engines.get(job.id)
+            if engine and engine.is_running():
+                live_progress = engine.get_progress()
+
+        # Return job data with live progress if available
+        return {
+            'id': job.id,
+            'name': job.name,
+            'source': job.source,
+            'dest': job.dest,
+            'type': job.type,
+            'status': job.status,
+            'progress': live_progress if live_progress else job.progress,
+            'settings': job.settings,
+            'created_at': job.created_at,
+            'updated_at': job.updated_at
+        }
+
     def update_job_from_engine(self, job_id: str) -> Tuple[bool, str]:
         """
         Update job state from engine progress (WRITE operation)
@@ -350,7 +395,7 @@ class JobManager:
         # TASK 7.4: Use write lock for updating job state
         with self._rwlock.write_lock():
             try:
-                job = self.storage.get_job(job_id)
+                job = self._get_job(job_id)
                 if not job:
                     return False, f"Job {job_id} not found"
 
@@ -372,19 +417,21 @@ class JobManager:
                     # Persist progress periodically (throttled)
                     if self._should_persist_progress(job_id, live_progress):
                         # Check for concurrent modifications before saving
-                        storage_job = self.storage.get_job(job_id)
-                        if storage_job and storage_job.version != original_version:
-                            import logging
-                            logging.warning(
+                        cached_job = self._jobs().get(job_id)
+                        if cached_job and cached_job.version != original_version:
+                            logger.warning(
                                 f"Concurrent modification detected for job {job_id}: "
-                                f"original_version={original_version}, storage_version={storage_job.version}. "
+                                f"original_version={original_version}, current_version={cached_job.version}. "
                                 f"Proceeding with update (last write wins)."
                             )
 
-                        self.storage.update_job(job)
-                        current_percent = live_progress.get('percent', 0)
+                        self._save_job(job)
                         with self._engines_lock:
-                            self.last_progress_save[job_id] = (time.time(), current_percent)
+                            self.last_progress_save[job_id] = (
+                                time.time(),
+                                live_progress.get('percent', 0),
+                                live_progress.get('bytes_transferred', 0)
+                            )
 
                     return True, "Progress updated"
                 else:
@@ -392,41 +439,26 @@ class JobManager:
                     final_progress = engine.get_progress()
                     job.update_progress(final_progress)
 
-                    # CRITICAL: Save final progress BEFORE updating status
-                    # This ensures we don't lose progress data if app crashes during status update
-                    import logging
-                    storage_job = self.storage.get_job(job_id)
-                    if storage_job and storage_job.version != original_version:
-                        logging.warning(
-                            f"Concurrent modification detected for job {job_id} during final progress save: "
-                            f"original_version={original_version}, storage_version={storage_job.version}. "
-                            f"Proceeding with update (last write wins)."
-                        )
-
-                    logging.info(f"Saving final progress for job {job_id} before status change")
-                    self.storage.update_job(job)
-
-                    # Update version after first save
-                    original_version = job.version
-
-                    # Update status based on engine result
+                    # Final progress and status go out in one write; the
+                    # jobs file is replaced atomically, so a crash can't
+                    # keep one without the other
                     if final_progress.get('status') == 'completed':
                         job.update_status(Job.STATUS_COMPLETED)
                     elif final_progress.get('status') == 'failed':
                         job.update_status(Job.STATUS_FAILED)
 
                     # Check for concurrent modifications before final status save
-                    storage_job = self.storage.get_job(job_id)
-                    if storage_job and storage_job.version != original_version:
-                        logging.warning(
+                    cached_job = self._jobs().get(job_id)
+                    if cached_job and cached_job.version != original_version:
+                        logger.warning(
                             f"Concurrent modification detected for job {job_id} during final status save: "
-                            f"original_version={original_version}, storage_version={storage_job.version}. "
+                            f"original_version={original_version}, current_version={cached_job.version}. "
                             f"Proceeding with final update (last write wins)."
                         )
 
-                    # Save final status
-                    logging.info(f"Saving final status {job.status} for job {job_id}")
-                    self.storage.update_job(job)
+                    # Save final progress and status
+                    logger.info(f"Saving final status {job.status} for job {job_id}")
+                    self._save_job(job)
                     self._mark_job_list_dirty()  # Invalidate cache when status changes
 
                     # Clean up engine and tracking data
@@ -438,13 +470,11 @@ class JobManager:
                         if job_id in self.engine_stop_times:
                             del self.engine_stop_times[job_id]
 
-                    import logging
-                    logging.info(f"Engine cleanup: job {job_id} finished with status {job.status}")
+                    logger.info(f"Engine cleanup: job {job_id} finished with status {job.status}")
                     return True, f"Job completed with status: {job.status}"
 
             except Exception as e:
-                import logging
-                logging.error(f"Error updating job from engine {job_id}: {e}")
+                logger.error(f"Error updating job from engine {job_id}: {e}")
 
                 # Try to clean up engine if it's stopped (best effort)
                 try:
@@ -452,12 +482,12 @@ class JobManager:
                         if job_id in self.engines:
                             engine = self.engines[job_id]
                             if not engine.is_running():
-                                logging.info(f"Cleaning up stopped engine for job {job_id} after exception")
+                                logger.info(f"Cleaning up stopped engine for job {job_id} after exception")
                                 del self.engines[job_id]
                                 if job_id in self.last_progress_save:
                                     del self.last_progress_save[job_id]
                 except Exception as cleanup_error:
-                    logging.error(f"Failed to cleanup engine after exception: {cleanup_error}")
+                    logger.error(f"Failed to cleanup engine after exception: {cleanup_error}")
 
                 return False, str(e)
 
@@ -478,37 +508,36 @@ class JobManager:
             cleaned_count = 0
 
             with self._engines_lock:
-                # Find engines to clean up
+                # Record stop times for engines that exited since the last
+                # call; engines already removed (or replaced by a restart)
+                # are skipped
+                while True:
+                    try:
+                        job_id, engine, stop_time = self._finished_engines.get_nowait()
+                    except queue.Empty:
+                        break
+                    if self.engines.get(job_id) is engine:
+                        self.engine_stop_times.setdefault(job_id, stop_time)
+
+                # Only stopped engines have a stop time, so this doesn't
+                # touch running engines
                 job_ids_to_cleanup = []
-                
-                for job_id in list(self.engines.keys()):
-                    engine = self.engines[job_id]
-                    
-                    # Check if engine is stopped
-                    if not engine.is_running():
-                        # Check stop time
-                        if job_id in self.engine_stop_times:
-                            stop_time = self.engine_stop_times[job_id]
-                            time_since_stop = current_time - stop_time
-                            
-                            if time_since_stop > max_retention_time:
-                                job_ids_to_cleanup.append(job_id)
-                                logging.info(f"Cleaning up stopped engine for job {job_id} (stopped {time_since_stop:.0f}s ago)")
-                        else:
-                            # No stop time recorded, mark it now
-                            self.engine_stop_times[job_id] = current_time
-                
+                for job_id, stop_time in self.engine_stop_times.items():
+                    time_since_stop = current_time - stop_time
+                    if time_since_stop > max_retention_time:
+                        job_ids_to_cleanup.append(job_id)
+                        logger.info(f"Cleaning up stopped engine for job {job_id} (stopped {time_since_stop:.0f}s ago)")
+
                 # Clean up identified engines
                 for job_id in job_ids_to_cleanup:
-                    del self.engines[job_id]
-                    if job_id in self.engine_stop_times:
-                        del self.engine_stop_times[job_id]
+                    self.engines.pop(job_id, None)
+                    del self.engine_stop_times[job_id]
                     if job_id in self.last_progress_save:
                         del self.last_progress_save[job_id]
                     cleaned_count += 1
-            
+
             if cleaned_count > 0:
-                logging.info(f"Cleaned up {cleaned_count} stopped engine(s)")
+                logger.info(f"Cleaned up {cleaned_count} stopped engine(s)")
             
             return cleaned_count
 
@@ -526,24 +555,29 @@ class JobManager:
         """
         current_time = time.time()
         current_percent = progress.get('percent', 0)
+        current_bytes = progress.get('bytes_transferred', 0)
 
         with self._engines_lock:
             # First save for this job
             if job_id not in self.last_progress_save:
                 return True
 
-            last_time, last_percent = self.last_progress_save[job_id]
+            last_time, last_percent, last_bytes = self.last_progress_save[job_id]
 
-        # Save if 2+ seconds elapsed OR 1%+ progress change
-        time_elapsed = (current_time - last_time) >= 2.0
-        significant_change = abs(current_percent - last_percent) >= 1
+        if abs(current_percent - last_percent) >= self.PROGRESS_SAVE_PERCENT:
+            return True
 
-        return time_elapsed or significant_change
+        # Unchanged progress (a stalled or retrying transfer) is never rewritten
+        changed = current_percent != last_percent or current_bytes != last_bytes
+        return changed and (current_time - last_time) >= self.PROGRESS_SAVE_INTERVAL
     
     def list_jobs(self) -> List[Dict]:
         """
         List all jobs with current status
-        Uses 1-second cache with dirty checking (Task 7.1)
+        Uses a short TTL cache (JOB_LIST_CACHE_TTL) with dirty checking (Task 7.1).
+        The cache is also keyed on the jobs file signature, so writes that bypass
+        the manager are picked up without waiting for the TTL. Running jobs
+        get live engine progress even on a cache hit.
 
         Returns:
             List of job info dictionaries
@@ -551,32 +585,187 @@ class JobManager:
         # TASK 7.4: Use read lock for listing jobs (allows concurrent reads)
         with self._rwlock.read_lock():
             current_time = time.time()
+            storage_key = self._storage_signature()
 
-            # Check if cache is valid (less than 1 second old and not dirty)
+            # Check if cache is valid (younger than the TTL, not dirty, file unchanged)
             if (not self._job_list_dirty and
                 self._job_list_cache is not None and
-                (current_time - self._job_list_cache_time) < 1.0):
-                return self._job_list_cache
+                storage_key == self._job_list_cache_key and
+                (current_time - self._job_list_cache_time) < self.JOB_LIST_CACHE_TTL):
+                return self._with_live_progress(self._job_list_cache)
 
-            # Cache miss or expired - rebuild cache
-            jobs = self.storage.load_jobs()
-            result = []
-
-            for job in jobs:
-                job_info = self.get_job_status(job.id)
-                if job_info:
-                    result.append(job_info)
+            # Cache miss or expired - rebuild from the cached jobs
+            result = [self._job_info(job) for job in self._jobs().values()]
 
             # Update cache
             self._job_list_cache = result
             self._job_list_cache_time = current_time
+            self._job_list_cache_key = storage_key
             self._job_list_dirty = False
 
             return result
 
+    def _with_live_progress(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Overlay live engine progress on cached job info
+
+        Args:
+            jobs: Job info dicts from the list_jobs() cache
+
+        Returns:
+            The same list if no engine is running, otherwise a new list with
+            copies of the running jobs' dicts carrying current progress
+        """
+        with self._engines_lock:
+            live = {
+                job_id: engine.get_progress()
+                for job_id, engine in self.engines.items()
+                if engine.is_running()
+            }
+
+        if not live:
+            return jobs
+
+        return [
+            dict(info, progress=live[info['id']]) if info['id'] in live else info
+            for info in jobs
+        ]
+
+    def _storage_signature(self) -> Optional[tuple]:
+        """
+        Identify the jobs file's current contents without reading it
+
+        Returns:
+            (path, inode, mtime_ns, size), or None if the file doesn't exist.
+            Writes replace the file, so the inode helps tell apart two
+            writes landing within one mtime tick.
+        """
+        path = self.storage.storage_path
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _jobs(self) -> Dict[str, Job]:
+        """
+        All jobs by ID, from memory
+
+        Storage is only read again once the jobs file changes, so polling
+        get_job_status() and list_jobs() doesn't reparse it every call.
+        Jobs saved by this manager are written through to the cache ahead
+        of their queued write. The returned jobs are shared; use
+        _get_job() for a copy to modify.
+
+        Returns:
+            Dict of job ID -> Job, in storage order
+        """
+        signature = self._storage_signature()
+        cached = self._job_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        jobs = {job.id: job for job in self.storage.load_jobs()}
+        self._job_cache = (signature, jobs)
+        return jobs
+
+    def _get_job(self, job_id: str) -> Optional[Job]:
+        """
+        Get a copy of a job to modify and pass to _save_job()
+
+        Args:
+            job_id: ID of job to get
+
+        Returns:
+            Job, or None if not found
+        """
+        job = self._jobs().get(job_id)
+        return Job.from_dict(job.to_dict()) if job else None
+
+    def _save_job(self, job: Job) -> bool:
+        """
+        Update a job in storage and in the job cache
+
+        The job must not be modified afterwards; get a new copy instead.
+
+        Args:
+            job: Job from _get_job() with its changes applied
+
+        Returns:
+            True if storage accepted the update
+        """
+        if not self.storage.update_job(job):
+            return False
+        self._cache_job(job)
+        return True
+
+    def _cache_job(self, job: Job) -> None:
+        """Put a job just written to storage into the job cache (write lock held)"""
+        self._jobs()[job.id] = job
+
+    def list_jobs_by_status(self, status: str) -> List[Dict]:
+        """
+        List jobs with a given status
+
+        Only builds info for the matching cached jobs, so callers that need
+        a subset (startup crash recovery) don't pay for the full
+        list_jobs() rebuild.
+
+        Args:
+            status: Job status to match (e.g. 'running')
+
+        Returns:
+            List of job info dictionaries
+        """
+        with self._rwlock.read_lock():
+            return [self._job_info(job) for job in self._jobs().values() if job.status == status]
+
     def _mark_job_list_dirty(self):
         """Mark job list cache as dirty (needs refresh)"""
         self._job_list_dirty = True
+
+    def invalidate_job_list_cache(self):
+        """
+        Force the next list_jobs() and job lookups to reload from storage
+
+        Use after modifying jobs through self.storage directly, since those
+        writes bypass the manager's own cache invalidation.
+        """
+        self._job_cache = None
+        self._mark_job_list_dirty()
+
+    def pause_interrupted_jobs(self, job_ids: List[str]) -> int:
+        """
+        Pause jobs left "running" by a crash or restart
+
+        Runs under the write lock, and waits for queued storage writes
+        before and after the bulk update: the update rewrites the whole
+        jobs file from what it reads, so a create or start saved just
+        before it must already be on disk, and reads afterwards must see
+        the paused jobs.
+
+        Args:
+            job_ids: IDs of the interrupted jobs; jobs with a running
+                engine or no longer running are skipped
+
+        Returns:
+            Number of jobs paused
+        """
+        with self._rwlock.write_lock():
+            with self._engines_lock:
+                job_ids = [
+                    job_id for job_id in job_ids
+                    if not (job_id in self.engines and self.engines[job_id].is_running())
+                ]
+            if not job_ids:
+                return 0
+
+            JobStorage.flush_writes()
+            paused = self.storage.bulk_update_status(job_ids, Job.STATUS_PAUSED, from_status=Job.STATUS_RUNNING)
+            if paused:
+                JobStorage.flush_writes()
+                self.invalidate_job_list_cache()
+            return paused
     
     def delete_job(self, job_id: str) -> Tuple[bool, str]:
         """
@@ -598,6 +787,8 @@ class JobManager:
 
                 # Delete from storage
                 if self.storage.delete_job(job_id):
+                    self._jobs().pop(job_id, None)
+
                     # Clean up from engines dict if present
                     with self._engines_lock:
                         if job_id in self.engines:
@@ -5,59 +5,24 @@ import asyncio
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Tuple
-import re
+from typing import Dict, List, Tuple
 
 from core.log_repository import LogRepository
 from core.paths import get_logs_dir, get_db_path
 from core.database import initialize_database
 from core.job_manager import JobManager
+from utils.log_reader import list_log_files, parse_log_level, find_timestamp, parse_log_timestamp
 
 logger = logging.getLogger(__name__)
 
 
-def parse_log_level(line: str) -> str:
-    """Extract log level from log line"""
-    level_pattern = r'\b(ERROR|FAIL|FAILED|WARN|WARNING|INFO|DEBUG|SUCCESS|COMPLETED)\b'
-    match = re.search(level_pattern, line, re.IGNORECASE)
-
-    if match:
-        level = match.group(1).upper()
-        if level in ['WARN', 'WARNING']:
-            return 'WARNING'
-        elif level in ['FAIL', 'FAILED']:
-            return 'ERROR'
-        elif level in ['SUCCESS', 'COMPLETED']:
-            return 'INFO'
-        return level
-
-    if re.search(r'\b(error|fail|exception|critical)\b', line, re.IGNORECASE):
-        return 'ERROR'
-
-    return 'INFO'
-
-
 def parse_timestamp(line: str) -> datetime:
     """Extract and parse timestamp from log line"""
-    timestamp_patterns = [
-        r'\[(\d{4}[-/]\d{2}[-/]\d{2}\s+\d{2}:\d{2}:\d{2})\]',
-        r'^(\d{4}[-/]\d{2}[-/]\d{2}\s+\d{2}:\d{2}:\d{2})',
-    ]
-
-    for pattern in timestamp_patterns:
-        match = re.search(pattern, line)
-        if match:
-            timestamp_str = match.group(1)
-            try:
-                if '/' in timestamp_str:
-                    return datetime.strptime(timestamp_str, '%Y/%m/%d %H:%M:%S')
-                else:
-                    return datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-            except:
-                pass
+    timestamp_str = find_timestamp(line)
+    dt = parse_log_timestamp(timestamp_str) if timestamp_str else None
 
     # Fallback to current time if no timestamp found
-    return datetime.now()
+    return dt or datetime.now()
 
 
 class LogIndexer:
@@ -77,6 +42,11 @@ class LogIndexer:
         self.running = False
         self.task = None
 
+        # (mtime, size) of each log file when it was last fully indexed;
+        # files that still match are skipped without opening them or
+        # reading their checkpoint
+        self._indexed_stats: Dict[str, Tuple[float, int]] = {}
+
         # Initialize database on startup
         initialize_database(self.db_path)
         logger.info(f"LogIndexer initialized with {interval}s interval")
@@ -118,10 +88,18 @@ class LogIndexer:
 
     async def _index_all_logs(self):
         """Index all log files in the logs directory"""
-        if not self.logs_dir.exists():
-            return
-
-        log_files = list(self.logs_dir.glob('*.log'))
+        indexed_stats = {}
+        log_files = []
+        for log_file in list_log_files(self.logs_dir):
+            file_path = str(log_file.path)
+            stat = (log_file.mtime, log_file.size)
+            if self._indexed_stats.get(file_path) == stat:
+                indexed_stats[file_path] = stat
+            else:
+                log_files.append((log_file.path, stat))
+
+        # Files no longer listed are dropped from the memo
+        self._indexed_stats = indexed_stats
         if not log_files:
             return
 
@@ -133,14 +111,21 @@ class LogIndexer:
         except:
             job_id_to_name = {}
 
-        for log_file in log_files:
+        for log_file, stat in log_files:
             try:
-                await self._index_log_file(log_file, job_id_to_name)
+                if await self._index_log_file(log_file, job_id_to_name):
+                    self._indexed_stats[str(log_file)] = stat
             except Exception as e:
                 logger.error(f"Error indexing {log_file}: {e}")
 
-    async def _index_log_file(self, log_file: Path, job_id_to_name: dict):
-        """Index a single log file"""
+    async def _index_log_file(self, log_file: Path, job_id_to_name: dict) -> bool:
+        """
+        Index a single log file
+
+        Returns:
+            True if every complete line has been indexed, False if reading
+            or inserting failed and the file should be retried
+        """
         file_path = str(log_file)
 
         # Extract job ID from filename (rsync_<job_id>.log or rclone_<job_id>.log)
@@ -156,53 +141,69 @@ class LogIndexer:
         else:
             last_position, last_line_number = 0, 0
 
-        # Read new lines from file
+        # Stream new lines from file; memory stays bounded by the insert
+        # batch size instead of the amount of unindexed log
         try:
-            with open(log_file, 'r') as f:
+            with open(log_file, 'rb', buffering=1 << 20) as f:
                 # Seek to last position
                 f.seek(last_position)
 
-                new_lines = f.readlines()
-                if not new_lines:
-                    return
-
-                # Parse and batch insert
-                entries = []
-                current_line_number = last_line_number
-
-                for line in new_lines:
-                    if not line.strip():
-                        continue
-
-                    current_line_number += 1
-                    timestamp = parse_timestamp(line)
-                    level = parse_log_level(line)
-                    message = line.strip()
-
-                    entries.append((
-                        job_id,
-                        job_name,
-                        timestamp,
-                        level,
-                        message,
-                        file_path,
-                        current_line_number
-                    ))
-
-                    # Batch insert every 100 entries
-                    if len(entries) >= 100:
-                        self.repository.insert_batch(entries)
-                        entries = []
-
-                # Insert remaining entries
-                if entries:
-                    self.repository.insert_batch(entries)
+                progress = {'position': last_position, 'line_number': last_line_number, 'complete': False}
+                entries = self._read_entries(f, job_id, job_name, file_path, progress)
+
+                # Insert all new lines in one transaction (one commit per file)
+                inserted = self.repository.insert_batch(entries)
+
+                # Don't advance past lines whose insert was rolled back, and
+                # retry if the insert gave up before reading every line
+                new_lines = progress['line_number'] - last_line_number
+                if inserted != new_lines or not progress['complete']:
+                    return False
+
+                if progress['position'] == last_position:
+                    return True
 
                 # Save checkpoint
-                new_position = f.tell()
-                self.repository.save_checkpoint(file_path, new_position, current_line_number)
+                if not self.repository.save_checkpoint(file_path, progress['position'], progress['line_number']):
+                    return False
 
-                logger.debug(f"Indexed {current_line_number - last_line_number} new lines from {log_file.name}")
+                logger.debug(f"Indexed {new_lines} new lines from {log_file.name}")
+                return True
 
         except Exception as e:
             logger.error(f"Error reading log file {log_file}: {e}")
+            return False
+
+    @staticmethod
+    def _read_entries(f, job_id: str, job_name: str, file_path: str, progress: dict):
+        """
+        Yield log_entries rows for the complete lines remaining in a log file
+
+        Args:
+            f: Log file opened in binary mode, positioned at the checkpoint
+            progress: Updated with the byte 'position' and 'line_number' after
+                each consumed line, and 'complete' once every complete line
+                has been read. A trailing line without a newline may still
+                be being written, so it is left for the next run.
+        """
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break
+            progress['position'] += len(raw)
+
+            line = raw.decode('utf-8', errors='replace').strip()
+            if not line:
+                continue
+
+            progress['line_number'] += 1
+            yield (
+                job_id,
+                job_name,
+                parse_timestamp(line),
+                parse_log_level(line),
+                line,
+                file_path,
+                progress['line_number']
+            )
+
+        progress['complete'] = True
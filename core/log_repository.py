@@ -1,10 +1,13 @@
 """
 Data access layer for log operations
 """
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 import logging
-from core.database import get_db
+from core.database import (
+    FTS_MIN_TERM_LENGTH, INSERT_LOG_SQL, bulk_insert_log_entries, get_db, has_like_wildcards,
+    has_log_search_index, like_pattern
+)
 from core.paths import get_db_path
 
 logger = logging.getLogger(__name__)
@@ -13,8 +16,13 @@ logger = logging.getLogger(__name__)
 class LogRepository:
     """Repository for log database operations"""
 
+    # Keys of the dicts returned by search_logs(), in SELECT column order
+    _SEARCH_COLUMNS = ('job_id', 'job_name', 'timestamp', 'level', 'message', 'line_number', 'file_path')
+
     def __init__(self):
         self.db_path = str(get_db_path())
+        # Set once the full-text index is seen (it is created by initialize_database)
+        self._has_search_index = False
 
     def search_logs(
         self,
@@ -32,7 +40,8 @@ class LogRepository:
             job_id: Filter by job ID
             job_name: Filter by job name
             level: Filter by log level (ERROR, WARNING, INFO, DEBUG)
-            search_term: Search in message text
+            search_term: Case-insensitive substring of the message text
+                (uses the full-text index for terms of 3+ characters)
             limit: Maximum number of results
             offset: Pagination offset
 
@@ -63,31 +72,37 @@ class LogRepository:
                     params.append(level)
 
                 if search_term:
-                    query += " AND message LIKE ?"
-                    params.append(f"%{search_term}%")
+                    # FTS5 only serves a plain two-argument LIKE from the
+                    # index, so terms that need escaping scan log_entries
+                    if (len(search_term) >= FTS_MIN_TERM_LENGTH and not has_like_wildcards(search_term)
+                            and self._search_index_ready(conn)):
+                        query += " AND id IN (SELECT rowid FROM log_entries_fts WHERE message LIKE ?)"
+                        params.append(f"%{search_term}%")
+                    else:
+                        query += " AND message LIKE ? ESCAPE '\\'"
+                        params.append(like_pattern(search_term))
 
                 query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
                 params.extend([limit, offset])
 
-                cursor = conn.execute(query, params)
-                rows = cursor.fetchall()
+                # Plain tuples zipped with the column names, rather than
+                # sqlite3.Row objects looked up by name per column
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                rows = cursor.execute(query, params).fetchall()
 
-                return [
-                    {
-                        'job_id': row['job_id'],
-                        'job_name': row['job_name'],
-                        'timestamp': row['timestamp'],
-                        'level': row['level'],
-                        'message': row['message'],
-                        'line_number': row['line_number'],
-                        'file_path': row['file_path']
-                    }
-                    for row in rows
-                ]
+                columns = self._SEARCH_COLUMNS
+                return [dict(zip(columns, row)) for row in rows]
         except Exception as e:
             logger.error(f"Error searching logs: {e}")
             return []
 
+    def _search_index_ready(self, conn) -> bool:
+        """Check (and remember) whether message search can use the full-text index"""
+        if not self._has_search_index:
+            self._has_search_index = has_log_search_index(conn)
+        return self._has_search_index
+
     def insert_log_entry(
         self,
         job_id: str,
@@ -105,13 +120,9 @@ class LogRepository:
             True if successful, False otherwise
         """
         try:
-            with get_db(self.db_path) as conn:
+            with get_db(self.db_path, write=True) as conn:
                 conn.execute(
-                    """
-                    INSERT INTO log_entries
-                    (job_id, job_name, timestamp, level, message, file_path, line_number)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
+                    INSERT_LOG_SQL,
                     (job_id, job_name, timestamp, level, message, file_path, line_number)
                 )
             return True
@@ -119,31 +130,21 @@ class LogRepository:
             logger.error(f"Error inserting log entry: {e}")
             return False
 
-    def insert_batch(self, entries: List[Tuple]) -> int:
+    def insert_batch(self, entries: Iterable[Tuple]) -> int:
         """
         Insert multiple log entries in a single transaction.
 
         Args:
-            entries: List of tuples (job_id, job_name, timestamp, level, message, file_path, line_number)
+            entries: Iterable of tuples (job_id, job_name, timestamp, level, message, file_path, line_number)
 
         Returns:
             Number of entries inserted
         """
-        if not entries:
-            return 0
-
         try:
-            with get_db(self.db_path) as conn:
-                conn.executemany(
-                    """
-                    INSERT INTO log_entries
-                    (job_id, job_name, timestamp, level, message, file_path, line_number)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    entries
-                )
-            logger.info(f"Inserted {len(entries)} log entries")
-            return len(entries)
+            inserted = bulk_insert_log_entries(self.db_path, entries)
+            if inserted:
+                logger.info(f"Inserted {inserted} log entries")
+            return inserted
         except Exception as e:
             logger.error(f"Error batch inserting logs: {e}")
             return 0
@@ -199,7 +200,7 @@ class LogRepository:
             True if successful, False otherwise
         """
         try:
-            with get_db(self.db_path) as conn:
+            with get_db(self.db_path, write=True) as conn:
                 conn.execute(
                     """
                     INSERT OR REPLACE INTO indexer_checkpoints
@@ -1,12 +1,21 @@
 """
 Network Monitor - Background monitoring for network connectivity
 """
+import socket
 import threading
 import time
 import subprocess
-from pathlib import Path
 from datetime import datetime
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Tuple
+
+from core.paths import get_logs_dir
+from core.settings import get_settings
+
+# Default connectivity check targets: Google DNS and Cloudflare DNS
+DEFAULT_TARGETS = ['8.8.8.8', '1.1.1.1']
+
+# Seconds a check_network_online() result is reused before probing again
+NETWORK_CHECK_CACHE_TTL = 30
 
 
 class NetworkMonitor:
@@ -27,7 +36,7 @@ class NetworkMonitor:
             failure_threshold: Consecutive failures before declaring network down (default: 3)
         """
         self.check_interval = check_interval
-        self.targets = targets or ['8.8.8.8', '1.1.1.1']  # Google DNS and Cloudflare DNS
+        self.targets = targets or list(DEFAULT_TARGETS)
         self.failure_threshold = failure_threshold
 
         self.running = False
@@ -40,8 +49,7 @@ class NetworkMonitor:
         self.on_network_up_callbacks: List[Callable] = []
 
         # Logging
-        self.log_file = Path.home() / 'backup-manager' / 'logs' / 'network_monitor.log'
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.log_file = get_logs_dir() / 'network_monitor.log'
 
     def start(self):
         """Start the network monitor"""
@@ -141,14 +149,12 @@ class NetworkMonitor:
         Returns:
             True if at least one target is reachable
         """
-        import socket
-
         for target in self.targets:
             try:
                 # Try to connect to DNS port with 2 second timeout
                 # This is more portable than ping and doesn't require root
-                socket.create_connection((target, 53), timeout=2)
-                return True
+                with socket.create_connection((target, 53), timeout=2):
+                    return True
 
             except (socket.timeout, socket.error, OSError) as e:
                 self.log(f"Cannot reach {target}: {e}")
@@ -201,3 +207,133 @@ def get_network_monitor() -> NetworkMonitor:
     if _network_monitor_instance is None:
         _network_monitor_instance = NetworkMonitor()
     return _network_monitor_instance
+
+
+# Module-level cache for check_network_online(): (checked_at, is_online)
+# Also updated by the background probe started with start_network_probe()
+_network_online_cache: Optional[Tuple[float, bool]] = None
+
+# Background probe thread and its stop signal
+_network_probe_thread: Optional[threading.Thread] = None
+_network_probe_stop = threading.Event()
+
+
+def _probe_targets(timeout: float) -> bool:
+    """
+    Try to open a TCP connection to port 53 on each default target
+
+    Args:
+        timeout: Seconds to wait for each target
+
+    Returns:
+        True if at least one target accepted a connection
+    """
+    for target in DEFAULT_TARGETS:
+        try:
+            with socket.create_connection((target, 53), timeout=timeout):
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def check_network_online(timeout: float = 1.0) -> bool:
+    """
+    Check whether the network is reachable, caching the result
+
+    Probes port 53 on the default DNS targets. The result is reused for
+    NETWORK_CHECK_CACHE_TTL seconds so status displays don't open a new
+    connection (and potentially stall for the timeout) on every refresh.
+
+    Args:
+        timeout: Seconds to wait for each target
+
+    Returns:
+        True if at least one target accepted a connection
+    """
+    global _network_online_cache
+
+    now = time.monotonic()
+    if _network_online_cache is not None:
+        checked_at, is_online = _network_online_cache
+        if now - checked_at < NETWORK_CHECK_CACHE_TTL:
+            return is_online
+
+    is_online = _probe_targets(timeout)
+    _network_online_cache = (now, is_online)
+    return is_online
+
+
+def get_network_online() -> bool:
+    """
+    Return the last known network state without probing
+
+    Never blocks; request handlers should use this while the background
+    probe (start_network_probe) keeps the state fresh.
+
+    Returns:
+        Last probe result, or True if no probe has completed yet
+    """
+    cached = _network_online_cache
+    return cached[1] if cached is not None else True
+
+
+def _network_probe_interval() -> float:
+    """Seconds between background probes, from the network_check_interval setting"""
+    try:
+        return max(5, float(get_settings().get('network_check_interval', NETWORK_CHECK_CACHE_TTL)))
+    except (TypeError, ValueError):
+        return NETWORK_CHECK_CACHE_TTL
+
+
+def _network_probe_loop(interval: Optional[float], timeout: float):
+    """Probe connectivity every interval seconds until stopped"""
+    global _network_online_cache
+
+    while not _network_probe_stop.is_set():
+        _network_online_cache = (time.monotonic(), _probe_targets(timeout))
+        _network_probe_stop.wait(interval if interval is not None else _network_probe_interval())
+
+
+def start_network_probe(interval: Optional[float] = None, timeout: float = 1.0) -> bool:
+    """
+    Start the background connectivity probe (once per process)
+
+    Args:
+        interval: Seconds between probes (default: the network_check_interval
+                  setting, re-read after every probe so changes apply live)
+        timeout: Seconds to wait for each target
+
+    Returns:
+        True if started, False if already running
+    """
+    global _network_probe_thread
+
+    if _network_probe_thread is not None and _network_probe_thread.is_alive():
+        return False
+
+    _network_probe_stop.clear()
+    _network_probe_thread = threading.Thread(
+        target=_network_probe_loop,
+        args=(interval, timeout),
+        name='network-probe',
+        daemon=True
+    )
+    _network_probe_thread.start()
+    return True
+
+
+def stop_network_probe(timeout: float = 5.0):
+    """Stop the background connectivity probe if it is running"""
+    global _network_probe_thread
+
+    _network_probe_stop.set()
+    if _network_probe_thread is not None:
+        _network_probe_thread.join(timeout=timeout)
+        _network_probe_thread = None
+
+
+def clear_network_check_cache():
+    """Force the next check_network_online() call to probe again"""
+    global _network_online_cache
+    _network_online_cache = None
@@ -5,7 +5,37 @@ Provides a single source of truth for data directory location,
 ensuring Flask and core modules use the same paths.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory (once per process per path) and return it"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@lru_cache(maxsize=None)
+def _data_dir_for(data_dir_env: Optional[str], home: str) -> Path:
+    """Resolve the data directory for a given env override and home directory"""
+    if data_dir_env:
+        data_dir = Path(data_dir_env).expanduser().resolve()
+    else:
+        data_dir = Path(home) / 'backup-manager'
+    return _ensure_dir(data_dir)
+
+
+def clear_path_cache():
+    """
+    Forget resolved/created directories
+
+    Paths are resolved and created once per process; call this if a data
+    directory is removed while the app is running so it gets recreated.
+    """
+    _ensure_dir.cache_clear()
+    _data_dir_for.cache_clear()
 
 
 def get_data_dir() -> Path:
@@ -16,20 +46,13 @@ def get_data_dir() -> Path:
     1. BACKUP_MANAGER_DATA_DIR environment variable
     2. Default: ~/backup-manager
 
+    The result is cached per (override, home) pair, so hot paths don't
+    re-resolve and mkdir the directory on every call.
+
     Returns:
         Path object pointing to the data directory
     """
-    data_dir_env = os.environ.get('BACKUP_MANAGER_DATA_DIR')
-
-    if data_dir_env:
-        data_dir = Path(data_dir_env).expanduser().resolve()
-    else:
-        data_dir = Path.home() / 'backup-manager'
-
-    # Ensure directory exists
-    data_dir.mkdir(parents=True, exist_ok=True)
-
-    return data_dir
+    return _data_dir_for(os.environ.get('BACKUP_MANAGER_DATA_DIR'), str(Path.home()))
 
 
 def get_jobs_file() -> Path:
@@ -48,9 +71,7 @@ def get_logs_dir() -> Path:
 
     Creates the directory if it doesn't exist.
     """
-    logs_dir = get_data_dir() / 'logs'
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    return logs_dir
+    return _ensure_dir(get_data_dir() / 'logs')
 
 
 def get_db_path() -> Path:
@@ -59,6 +80,4 @@ def get_db_path() -> Path:
 
     Creates the data directory if it doesn't exist.
     """
-    data_dir = get_data_dir() / 'data'
-    data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir / 'logs.db'
+    return _ensure_dir(get_data_dir() / 'data') / 'logs.db'
@@ -6,6 +6,9 @@ from pathlib import Path
 from typing import Any, Dict
 from core.paths import get_settings_file
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class Settings:
     """Manages application settings with YAML persistence"""
@@ -42,7 +45,7 @@ class Settings:
         if self.settings_path.exists():
             try:
                 with open(self.settings_path, 'r') as f:
-                    settings = yaml.safe_load(f)
+                    settings = yaml.load(f, Loader=_YAML_LOADER)
                     if settings:
                         # Merge with defaults (in case new settings were added)
                         return {**self.DEFAULT_SETTINGS, **settings}
@@ -84,10 +87,24 @@ class Settings:
         self._settings[key] = value
         self._save()
 
+    def update(self, values: Dict[str, Any]):
+        """
+        Set several setting values and save once
+
+        Args:
+            values: Mapping of setting keys to values
+        """
+        self._settings.update(values)
+        self._save()
+
     def get_all(self) -> Dict[str, Any]:
         """Get all settings"""
         return self._settings.copy()
 
+    def reload(self):
+        """Re-read settings from disk, picking up edits made outside the app"""
+        self._settings = self._load()
+
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
         self._settings = self.DEFAULT_SETTINGS.copy()
@@ -104,3 +121,19 @@ def get_settings() -> Settings:
     if _settings_instance is None:
         _settings_instance = Settings()
     return _settings_instance
+
+
+def reload_settings() -> Settings:
+    """
+    Reload the global Settings singleton from disk
+
+    get_settings() keeps serving the in-memory copy, so hot paths such as
+    the dashboard poll never touch the file. Call this where fresh values
+    matter, e.g. when the Settings page is opened.
+
+    Returns:
+        The reloaded Settings singleton
+    """
+    settings = get_settings()
+    settings.reload()
+    return settings
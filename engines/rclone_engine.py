@@ -6,6 +6,7 @@ import threading
 import time
 import re
 import os
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
@@ -24,6 +25,11 @@ class RcloneEngine:
         'timeout',
         'too many open files'
     ]
+    # All patterns in one case-insensitive pass, so stderr lines needn't be lowercased
+    NETWORK_ERROR_RE = re.compile('|'.join(map(re.escape, NETWORK_ERROR_PATTERNS)), re.IGNORECASE)
+
+    # Trailing stderr lines kept for error pattern matching
+    ERROR_CONTEXT_LINES = 50
 
     def __init__(self, source, dest, job_id, bandwidth_limit=None, max_retries=10,
                  verification_mode='fast', delete_source_after=False, deletion_mode='verify_then_delete',
@@ -63,6 +69,8 @@ class RcloneEngine:
             }
         }
         self._progress_lock = threading.Lock()  # Protect progress dict access
+        self._exit_callbacks = []  # Called once the monitor thread finishes
+        self._exited = False
 
         # Use unified data directory for logs
         from core.paths import get_logs_dir
@@ -135,7 +143,7 @@ class RcloneEngine:
                 self.progress['status'] = 'running'
 
             # Start monitoring thread
-            self.thread = threading.Thread(target=self._monitor_output, daemon=True)
+            self.thread = threading.Thread(target=self._run_monitor, daemon=True)
             self.thread.start()
 
             return True
@@ -180,6 +188,32 @@ class RcloneEngine:
                 self.running = False
             return True
 
+    def on_exit(self, callback):
+        """
+        Call callback() from the monitor thread once rclone has finished
+
+        Runs the callback immediately if the engine has already finished.
+        """
+        with self._progress_lock:
+            if not self._exited:
+                self._exit_callbacks.append(callback)
+                return
+        callback()
+
+    def _run_monitor(self):
+        """Monitor thread target: run _monitor_output(), then the exit callbacks"""
+        try:
+            self._monitor_output()
+        finally:
+            with self._progress_lock:
+                self._exited = True
+                callbacks, self._exit_callbacks = self._exit_callbacks, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    self.log(f"Error in exit callback: {e}")
+
     def is_running(self):
         """Check if rclone is currently running"""
         return self.running and self.process and self.process.poll() is None
@@ -191,7 +225,7 @@ class RcloneEngine:
 
     def _monitor_output(self):
         """Monitor rclone output in background thread with auto-retry"""
-        stderr_buffer = []
+        stderr_buffer = deque(maxlen=self.ERROR_CONTEXT_LINES)
 
         while self.running:
             try:
@@ -199,7 +233,7 @@ class RcloneEngine:
                 for line in self.process.stderr:
                     self.log(line.strip())
                     self._parse_progress(line)
-                    stderr_buffer.append(line.lower())  # Collect for error checking
+                    stderr_buffer.append(line)  # Collect for error checking
 
                 # Process finished
                 self.process.wait()
@@ -286,11 +320,8 @@ class RcloneEngine:
 
                 else:
                     # Check if error is network-related
-                    stderr_text = ''.join(stderr_buffer[-50:])  # Check last 50 lines
-                    is_network_error = any(
-                        pattern in stderr_text
-                        for pattern in self.NETWORK_ERROR_PATTERNS
-                    )
+                    # Check the recent stderr lines (they keep their newlines)
+                    is_network_error = self.NETWORK_ERROR_RE.search(''.join(stderr_buffer)) is not None
 
                     if is_network_error:
                         # Network error - attempt retry
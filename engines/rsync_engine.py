@@ -6,8 +6,42 @@ import threading
 import time
 import re
 import os
+import shutil
+from collections import deque
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
+
+# Module-level cache for the --append-verify probe (the rsync binary doesn't
+# change while the app runs, so one `rsync --help` serves every engine)
+_append_verify_support_cache: Optional[bool] = None
+
+# Module-level cache for the PATH lookup in is_rsync_installed()
+_rsync_installed_cache: Optional[bool] = None
+
+
+def clear_rsync_cache():
+    """Forget the cached rsync lookups (e.g. after installing or upgrading rsync)"""
+    global _append_verify_support_cache, _rsync_installed_cache
+    _append_verify_support_cache = None
+    _rsync_installed_cache = None
+
+
+def is_rsync_installed() -> bool:
+    """
+    Check if rsync is on PATH
+
+    The result is cached for the life of the process; call
+    clear_rsync_cache() to force a fresh check.
+
+    Returns:
+        True if an rsync executable was found
+    """
+    global _rsync_installed_cache
+
+    if _rsync_installed_cache is None:
+        _rsync_installed_cache = shutil.which('rsync') is not None
+    return _rsync_installed_cache
 
 
 class RsyncEngine:
@@ -27,6 +61,11 @@ class RsyncEngine:
         'broken pipe',
         'connection unexpectedly closed'
     ]
+    # All patterns in one case-insensitive pass, so output lines needn't be lowercased
+    NETWORK_ERROR_RE = re.compile('|'.join(map(re.escape, NETWORK_ERROR_PATTERNS)), re.IGNORECASE)
+
+    # Trailing output lines kept for error pattern matching
+    ERROR_CONTEXT_LINES = 50
 
     def __init__(self, source, dest, job_id, bandwidth_limit=None, max_retries=10,
                  verification_mode='fast', delete_source_after=False, deletion_mode='verify_then_delete',
@@ -66,6 +105,8 @@ class RsyncEngine:
             }
         }
         self._progress_lock = threading.Lock()  # Protect progress dict access
+        self._exit_callbacks = []  # Called once the monitor thread finishes
+        self._exited = False
 
         # Use unified data directory for logs
         from core.paths import get_logs_dir
@@ -133,7 +174,7 @@ class RsyncEngine:
                 self.progress['status'] = 'running'
 
             # Start monitoring thread
-            self.thread = threading.Thread(target=self._monitor_output, daemon=True)
+            self.thread = threading.Thread(target=self._run_monitor, daemon=True)
             self.thread.start()
 
             return True
@@ -178,6 +219,32 @@ class RsyncEngine:
                 self.running = False
             return True
 
+    def on_exit(self, callback):
+        """
+        Call callback() from the monitor thread once rsync has finished
+
+        Runs the callback immediately if the engine has already finished.
+        """
+        with self._progress_lock:
+            if not self._exited:
+                self._exit_callbacks.append(callback)
+                return
+        callback()
+
+    def _run_monitor(self):
+        """Monitor thread target: run _monitor_output(), then the exit callbacks"""
+        try:
+            self._monitor_output()
+        finally:
+            with self._progress_lock:
+                self._exited = True
+                callbacks, self._exit_callbacks = self._exit_callbacks, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    self.log(f"Error in exit callback: {e}")
+
     def is_running(self):
         """Check if rsync is currently running"""
         return self.running and self.process and self.process.poll() is None
@@ -189,7 +256,7 @@ class RsyncEngine:
 
     def _monitor_output(self):
         """Monitor rsync output in background thread with auto-retry"""
-        output_buffer = []  # Collect output for error pattern matching
+        output_buffer = deque(maxlen=self.ERROR_CONTEXT_LINES)  # Recent output for error pattern matching
 
         while self.running:
             try:
@@ -205,7 +272,7 @@ class RsyncEngine:
                         if current_line:
                             self.log(current_line)
                             self._parse_progress(current_line)
-                            output_buffer.append(current_line.lower())
+                            output_buffer.append(current_line)
                         current_line = ""
                     elif char == '\r':
                         # Carriage return - treat as line delimiter for progress updates
@@ -447,7 +514,7 @@ class RsyncEngine:
 
         Args:
             returncode: rsync exit code
-            output_buffer: list of output lines (lowercased)
+            output_buffer: recent output lines
 
         Returns:
             True if network error patterns detected
@@ -456,18 +523,24 @@ class RsyncEngine:
         if returncode not in [23]:
             return False
 
-        # Check last 50 lines for network error patterns
-        recent_output = ''.join(output_buffer[-50:])
-        return any(pattern in recent_output for pattern in self.NETWORK_ERROR_PATTERNS)
+        # Check the recent output lines for network error patterns
+        return self.NETWORK_ERROR_RE.search('\n'.join(output_buffer)) is not None
 
     def _check_append_verify_support(self):
         """
         Check if rsync supports --append-verify flag (requires version 3.0+).
         macOS typically ships with rsync 2.6.9 which doesn't support it.
 
+        The result is cached at module level; failed probes are not cached.
+
         Returns:
             True if --append-verify is supported
         """
+        global _append_verify_support_cache
+
+        if _append_verify_support_cache is not None:
+            return _append_verify_support_cache
+
         try:
             # Try running rsync with --help and check for append-verify
             result = subprocess.run(
@@ -476,11 +549,13 @@ class RsyncEngine:
                 text=True,
                 timeout=5
             )
-            return '--append-verify' in result.stdout or '--append-verify' in result.stderr
         except Exception:
             # If we can't determine, assume not supported (safe default)
             return False
 
+        _append_verify_support_cache = '--append-verify' in result.stdout or '--append-verify' in result.stderr
+        return _append_verify_support_cache
+
     def _verify_backup(self) -> bool:
         """
         Verify backup integrity before deletion (Phase 1 of verify_then_delete)
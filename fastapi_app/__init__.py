@@ -48,6 +48,23 @@ def generate_csrf_token():
 # Add to globals
 templates.env.globals['csrf_token'] = generate_csrf_token
 
+# Display filters and lookup tables shared by all templates
+from services.dashboard_service import format_bytes
+from fastapi_app import display
+templates.env.filters['format_bytes'] = format_bytes
+templates.env.filters['highlight'] = display.highlight
+templates.env.filters['format_mb'] = display.format_mb
+templates.env.filters['format_speed'] = display.format_speed
+templates.env.filters['format_eta'] = display.format_eta
+templates.env.globals['status_badge_classes'] = display.STATUS_BADGE_CLASSES
+templates.env.globals['status_dot_classes'] = display.STATUS_DOT_CLASSES
+templates.env.globals['status_text_classes'] = display.STATUS_TEXT_CLASSES
+templates.env.globals['default_status_dot_class'] = display.DEFAULT_STATUS_DOT_CLASS
+templates.env.globals['default_status_text_class'] = display.DEFAULT_STATUS_TEXT_CLASS
+templates.env.globals['start_buttons'] = display.START_BUTTONS
+templates.env.globals['log_level_styles'] = display.LOG_LEVEL_STYLES
+templates.env.globals['default_log_level_style'] = display.DEFAULT_LOG_LEVEL_STYLE
+
 # Note: get_flashed_messages needs to be passed per-request via template context
 # because it needs access to the session. It's implemented in router handlers.
 
@@ -63,6 +80,12 @@ def create_flash_getter(session):
         return [flash.get('message', '')]
     return get_flashed_messages
 
+# Helper for pages that poll for job updates
+def get_refresh_interval() -> int:
+    """Return the configured auto-refresh interval in seconds (at least 1)"""
+    from core.settings import get_settings
+    return max(1, int(get_settings().get('auto_refresh_interval', 2)))
+
 # Add custom request object wrapper for Flask compatibility
 class FlaskCompatRequest:
     """Wrapper to make Starlette Request compatible with Flask templates"""
@@ -131,24 +154,35 @@ async def websocket_route(websocket: WebSocket):
     await websocket_endpoint(websocket)
 
 
+async def _recover_jobs_on_startup():
+    """Pause jobs left "running" by a previous process, off the event loop"""
+    from services.dashboard_service import recover_jobs_left_running
+    import logging
+
+    try:
+        count, msg = await asyncio.to_thread(recover_jobs_left_running)
+    except Exception as e:
+        logging.error(f"Startup recovery failed: {e}")
+        return
+
+    if count:
+        logging.info(f"Startup recovery: {msg}")
+
+
 # Startup event: Start background monitoring task
 @app.on_event("startup")
 async def startup_event():
     """Start background tasks on app startup"""
     from fastapi_app.background import monitor_jobs_task, start_log_indexer
-    from services.dashboard_service import recover_interrupted_jobs
-    from services.job_service import get_jobs_list
+    from core.network_monitor import start_network_probe
 
     # Recover any jobs stuck in "running" state (zombie jobs from crashes/restarts)
-    all_jobs = get_jobs_list()
-    interrupted_job_ids = [j['id'] for j in all_jobs if j['status'] == 'running']
-    if interrupted_job_ids:
-        count, msg = recover_interrupted_jobs(interrupted_job_ids)
-        import logging
-        logging.info(f"Startup recovery: {msg}")
+    # before serving, so no request can create or start a job mid-recovery
+    await _recover_jobs_on_startup()
 
     asyncio.create_task(monitor_jobs_task())
     await start_log_indexer()
+    start_network_probe()
     import logging
     logging.info("FastAPI application started, background tasks initiated")
 
@@ -158,7 +192,9 @@ async def startup_event():
 async def shutdown_event():
     """Stop background tasks on app shutdown"""
     from fastapi_app.background import stop_log_indexer
+    from core.network_monitor import stop_network_probe
     await stop_log_indexer()
+    await asyncio.to_thread(stop_network_probe)
     import logging
     logging.info("FastAPI application shutting down, background tasks stopped")
 
@@ -176,12 +212,12 @@ async def health_check():
         - Background tasks status
         - Active jobs count
         - Engine count
+        - Network connectivity
         - Recent errors (if any)
     """
     import logging
     from datetime import datetime
     from core.job_manager import JobManager
-    from pathlib import Path
 
     health_status = {
         "status": "healthy",
@@ -243,7 +279,8 @@ async def health_check():
 
     # Check logs directory
     try:
-        logs_path = Path.home() / "backup-manager" / "logs"
+        from core.paths import get_data_dir
+        logs_path = get_data_dir() / "logs"
         logs_exist = logs_path.exists()
         health_status["components"]["logs"] = {
             "status": "healthy" if logs_exist else "degraded",
@@ -256,6 +293,21 @@ async def health_check():
             "error": str(e)
         }
 
+    # Check network connectivity (last result of the background probe)
+    try:
+        from core.network_monitor import get_network_online
+        network_online = get_network_online()
+        health_status["components"]["network"] = {
+            "status": "healthy" if network_online else "degraded",
+            "online": network_online
+        }
+    except Exception as e:
+        logging.error(f"Health check: Network error - {e}")
+        health_status["components"]["network"] = {
+            "status": "degraded",
+            "error": str(e)
+        }
+
     # Check error events statistics (Task 6.5)
     try:
         from core.error_repository import get_error_repository
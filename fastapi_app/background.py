@@ -6,7 +6,7 @@ from fastapi import WebSocket, WebSocketDisconnect
 from fastapi_app.websocket.manager import manager
 from core.job_manager import JobManager
 from core.log_indexer import LogIndexer
-from core.error_repository import get_error_repository
+from core import error_sink
 from models.error_event import ErrorEvent
 import asyncio
 
@@ -94,9 +94,9 @@ async def monitor_jobs_task():
                     # Update state tracking
                     previous_states[job_id] = current_status
 
-                # Broadcast all updates in a single batch
-                for update in updates_batch:
-                    await manager.broadcast(update)
+                # Broadcast all updates as a single batch message
+                if updates_batch:
+                    await manager.broadcast({'type': 'job_updates', 'updates': updates_batch})
 
                 # Sleep for 1 second before next check when jobs are running
                 await asyncio.sleep(1)
@@ -117,14 +117,12 @@ async def monitor_jobs_task():
 
             # Log error to database (Task 6.5)
             try:
-                error_repo = get_error_repository()
-                error_event = ErrorEvent.from_exception(
+                error_sink.enqueue_exception(
                     exception=e,
                     severity=ErrorEvent.SEVERITY_HIGH,
                     component=ErrorEvent.COMPONENT_BACKGROUND_MONITOR,
                     message='Background job monitoring encountered an error'
                 )
-                error_repo.log_error(error_event)
             except Exception as log_err:
                 logging.error(f"Failed to log error event: {log_err}")
 
@@ -168,14 +166,12 @@ async def websocket_endpoint(websocket: WebSocket):
 
         # Log error to database (Task 6.5)
         try:
-            error_repo = get_error_repository()
-            error_event = ErrorEvent.from_exception(
+            error_sink.enqueue_exception(
                 exception=e,
                 severity=ErrorEvent.SEVERITY_MEDIUM,
                 component=ErrorEvent.COMPONENT_WEBSOCKET,
                 message='WebSocket connection error'
             )
-            error_repo.log_error(error_event)
         except Exception as log_err:
             logging.error(f"Failed to log error event: {log_err}")
 
@@ -201,14 +197,12 @@ async def start_log_indexer():
 
         # Log error to database (Task 6.5)
         try:
-            error_repo = get_error_repository()
-            error_event = ErrorEvent.from_exception(
+            error_sink.enqueue_exception(
                 exception=e,
                 severity=ErrorEvent.SEVERITY_MEDIUM,
                 component='log_indexer',
                 message='Log indexer failed to start'
             )
-            error_repo.log_error(error_event)
         except Exception as log_err:
             logging.error(f"Failed to log error event: {log_err}")
 
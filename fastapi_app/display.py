@@ -0,0 +1,146 @@
+"""
+Display lookup tables and helpers shared by templates
+
+Registered as Jinja globals/filters in fastapi_app/__init__.py so templates
+can map a status to its classes with one dict lookup instead of an if/elif
+chain per job per render.
+"""
+import re
+from functools import lru_cache
+from typing import Optional, Pattern
+
+from markupsafe import Markup, escape
+
+# Job status -> pill badge classes (job cards, jobs list)
+STATUS_BADGE_CLASSES = {
+    'pending': 'bg-gray-200 text-gray-700',
+    'running': 'bg-blue-100 text-blue-700',
+    'paused': 'bg-yellow-100 text-yellow-700',
+    'completed': 'bg-green-100 text-green-700',
+    'failed': 'bg-red-100 text-red-700',
+}
+
+# Job status -> activity dot classes (dashboard recent activity)
+STATUS_DOT_CLASSES = {
+    'completed': 'bg-green-500',
+    'running': 'bg-blue-500 animate-pulse',
+    'failed': 'bg-red-500',
+    'paused': 'bg-yellow-500',
+}
+DEFAULT_STATUS_DOT_CLASS = 'bg-gray-400'
+
+# Job status -> status text colour (dashboard recent activity)
+STATUS_TEXT_CLASSES = {
+    'completed': 'text-green-600',
+    'running': 'text-blue-600',
+    'failed': 'text-red-600',
+    'paused': 'text-yellow-600',
+}
+DEFAULT_STATUS_TEXT_CLASS = 'text-gray-600'
+
+# Log level -> row/badge/text classes and icon (logs list)
+LOG_LEVEL_STYLES = {
+    'ERROR': {'row': 'border-l-2 border-red-500 bg-red-50', 'badge': 'text-red-700 font-bold',
+              'icon': '🔴', 'text': 'text-red-900'},
+    'WARNING': {'row': 'border-l-2 border-yellow-500 bg-yellow-50', 'badge': 'text-yellow-700 font-semibold',
+                'icon': '🟡', 'text': 'text-yellow-900'},
+    'INFO': {'row': '', 'badge': 'text-blue-600', 'icon': '🔵', 'text': 'text-gray-700'},
+    'DEBUG': {'row': '', 'badge': 'text-gray-500', 'icon': '⚪', 'text': 'text-gray-500'},
+}
+DEFAULT_LOG_LEVEL_STYLE = {'row': '', 'badge': '', 'icon': '', 'text': ''}
+
+# Startable job status -> (button title, aria-label verb) for the start button.
+# Statuses missing here get no start button (see Job.STARTABLE_STATUSES).
+START_BUTTONS = {
+    'pending': ('Start backup job', 'Start'),
+    'paused': ('Resume backup job', 'Resume'),
+    'failed': ('Retry backup job', 'Retry'),
+}
+
+
+_HIGHLIGHT_OPEN = '<mark class="bg-yellow-300 px-1 rounded">'
+_HIGHLIGHT_CLOSE = '</mark>'
+
+
+@lru_cache(maxsize=32)
+def search_pattern(term: str) -> Pattern:
+    """
+    Compile a case-insensitive literal search pattern (cached per term)
+
+    Args:
+        term: Search text as typed by the user
+
+    Returns:
+        Compiled regex matching the term anywhere, ignoring case
+    """
+    return re.compile(re.escape(term), re.IGNORECASE)
+
+
+def highlight(text: str, term: Optional[str]) -> Markup:
+    """
+    Escape text and wrap each case-insensitive match of term in <mark>
+
+    Args:
+        text: Raw text (e.g. a log line)
+        term: Search text, or None/empty for no highlighting
+
+    Returns:
+        Markup safe to render without further escaping
+    """
+    if not term:
+        return escape(text)
+
+    # Every piece is escaped or a fixed tag, so the pieces are joined as
+    # plain strings and wrapped once; Markup's % and join() re-check each
+    # piece and cost several times more on a 500-line page
+    parts = []
+    last = 0
+    for match in search_pattern(term).finditer(text):
+        parts.append(escape(text[last:match.start()]))
+        parts.append(_HIGHLIGHT_OPEN)
+        parts.append(escape(match.group()))
+        parts.append(_HIGHLIGHT_CLOSE)
+        last = match.end()
+    parts.append(escape(text[last:]))
+    return Markup(''.join(parts))
+
+
+def format_mb(num_bytes: float) -> float:
+    """
+    Convert a byte count to MB rounded to two decimals (progress rows)
+
+    Args:
+        num_bytes: Number of bytes
+
+    Returns:
+        Megabytes, e.g. 1.5
+    """
+    return round(num_bytes / (1 << 20), 2)
+
+
+def format_speed(speed_bytes: float) -> str:
+    """
+    Format a transfer rate as shown on job cards
+
+    Args:
+        speed_bytes: Bytes per second
+
+    Returns:
+        Rate in KB/s, e.g. "12.5 KB/s"
+    """
+    return f"{round(speed_bytes / (1 << 10), 2)} KB/s"
+
+
+def format_eta(eta_seconds: float) -> str:
+    """
+    Format a remaining-time estimate as shown on job cards
+
+    Args:
+        eta_seconds: Estimated seconds remaining (0 or less if unknown)
+
+    Returns:
+        Minutes, e.g. "2.0 min", or "calculating..." if unknown
+    """
+    if eta_seconds > 0:
+        return f"{round(eta_seconds / 60, 1)} min"
+    return 'calculating...'
@@ -1,6 +1,8 @@
 """
 Dashboard routes (FastAPI)
 """
+import asyncio
+
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from services.dashboard_service import (
@@ -10,10 +12,10 @@ from services.dashboard_service import (
     get_recent_activity,
     recover_interrupted_jobs
 )
-from core.job_manager import JobManager
+from services.job_service import get_jobs_list
 
 # Import FlaskCompatRequest, templates, and helpers from main app
-from fastapi_app import FlaskCompatRequest, templates, create_flash_getter
+from fastapi_app import FlaskCompatRequest, templates, create_flash_getter, get_refresh_interval
 
 router = APIRouter()
 
@@ -21,10 +23,13 @@ router = APIRouter()
 @router.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Dashboard homepage"""
-    # Get all dashboard data from service layer
-    data = get_dashboard_data()
+    # Get all dashboard data from service layer (storage reads stay off the event loop)
+    data = await asyncio.to_thread(get_dashboard_data)
     stats = data['stats']
 
+    # Active jobs panel polls at the user's configured refresh interval
+    refresh_interval = get_refresh_interval()
+
     # Check for crash recovery prompt
     show_recovery_prompt = request.session.get('show_recovery_prompt', False)
     interrupted_job_count = len(request.session.get('interrupted_jobs', []))
@@ -38,6 +43,7 @@ async def index(request: Request):
         'recent_jobs': data['recent_jobs'],
         'show_recovery_prompt': show_recovery_prompt,
         'interrupted_job_count': interrupted_job_count,
+        'refresh_interval': refresh_interval,
         'get_flashed_messages': create_flash_getter(request.session)
     })
 
@@ -46,8 +52,7 @@ async def index(request: Request):
 async def stats(request: Request):
     """Get dashboard stats (HTMX endpoint)"""
     # Get jobs and calculate stats via service layer
-    manager = JobManager()
-    jobs = manager.list_jobs()
+    jobs = get_jobs_list()
     dashboard_stats = get_dashboard_stats(jobs)
 
     return templates.TemplateResponse('partials/dashboard_stats.html', {
@@ -61,8 +66,7 @@ async def stats(request: Request):
 @router.get("/active-jobs", response_class=HTMLResponse)
 async def active_jobs_partial(request: Request):
     """Get active jobs list (HTMX endpoint)"""
-    manager = JobManager()
-    jobs = manager.list_jobs()
+    jobs = get_jobs_list()
 
     # Get active jobs via service layer
     active = get_active_jobs(jobs, limit=5)
@@ -76,11 +80,9 @@ async def active_jobs_partial(request: Request):
 @router.get("/recent-activity", response_class=HTMLResponse)
 async def recent_activity(request: Request):
     """Get recent activity (HTMX endpoint)"""
-    manager = JobManager()
-    jobs = manager.list_jobs()
-
-    # Get recent activity via service layer
-    recent = get_recent_activity(jobs, limit=10)
+    # Load and select in a worker thread so a slow jobs file read doesn't
+    # stall other requests and WebSocket pushes on the event loop
+    recent = await asyncio.to_thread(_load_recent_activity)
 
     return templates.TemplateResponse('partials/dashboard_recent_activity.html', {
         'request': FlaskCompatRequest(request),
@@ -88,6 +90,11 @@ async def recent_activity(request: Request):
     })
 
 
+def _load_recent_activity(limit: int = 10):
+    """Load the job list and return the most recently updated jobs"""
+    return get_recent_activity(get_jobs_list(), limit=limit)
+
+
 @router.post("/recover-jobs")
 async def recover_jobs(request: Request):
     """Recover interrupted jobs by marking them as paused"""
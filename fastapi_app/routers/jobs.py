@@ -6,6 +6,7 @@ from fastapi.responses import HTMLResponse
 from typing import Optional
 from services.job_service import (
     get_jobs_list,
+    get_job,
     create_job_from_form,
     start_job_operation,
     pause_job_operation,
@@ -13,11 +14,35 @@ from services.job_service import (
 )
 
 # Import FlaskCompatRequest, templates, and helpers from main app
-from fastapi_app import FlaskCompatRequest, templates, create_flash_getter
+from fastapi_app import FlaskCompatRequest, templates, create_flash_getter, get_refresh_interval
 
 router = APIRouter()
 
 
+def _is_card_request(request: Request, job_id: str) -> bool:
+    """True when an HTMX request targets the job's own card in the Jobs list"""
+    return request.headers.get('HX-Target') == f'job-{job_id}'
+
+
+def _card_response(request: Request, job_id: str, deleted: bool = False):
+    """
+    Render the updated job card and the flash message out-of-band
+
+    The card is left out (removing it from the page) once the job is
+    deleted or no longer running, since the Jobs list shows running jobs
+    only.
+    """
+    job = None if deleted else get_job(job_id)
+    if job and job['status'] != 'running':
+        job = None
+
+    return templates.TemplateResponse('partials/job_action_result.html', {
+        'request': FlaskCompatRequest(request),
+        'job': job,
+        'get_flashed_messages': create_flash_getter(request.session)
+    })
+
+
 @router.get("/", response_class=HTMLResponse)
 async def list_jobs(request: Request):
     """List running jobs only"""
@@ -36,6 +61,7 @@ async def list_jobs(request: Request):
     return templates.TemplateResponse('jobs.html', {
         'request': FlaskCompatRequest(request),
         'jobs': jobs,
+        'refresh_interval': get_refresh_interval(),
         'get_flashed_messages': create_flash_getter(request.session)
     })
 
@@ -185,18 +211,9 @@ async def start_job(request: Request, job_id: str):
         else:
             request.session['flash'] = {'message': message, 'category': 'error'}
 
-        # Check if this is a selective update request (hx-target is the specific job card)
-        hx_target = request.headers.get('HX-Target', '')
-        if hx_target and 'data-job-id' in hx_target:
-            # Return just the updated job card for selective update
-            all_jobs = get_jobs_list()
-            job = next((j for j in all_jobs if j['id'] == job_id), None)
-            if job:
-                return templates.TemplateResponse('partials/job_card.html', {
-                    'request': FlaskCompatRequest(request),
-                    'job': job,
-                    'get_flashed_messages': create_flash_getter(request.session)
-                })
+        # A card's own button only needs that card re-rendered, not the list
+        if _is_card_request(request, job_id):
+            return _card_response(request, job_id)
 
         # Return updated job list with flash messages (filter for running jobs)
         all_jobs = get_jobs_list()
@@ -230,18 +247,9 @@ async def pause_job(request: Request, job_id: str):
         else:
             request.session['flash'] = {'message': message, 'category': 'error'}
 
-        # Check if this is a selective update request (hx-target is the specific job card)
-        hx_target = request.headers.get('HX-Target', '')
-        if hx_target and 'data-job-id' in hx_target:
-            # Return just the updated job card for selective update
-            all_jobs = get_jobs_list()
-            job = next((j for j in all_jobs if j['id'] == job_id), None)
-            if job:
-                return templates.TemplateResponse('partials/job_card.html', {
-                    'request': FlaskCompatRequest(request),
-                    'job': job,
-                    'get_flashed_messages': create_flash_getter(request.session)
-                })
+        # A card's own button only needs that card re-rendered, not the list
+        if _is_card_request(request, job_id):
+            return _card_response(request, job_id)
 
         # Return updated job list with flash messages (filter for running jobs)
         all_jobs = get_jobs_list()
@@ -277,11 +285,9 @@ async def delete_job(request: Request, job_id: str):
         else:
             request.session['flash'] = {'message': message, 'category': 'error'}
 
-        # Check if this is a selective update request (for deletion, return empty to remove the card)
-        hx_target = request.headers.get('HX-Target', '')
-        if hx_target and 'data-job-id' in hx_target:
-            # Return empty content to remove the deleted job card
-            return HTMLResponse(content="", status_code=200 if success else 404)
+        # A card's own button only needs that card removed (or kept on failure)
+        if _is_card_request(request, job_id):
+            return _card_response(request, job_id, deleted=success)
 
         # Return updated job list with flash messages (filter for running jobs)
         all_jobs = get_jobs_list()
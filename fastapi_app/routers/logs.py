@@ -2,13 +2,14 @@
 Logs routes (FastAPI)
 """
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, StreamingResponse
 from core.job_manager import JobManager
 from core.log_repository import LogRepository
-import os
-from pathlib import Path
+from utils.log_reader import read_last_lines, tail_matching, tail_search, list_log_files, parse_log_level, find_timestamp, parse_log_timestamp
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import re
+from functools import lru_cache
 import logging
 
 # Import FlaskCompatRequest, templates, and helpers from main app
@@ -28,87 +29,94 @@ except Exception as e:
     logger.warning(f"LogRepository failed to initialize - falling back to file reading: {e}")
 
 
-def parse_log_level(line):
-    """Extract log level from log line"""
-    # Match common log level patterns: ERROR, WARN/WARNING, INFO, DEBUG
-    level_pattern = r'\b(ERROR|FAIL|FAILED|WARN|WARNING|INFO|DEBUG|SUCCESS|COMPLETED)\b'
-    match = re.search(level_pattern, line, re.IGNORECASE)
+def parse_timestamp(line):
+    """Extract and format timestamp from log line"""
+    timestamp_str = find_timestamp(line)
+    if timestamp_str is None:
+        return None
 
-    if match:
-        level = match.group(1).upper()
-        # Normalize variants
-        if level in ['WARN', 'WARNING']:
-            return 'WARNING'
-        elif level in ['FAIL', 'FAILED']:
-            return 'ERROR'
-        elif level in ['SUCCESS', 'COMPLETED']:
-            return 'INFO'
-        return level
+    dt = parse_log_timestamp(timestamp_str)
+    return dt.strftime('%Y-%m-%d %H:%M:%S') if dt else timestamp_str
 
-    # Heuristic: lines with "error", "fail", "exception" are likely errors
-    if re.search(r'\b(error|fail|exception|critical)\b', line, re.IGNORECASE):
-        return 'ERROR'
 
-    # Default to INFO for regular log lines
-    return 'INFO'
+def read_log_file(log_path, max_lines=500):
+    """Read last N lines from a log file efficiently"""
+    return read_last_lines(log_path, max_lines)
 
 
-def parse_timestamp(line):
-    """Extract and format timestamp from log line"""
-    # Match common timestamp formats:
-    # [2025-10-27 19:48:54]
-    # 2025-10-27 19:48:54
-    # [2025/10/27 19:48:54]
-    timestamp_patterns = [
-        r'\[(\d{4}[-/]\d{2}[-/]\d{2}\s+\d{2}:\d{2}:\d{2})\]',
-        r'^(\d{4}[-/]\d{2}[-/]\d{2}\s+\d{2}:\d{2}:\d{2})',
-    ]
-
-    for pattern in timestamp_patterns:
-        match = re.search(pattern, line)
-        if match:
-            timestamp_str = match.group(1)
-            try:
-                # Parse and reformat timestamp
-                if '/' in timestamp_str:
-                    dt = datetime.strptime(timestamp_str, '%Y/%m/%d %H:%M:%S')
-                else:
-                    dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                return dt.strftime('%Y-%m-%d %H:%M:%S')
-            except:
-                return timestamp_str
-
-    return None
+# Upper bound on bytes scanned per file when looking for lines that match
+# a level or search filter
+FILTER_SCAN_MAX_BYTES = 1024 * 1024
 
+# Log files read concurrently (and per early-exit batch) by get_all_logs()
+LOG_PARSE_WORKERS = 8
 
-def read_log_file(log_path, max_lines=500):
-    """Read last N lines from a log file efficiently"""
-    try:
-        # Check file size - skip very large files (>5MB) when reading all logs
-        file_size = os.path.getsize(log_path)
-        if file_size > 5 * 1024 * 1024:  # 5MB
-            return [f"[Log file too large ({file_size / 1024 / 1024:.1f}MB) - showing only last {max_lines} lines]"]
-
-        with open(log_path, 'r') as f:
-            lines = f.readlines()
-            return lines[-max_lines:] if len(lines) > max_lines else lines
-    except Exception as e:
-        return []
+# Lines per chunk when streaming an export download
+EXPORT_CHUNK_LINES = 500
+
+
+@lru_cache(maxsize=256)
+def parse_log_tail(log_path, mtime, size, max_lines=500, level=None, search=None):
+    """
+    Read and parse the last N lines of a log file
 
+    Memoized on (path, mtime, size): unchanged files are served from cache,
+    and any append changes the key so the file is re-read.
 
-def get_logs_from_database(job_filter=None, search_term=None, level_filter=None, max_lines=500):
+    With a level or search term, returns the last N lines that match
+    (scanning back at most FILTER_SCAN_MAX_BYTES) instead of filtering the
+    last N lines, so an error a few hundred lines back still shows up. A
+    search term is matched against the memory-mapped file bytes, so only
+    lines containing it are decoded, classified and timestamped.
+
+    Returns:
+        Tuple of (line, level, timestamp) tuples, oldest first
+    """
+    def level_matches(line):
+        return parse_log_level(line) == level
+
+    if search:
+        lines = tail_search(log_path, max_lines, search, level_matches if level else None,
+                            max_bytes=FILTER_SCAN_MAX_BYTES)
+    elif level:
+        lines = tail_matching(log_path, max_lines, level_matches, max_bytes=FILTER_SCAN_MAX_BYTES)
+    else:
+        lines = read_log_file(log_path, max_lines)
+
+    # Only trailing whitespace is dropped so indented lines (tracebacks,
+    # rsync file lists) keep their shape in exports
+    return tuple(
+        (line.rstrip(), parse_log_level(line), parse_timestamp(line))
+        for line in lines
+    )
+
+
+def get_logs_from_database(job_filter=None, search_term=None, level_filter=None, max_lines=500, jobs=None):
     """
     Get logs from database.
 
+    Args:
+        jobs: Job list used to resolve a job name filter to its ID, so the
+            query can use the (job_id, timestamp) index
+
     Returns list of log dicts or None if database unavailable.
     """
     if not USE_DATABASE or not log_repository:
         return None
 
+    job_id = job_name = None
+    if job_filter and job_filter != 'all':
+        job_ids = [job['id'] for job in jobs or () if job_filter in (job['id'], job['name'])]
+        if len(job_ids) == 1:
+            job_id = job_ids[0]
+        else:
+            job_name = job_filter
+
     try:
         # Search database
         results = log_repository.search_logs(
-            job_name=job_filter if job_filter and job_filter != 'all' else None,
+            job_id=job_id,
+            job_name=job_name,
             level=level_filter,
             search_term=search_term,
             limit=max_lines
@@ -135,25 +143,32 @@ def get_logs_from_database(job_filter=None, search_term=None, level_filter=None,
         return None
 
 
-def get_all_logs(logs_dir, job_filter=None, search_term=None, level_filter=None, max_lines=500):
-    """Get logs from all job log files (fallback when database unavailable)"""
-    logs_path = Path(logs_dir)
+def get_all_logs(logs_dir, job_filter=None, search_term=None, level_filter=None, max_lines=500, jobs=None):
+    """
+    Get logs from all job log files (fallback when database unavailable)
+
+    Files are read and parsed LOG_PARSE_WORKERS at a time in a thread pool,
+    so slow storage costs the slowest read per batch rather than the sum.
+
+    Args:
+        jobs: Job list already fetched by the caller, used to map job IDs
+            to names. Fetched from JobManager when omitted.
+    """
     all_logs = []
 
-    if not logs_path.exists():
+    # Get all log files, newest first
+    log_files = list_log_files(logs_dir)
+    if not log_files:
         return []
 
-    # Get all log files
-    log_files = sorted(logs_path.glob('*.log'), key=lambda x: x.stat().st_mtime, reverse=True)
-
-    # Get job manager to map job IDs to names
-    manager = JobManager()
-    jobs = manager.list_jobs()
+    # Map job IDs to names
+    if jobs is None:
+        jobs = JobManager().list_jobs()
     job_id_to_name = {job['id']: job['name'] for job in jobs}
 
-    line_number = 1
+    candidates = []
     for log_file in log_files:
-        log_filename = log_file.stem  # filename without extension (e.g., "rsync_<job_id>")
+        log_filename = log_file.path.stem  # filename without extension (e.g., "rsync_<job_id>")
 
         # Extract job ID from log filename (format: rsync_<job_id> or rclone_<job_id>)
         parts = log_filename.split('_', 1)
@@ -165,42 +180,54 @@ def get_all_logs(logs_dir, job_filter=None, search_term=None, level_filter=None,
             if job_filter != job_id and job_filter != job_name:
                 continue
 
-        # Read log lines
-        lines = read_log_file(log_file, max_lines)
+        candidates.append((log_file, job_id, job_name))
 
-        for line in lines:
-            # Parse log level
-            level = parse_log_level(line)
-
-            # Apply level filter
-            if level_filter and level_filter != 'all' and level != level_filter:
-                continue
-
-            # Apply search filter
-            if search_term and search_term.lower() not in line.lower():
-                continue
+    if not candidates:
+        return []
 
-            # Parse timestamp
-            timestamp = parse_timestamp(line)
-
-            # Parse log line (with metadata)
-            all_logs.append({
-                'job_name': job_name,  # Use the mapped job name, not the filename
-                'job_id': job_id,
-                'line': line.strip(),
-                'level': level,
-                'timestamp': timestamp,
-                'line_number': line_number,
-                'highlighted': search_term if search_term else None
-            })
-            line_number += 1
+    level = level_filter if level_filter and level_filter != 'all' else None
+    search = search_term or None
 
-    return all_logs[-max_lines:]  # Return most recent
+    def parse(candidate):
+        # Read, filter and parse log lines (cached until the file changes)
+        log_file = candidate[0]
+        return parse_log_tail(str(log_file.path), log_file.mtime, log_file.size, max_lines, level, search)
 
+    line_number = 1
+    batch_size = LOG_PARSE_WORKERS
+    with ThreadPoolExecutor(max_workers=min(batch_size, len(candidates))) as executor:
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+
+            for (log_file, job_id, job_name), entries in zip(batch, executor.map(parse, batch)):
+                for line, line_level, timestamp in entries:
+                    # Level and search filters were applied while reading
+                    all_logs.append({
+                        'job_name': job_name,  # Use the mapped job name, not the filename
+                        'job_id': job_id,
+                        'line': line,
+                        'level': line_level,
+                        'timestamp': timestamp,
+                        'line_number': line_number,
+                        'highlighted': search_term if search_term else None
+                    })
+                    line_number += 1
+
+                    # Files are newest first, so once the budget is filled the
+                    # remaining lines and (older) files can't be returned
+                    if len(all_logs) >= max_lines:
+                        return all_logs
+
+    return all_logs
+
+
+def _load_logs(job_id, search, level):
+    """
+    Load the job list and matching logs for the Logs page
 
-@router.get("/", response_class=HTMLResponse)
-async def index(request: Request, job_id: str = 'all', search: str = '', level: str = 'all'):
-    """Logs page"""
+    Returns:
+        Tuple of (jobs, logs)
+    """
     # Get job list for filter dropdown
     manager = JobManager()
     jobs = manager.list_jobs()
@@ -209,16 +236,28 @@ async def index(request: Request, job_id: str = 'all', search: str = '', level:
     logs = get_logs_from_database(
         job_filter=job_id,
         search_term=search if search else None,
-        level_filter=level if level != 'all' else None
+        level_filter=level if level != 'all' else None,
+        jobs=jobs
     )
 
     # Fallback to file reading if database unavailable
     if logs is None:
         from core.paths import get_logs_dir
         logs_dir = get_logs_dir()
-        logs = get_all_logs(logs_dir, job_id, search if search else None, level if level != 'all' else None)
+        logs = get_all_logs(logs_dir, job_id, search if search else None, level if level != 'all' else None,
+                            jobs=jobs)
         logger.debug("Using file-based log reading (database unavailable)")
 
+    return jobs, logs
+
+
+@router.get("/", response_class=HTMLResponse)
+async def index(request: Request, job_id: str = 'all', search: str = '', level: str = 'all'):
+    """Logs page"""
+    # Log queries and file reads block, so run them in a worker thread
+    # instead of stalling the event loop (and every other request)
+    jobs, logs = await asyncio.to_thread(_load_logs, job_id, search, level)
+
     # If HTMX request, return partial
     if request.headers.get('HX-Request'):
         return templates.TemplateResponse('partials/logs_list.html', {
@@ -240,6 +279,27 @@ async def index(request: Request, job_id: str = 'all', search: str = '', level:
     })
 
 
+def _export_lines(logs, chunk_lines=EXPORT_CHUNK_LINES):
+    """
+    Yield the export body in chunks of formatted lines
+
+    Streams the download instead of joining every line into one string
+    first. Lines are newline-separated with no trailing newline.
+
+    Args:
+        logs: Log entries from get_all_logs()
+        chunk_lines: Lines per yielded chunk
+
+    Yields:
+        Blocks of "[job] line" text
+    """
+    for start in range(0, len(logs), chunk_lines):
+        prefix = '\n' if start else ''
+        yield prefix + '\n'.join(
+            f"[{log['job_name']}] {log['line']}" for log in logs[start:start + chunk_lines]
+        )
+
+
 @router.get("/export")
 async def export(request: Request, job_id: str = 'all', search: str = ''):
     """Export logs as text file"""
@@ -248,21 +308,14 @@ async def export(request: Request, job_id: str = 'all', search: str = ''):
     logs_dir = get_logs_dir()
 
     # Get logs (no line limit for export)
-    logs = get_all_logs(logs_dir, job_id, search if search else None, max_lines=10000)
-
-    # Format for export
-    export_lines = []
-    for log in logs:
-        export_lines.append(f"[{log['job_name']}] {log['line']}")
-
-    export_content = "\n".join(export_lines)
+    logs = await asyncio.to_thread(get_all_logs, logs_dir, job_id, search if search else None, max_lines=10000)
 
     # Generate filename
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f"backup_logs_{job_id}_{timestamp}.txt"
 
-    return Response(
-        content=export_content,
+    return StreamingResponse(
+        _export_lines(logs),
         media_type='text/plain',
         headers={'Content-Disposition': f'attachment; filename={filename}'}
     )
@@ -3,9 +3,9 @@ Settings routes (FastAPI)
 """
 from fastapi import APIRouter, Request, Form
 from fastapi.responses import HTMLResponse
-from core.settings import get_settings
-from utils.rclone_helper import is_rclone_installed, get_rclone_version
-import shutil
+from core.settings import get_settings, reload_settings
+from utils.rclone_helper import is_rclone_installed, get_rclone_version, clear_rclone_cache
+from engines.rsync_engine import clear_rsync_cache, is_rsync_installed
 
 # Import FlaskCompatRequest, templates, and helpers from main app
 from fastapi_app import FlaskCompatRequest, templates, create_flash_getter
@@ -14,13 +14,19 @@ router = APIRouter()
 
 
 @router.get("/", response_class=HTMLResponse)
-async def index(request: Request):
+async def index(request: Request, refresh_tools: bool = False):
     """Settings page"""
-    settings_obj = get_settings()
+    # Show what's on disk, in case settings.yaml was edited by hand
+    settings_obj = reload_settings()
     settings = settings_obj.get_all()
 
+    # Tool lookups are cached; "Re-check" on the page forces a fresh probe
+    if refresh_tools:
+        clear_rclone_cache()
+        clear_rsync_cache()
+
     # Check tool installation
-    rsync_installed = shutil.which('rsync') is not None
+    rsync_installed = is_rsync_installed()
     rclone_installed, rclone_path = is_rclone_installed()
     rclone_version = get_rclone_version()
 
@@ -80,9 +86,7 @@ async def save(
             }, status_code=400)
 
         # Save settings using Settings class API
-        settings_obj = get_settings()
-        for key, value in new_settings.items():
-            settings_obj.set(key, value)
+        get_settings().update(new_settings)
 
         request.session['flash'] = {'message': 'Settings saved successfully!', 'category': 'success'}
 
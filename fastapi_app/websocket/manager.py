@@ -5,6 +5,7 @@ Tracks active WebSocket connections and broadcasts messages
 from fastapi import WebSocket
 from typing import List
 import asyncio
+import json
 import logging
 
 
@@ -26,10 +27,13 @@ class ConnectionManager:
 
     async def broadcast(self, message: dict):
         """Broadcast a message to all connected clients"""
+        # Encode once for every client (same format as WebSocket.send_json)
+        text = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
         dead_connections = []
         for connection in self.active_connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(text)
             except Exception as e:
                 logging.error(f"Error sending to client: {e}")
                 dead_connections.append(connection)
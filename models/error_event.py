@@ -15,6 +15,8 @@ class ErrorEvent:
     SEVERITY_HIGH = 'HIGH'
     SEVERITY_CRITICAL = 'CRITICAL'
     VALID_SEVERITIES = [SEVERITY_LOW, SEVERITY_MEDIUM, SEVERITY_HIGH, SEVERITY_CRITICAL]
+    # Integer codes severities are stored as, in VALID_SEVERITIES order
+    SEVERITY_CODES = {severity: code for code, severity in enumerate(VALID_SEVERITIES)}
 
     # Common component names
     COMPONENT_JOB_MANAGER = 'job_manager'
@@ -25,6 +27,12 @@ class ErrorEvent:
     COMPONENT_UI = 'ui'
     COMPONENT_API = 'api'
 
+    # Events are built per row when listing errors; slots keep them small
+    __slots__ = (
+        'id', 'severity', 'component', 'error_type', 'message', 'details', 'job_id',
+        'job_name', 'stack_trace', 'timestamp', 'resolved', 'resolved_at'
+    )
+
     def __init__(
         self,
         severity: str,
@@ -82,7 +90,8 @@ class ErrorEvent:
         component: str,
         message: str,
         job_id: Optional[str] = None,
-        job_name: Optional[str] = None
+        job_name: Optional[str] = None,
+        timestamp: Optional[datetime] = None
     ) -> 'ErrorEvent':
         """
         Create ErrorEvent from an exception
@@ -94,6 +103,7 @@ class ErrorEvent:
             message: Human-readable context message
             job_id: Associated job ID (if applicable)
             job_name: Associated job name (if applicable)
+            timestamp: When the exception occurred (defaults to now)
 
         Returns:
             ErrorEvent instance
@@ -106,7 +116,8 @@ class ErrorEvent:
             details=str(exception),
             job_id=job_id,
             job_name=job_name,
-            stack_trace=''.join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+            stack_trace=''.join(traceback.format_exception(type(exception), exception, exception.__traceback__)),
+            timestamp=timestamp
         )
 
     def to_dict(self) -> Dict[str, Any]:
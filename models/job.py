@@ -24,6 +24,9 @@ class Job:
     STATUS_FAILED = 'failed'
     VALID_STATUSES = [STATUS_PENDING, STATUS_RUNNING, STATUS_PAUSED, STATUS_COMPLETED, STATUS_FAILED]
 
+    # Statuses a job can be started (or resumed/retried) from
+    STARTABLE_STATUSES = frozenset([STATUS_PENDING, STATUS_PAUSED, STATUS_FAILED])
+
     def __init__(
         self,
         name: str,
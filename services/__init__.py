@@ -10,11 +10,13 @@ from .dashboard_service import (
     get_dashboard_stats,
     get_active_jobs,
     get_recent_activity,
-    recover_interrupted_jobs
+    recover_interrupted_jobs,
+    recover_jobs_left_running
 )
 
 from .job_service import (
     get_jobs_list,
+    get_job,
     create_job_from_form,
     start_job_operation,
     pause_job_operation,
@@ -28,9 +30,11 @@ __all__ = [
     'get_active_jobs',
     'get_recent_activity',
     'recover_interrupted_jobs',
+    'recover_jobs_left_running',
 
     # Job services
     'get_jobs_list',
+    'get_job',
     'create_job_from_form',
     'start_job_operation',
     'pause_job_operation',
@@ -5,10 +5,12 @@ Handles all business logic for the dashboard page, including stats calculation,
 job filtering, and recovery operations.
 """
 
+import heapq
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Tuple
 from core.job_manager import JobManager
-from storage.job_storage import JobStorage
 
 
 @dataclass
@@ -20,6 +22,11 @@ class DashboardStats:
     total_bytes_formatted: str
 
 
+# Unit for each power of 1024, indexed by bit_length() // 10
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+@lru_cache(maxsize=1024)
 def format_bytes(bytes_value: int) -> str:
     """
     Format bytes into human-readable string
@@ -30,17 +37,13 @@ def format_bytes(bytes_value: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 GB", "512 MB")
     """
-    if bytes_value >= 1024**4:  # TB
-        return f"{bytes_value / 1024**4:.2f} TB"
-    elif bytes_value >= 1024**3:  # GB
-        return f"{bytes_value / 1024**3:.2f} GB"
-    elif bytes_value >= 1024**2:  # MB
-        return f"{bytes_value / 1024**2:.2f} MB"
-    elif bytes_value >= 1024:  # KB
-        return f"{bytes_value / 1024:.2f} KB"
-    else:
+    if bytes_value < 1024:
         return f"{bytes_value} B"
 
+    # Largest power of 1024 not exceeding the value, capped at TB
+    exponent = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (10 * exponent)):.2f} {_BYTE_UNITS[exponent]}"
+
 
 def get_dashboard_stats(jobs: List[Dict]) -> DashboardStats:
     """
@@ -52,9 +55,15 @@ def get_dashboard_stats(jobs: List[Dict]) -> DashboardStats:
     Returns:
         DashboardStats object with calculated statistics
     """
-    active_jobs_count = sum(1 for job in jobs if job['status'] == 'running')
+    # Single pass over jobs for both the running count and the byte total
+    active_jobs_count = 0
+    total_bytes = 0
+    for job in jobs:
+        if job['status'] == 'running':
+            active_jobs_count += 1
+        total_bytes += job.get('progress', {}).get('bytes_transferred', 0)
+
     total_jobs_count = len(jobs)
-    total_bytes = sum(job.get('progress', {}).get('bytes_transferred', 0) for job in jobs)
     total_bytes_formatted = format_bytes(total_bytes)
 
     return DashboardStats(
@@ -76,8 +85,8 @@ def get_active_jobs(jobs: List[Dict], limit: int = 5) -> List[Dict]:
     Returns:
         List of running jobs, limited to specified count
     """
-    active = [job for job in jobs if job['status'] == 'running']
-    return active[:limit]
+    # Stops scanning once `limit` running jobs have been found
+    return list(islice((job for job in jobs if job['status'] == 'running'), limit))
 
 
 def get_recent_activity(jobs: List[Dict], limit: int = 10) -> List[Dict]:
@@ -91,8 +100,8 @@ def get_recent_activity(jobs: List[Dict], limit: int = 10) -> List[Dict]:
     Returns:
         List of jobs sorted by most recent activity
     """
-    sorted_jobs = sorted(jobs, key=lambda x: x.get('updated_at', ''), reverse=True)
-    return sorted_jobs[:limit]
+    # Bounded top-N selection instead of sorting every job to keep `limit`
+    return heapq.nlargest(limit, jobs, key=lambda x: x.get('updated_at', ''))
 
 
 def get_dashboard_data() -> Dict:
@@ -109,8 +118,7 @@ def get_dashboard_data() -> Dict:
         - recent_jobs: List of recently updated jobs (max 10)
         - all_jobs: Complete list of all jobs
     """
-    manager = JobManager()
-    jobs = manager.list_jobs()
+    jobs = JobManager().list_jobs()
 
     return {
         'stats': get_dashboard_stats(jobs),
@@ -133,17 +141,25 @@ def recover_interrupted_jobs(job_ids: List[str]) -> Tuple[int, str]:
     if not job_ids:
         return 0, 'No interrupted jobs to recover'
 
-    storage = JobStorage()
-    recovered_count = 0
-
-    for job_id in job_ids:
-        job = storage.get_job(job_id)
-        if job and job.status == 'running':
-            job.update_status('paused')
-            storage.update_job(job)
-            recovered_count += 1
+    # One read and one write for all jobs, under the manager's write lock;
+    # only jobs still running are paused
+    recovered_count = JobManager().pause_interrupted_jobs(job_ids)
 
     if recovered_count > 0:
         return recovered_count, f'Successfully recovered {recovered_count} interrupted job(s)'
     else:
         return 0, 'No jobs needed recovery'
+
+
+def recover_jobs_left_running() -> Tuple[int, str]:
+    """
+    Recover jobs a previous process left in the 'running' state
+
+    Nothing is running when the app starts, so any job stored as running
+    was interrupted by a crash or restart.
+
+    Returns:
+        Tuple of (recovered_count, message)
+    """
+    running_jobs = JobManager().list_jobs_by_status('running')
+    return recover_interrupted_jobs([job['id'] for job in running_jobs])
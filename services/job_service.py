@@ -108,6 +108,20 @@ def get_jobs_list() -> List[Dict]:
     return manager.list_jobs()
 
 
+def get_job(job_id: str) -> Optional[Dict]:
+    """
+    Retrieve a single job
+
+    Args:
+        job_id: ID of the job
+
+    Returns:
+        Job dictionary, or None if not found
+    """
+    manager = JobManager()
+    return manager.get_job_status(job_id)
+
+
 def create_job_from_form(form_data: Dict) -> Tuple[bool, str, Optional[Dict]]:
     """
     Create a new backup job from form data
@@ -2,18 +2,24 @@
 Job storage manager - YAML-based persistence for backup jobs
 """
 import yaml
+import copy
 import fcntl
+import os
 import shutil
 import queue
 import threading
 import atexit
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from datetime import datetime
 from models.job import Job
 from core.paths import get_jobs_file
 from core.error_recovery import retry_with_backoff, GracefulDegradation
 
+# Use the libyaml-backed loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class JobStorage:
     """Manages persistent storage of jobs in YAML format"""
@@ -35,6 +41,9 @@ class JobStorage:
         else:
             self.storage_path = get_jobs_file()
 
+        # Last parsed jobs file: ((inode, mtime_ns, size), data)
+        self._parsed_cache: Optional[Tuple[Tuple[int, int, int], dict]] = None
+
         # Ensure directory exists
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -126,6 +135,12 @@ class JobStorage:
         """
         Load and validate YAML file with corruption detection and recovery
 
+        The parsed data is memoized on the file's (inode, mtime, size), so
+        repeated loads of an unchanged file skip the YAML parse. Writes
+        replace the file, so the inode tells apart two writes landing
+        within one mtime tick. Callers get a deep
+        copy and may modify it freely.
+
         Args:
             file_path: Path to YAML file
 
@@ -140,7 +155,13 @@ class JobStorage:
         try:
             # Try to load the main file
             with open(file_path, 'r') as f:
-                data = yaml.safe_load(f)
+                stat = os.fstat(f.fileno())
+                cache_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+                cached = self._parsed_cache
+                if cached is not None and cached[0] == cache_key:
+                    return copy.deepcopy(cached[1])
+
+                data = yaml.load(f, Loader=_YAML_LOADER)
 
             # Validate structure
             if data is not None and not isinstance(data, dict):
@@ -151,7 +172,8 @@ class JobStorage:
                 if not isinstance(data['jobs'], list):
                     raise ValueError(f"Invalid jobs structure: expected list, got {type(data['jobs'])}")
 
-            return data
+            self._parsed_cache = (cache_key, data)
+            return copy.deepcopy(data)
 
         except yaml.YAMLError as e:
             # YAML syntax error - attempt recovery from backup
@@ -194,7 +216,7 @@ class JobStorage:
 
             # Load backup file
             with open(backup_path, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
 
             # Validate backup structure
             if data is not None and not isinstance(data, dict):
@@ -295,6 +317,40 @@ class JobStorage:
             logging.error(f"Error updating job: {e}")
             return False
 
+    def bulk_update_status(self, job_ids: Iterable[str], status: str, from_status: Optional[str] = None) -> int:
+        """
+        Set the status of several jobs with a single read and a single write
+
+        Args:
+            job_ids: IDs of the jobs to update
+            status: New status
+            from_status: If given, only jobs currently in this status are updated
+
+        Returns:
+            Number of jobs updated (unknown IDs are skipped)
+        """
+        wanted = set(job_ids)
+        if not wanted:
+            return 0
+
+        try:
+            jobs = self.load_jobs()
+
+            updated_count = 0
+            for job in jobs:
+                if job.id in wanted and (from_status is None or job.status == from_status):
+                    job.update_status(status)
+                    updated_count += 1
+
+            if updated_count:
+                self._write_jobs(jobs)
+            return updated_count
+
+        except Exception as e:
+            import logging
+            logging.error(f"Error updating job statuses: {e}")
+            return 0
+
     def _write_jobs(self, jobs: List[Job]):
         """
         Queue a write operation (non-blocking)
@@ -357,7 +413,7 @@ class JobStorage:
 
             # Write to temp file while holding lock
             with open(temp_path, 'w') as f:
-                yaml.safe_dump(jobs_data, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(jobs_data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
             # Atomic rename
             temp_path.replace(storage_path)
@@ -414,6 +470,12 @@ class JobStorage:
 
         logging.info("JobStorage write worker stopped")
 
+    @classmethod
+    def flush_writes(cls):
+        """Wait until every queued write has been written"""
+        if cls._write_queue is not None:
+            cls._write_queue.join()
+
     @classmethod
     def _shutdown_writer(cls):
         """
@@ -7,7 +7,9 @@ from fastapi.testclient import TestClient
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.job_manager import JobManager
 from fastapi_app import app
+from storage.job_storage import JobStorage
 
 
 @pytest.fixture
@@ -20,3 +22,16 @@ def client():
 def test_app():
     """Return FastAPI app for testing."""
     return app
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """JobManager singleton backed by a temporary jobs file."""
+    JobManager._instance = None
+    JobManager._initialized = False
+    mgr = JobManager()
+    mgr.storage = JobStorage(str(tmp_path / "jobs.yaml"))
+    yield mgr
+    JobStorage._write_queue.join()
+    JobManager._instance = None
+    JobManager._initialized = False
@@ -0,0 +1,102 @@
+"""
+Tests for auto-refresh and polling wiring on the dashboard, Jobs and Logs pages
+"""
+from bs4 import BeautifulSoup
+
+from core.settings import get_settings
+
+
+def _panel(html, panel_id):
+    return BeautifulSoup(html, 'html.parser').find(id=panel_id)
+
+
+def test_panels_keep_polling_container_on_swap(client):
+    """Partials swap into the container so the hx-trigger isn't replaced"""
+    response = client.get('/')
+    assert response.status_code == 200
+
+    for panel_id in ('dashboard-stats', 'active-jobs', 'recent-activity'):
+        panel = _panel(response.text, panel_id)
+        assert panel['hx-swap'] == 'innerHTML'
+        assert "document.visibilityState === 'visible'" in panel['hx-trigger']
+
+
+def test_active_jobs_poll_uses_refresh_setting(client, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setitem(settings._settings, 'auto_refresh_interval', 7)
+
+    response = client.get('/')
+
+    assert _panel(response.text, 'active-jobs')['hx-trigger'].startswith('every 7s ')
+
+
+def test_active_jobs_poll_slows_down_when_idle(client):
+    """Fast polling only while running jobs are listed; idle panels poll every 10s"""
+    trigger = _panel(client.get('/').text, 'active-jobs')['hx-trigger']
+    fast, idle = [part.strip() for part in trigger.split(',')]
+
+    assert fast.endswith("&& this.querySelector('[data-job-id]')]")
+    assert idle == ("every 10s [document.visibilityState === 'visible' && "
+                    "!this.querySelector('[data-job-id]')]")
+
+
+def test_jobs_fallback_poll_uses_refresh_setting(client, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setitem(settings._settings, 'auto_refresh_interval', 7)
+
+    response = client.get('/jobs/')
+
+    assert response.status_code == 200
+    assert 'const REFRESH_INTERVAL_MS = 7 * 1000;' in response.text
+    assert "document.visibilityState !== 'visible'" in response.text
+
+
+def test_logs_refresh_is_throttled_partial_fetch(client):
+    response = client.get('/logs/')
+
+    button = _panel(response.text, 'logs-refresh')
+    assert button['hx-get'] == '/logs'
+    assert button['hx-target'] == '#logs-container'
+    assert 'throttle:2s' in button['hx-trigger']
+    assert not button.has_attr('onclick')
+
+
+
+def test_recent_activity_loads_jobs_off_the_event_loop(client, monkeypatch):
+    """The jobs file read behind the Recent Activity panel runs in a worker thread"""
+    import asyncio
+    from fastapi_app.routers import dashboard
+
+    loaded_on_event_loop = []
+
+    def fake_jobs_list():
+        try:
+            asyncio.get_running_loop()
+            loaded_on_event_loop.append(True)
+        except RuntimeError:
+            loaded_on_event_loop.append(False)
+        return [{'id': '1', 'name': 'nightly', 'status': 'completed',
+                 'updated_at': '2025-01-02T00:00:00', 'progress': {'percent': 100}}]
+
+    monkeypatch.setattr(dashboard, 'get_jobs_list', fake_jobs_list)
+
+    response = client.get('/recent-activity')
+
+    assert response.status_code == 200
+    assert 'nightly' in response.text
+    assert loaded_on_event_loop == [False]
+
+
+def test_panels_drop_ticks_while_a_refresh_is_in_flight(client):
+    response = client.get('/')
+
+    for panel_id in ('dashboard-stats', 'active-jobs', 'recent-activity'):
+        assert _panel(response.text, panel_id)['hx-sync'] == 'this:drop'
+
+
+def test_jobs_fallback_poll_waits_for_previous_refresh(client):
+    """The fallback poller reschedules itself after each refresh instead of using a fixed interval"""
+    html = client.get('/jobs').text
+
+    assert 'setInterval' not in html
+    assert 'if (pollingFallback === timer) schedulePoll();' in html
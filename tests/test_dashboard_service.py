@@ -0,0 +1,91 @@
+"""
+Unit tests for services.dashboard_service
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.dashboard_service import format_bytes, get_active_jobs, get_dashboard_stats, get_recent_activity
+
+
+class TestFormatBytes:
+    """Test human-readable byte formatting"""
+
+    @pytest.mark.parametrize("value,expected", [
+        (0, "0 B"),
+        (1023, "1023 B"),
+        (1024, "1.00 KB"),
+        (1536, "1.50 KB"),
+        (1024**2 - 1, "1024.00 KB"),
+        (1024**2, "1.00 MB"),
+        (5 * 1024**3, "5.00 GB"),
+        (3 * 1024**4, "3.00 TB"),
+        (2048 * 1024**4, "2048.00 TB"),
+    ])
+    def test_unit_boundaries(self, value, expected):
+        assert format_bytes(value) == expected
+
+    def test_registered_as_template_filter(self):
+        from fastapi_app import templates
+
+        rendered = templates.env.from_string("{{ n | format_bytes }}").render(n=1024**2)
+        assert rendered == "1.00 MB"
+
+
+class TestDashboardStats:
+    """Test dashboard statistics aggregation"""
+
+    def test_counts_and_totals(self):
+        jobs = [
+            {'status': 'running', 'progress': {'bytes_transferred': 1024}},
+            {'status': 'completed', 'progress': {'bytes_transferred': 2048}},
+            {'status': 'running', 'progress': {}},
+            {'status': 'paused'},
+        ]
+
+        stats = get_dashboard_stats(jobs)
+
+        assert stats.active_jobs_count == 2
+        assert stats.total_jobs_count == 4
+        assert stats.total_bytes == 3072
+        assert stats.total_bytes_formatted == "3.00 KB"
+
+    def test_no_jobs(self):
+        stats = get_dashboard_stats([])
+
+        assert (stats.active_jobs_count, stats.total_jobs_count, stats.total_bytes) == (0, 0, 0)
+
+
+class TestActiveJobs:
+    """Test running job selection"""
+
+    def test_first_running_jobs_in_order(self):
+        jobs = [{'id': str(i), 'status': 'running' if i % 2 else 'paused'} for i in range(12)]
+
+        assert [j['id'] for j in get_active_jobs(jobs, limit=3)] == ['1', '3', '5']
+        assert len(get_active_jobs(jobs)) == 5
+
+    def test_stops_after_limit(self):
+        jobs = [{'id': 'a', 'status': 'running'}, {'id': 'b'}]
+
+        # The second job has no status and would raise if it were read
+        assert [j['id'] for j in get_active_jobs(jobs, limit=1)] == ['a']
+
+
+class TestRecentActivity:
+    """Test most-recently-updated job selection"""
+
+    def test_newest_first_and_limited(self):
+        jobs = [{'id': str(i), 'updated_at': f'2025-01-{day:02d}T00:00:00'}
+                for i, day in enumerate([3, 9, 1, 7, 5])]
+
+        assert [j['id'] for j in get_recent_activity(jobs, limit=3)] == ['1', '3', '4']
+
+    def test_ties_and_missing_timestamps_keep_list_order(self):
+        jobs = [{'id': 'a', 'updated_at': '2025-01-01'}, {'id': 'b'},
+                {'id': 'c', 'updated_at': '2025-01-01'}]
+
+        assert [j['id'] for j in get_recent_activity(jobs)] == ['a', 'c', 'b']
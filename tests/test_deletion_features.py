@@ -285,6 +285,23 @@ class TestDeletionLogger:
             # Deletion log entries have file_path instead of message
             assert 'file_path' in entry or 'size' in entry
 
+    def test_get_deletion_log_returns_most_recent_first(self):
+        """Only the last `limit` DELETED entries are returned, newest first"""
+        job_id = "test-job-recent"
+        logger = DeletionLogger(job_id)
+        logger.log_file.unlink(missing_ok=True)
+
+        logger.log_deletion_start(mode='per_file', total_files=50)
+        for i in range(50):
+            logger.log_deletion(f"/test/file{i}.txt", file_size=1024)
+        logger.log_deletion_complete(files_deleted=50, bytes_deleted=50 * 1024)
+
+        log_entries = logger.get_deletion_log(limit=3)
+
+        assert [entry['file_path'] for entry in log_entries] == [
+            "/test/file49.txt", "/test/file48.txt", "/test/file47.txt"
+        ]
+
 
 class TestJobDeletionSettings:
     """Test suite for Job model deletion settings"""
@@ -0,0 +1,56 @@
+"""
+Tests for engine exit notification and JobManager.cleanup_stopped_engines()
+"""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engines.rclone_engine import RcloneEngine
+from engines.rsync_engine import RsyncEngine
+
+
+@pytest.mark.parametrize("engine_cls", [RsyncEngine, RcloneEngine])
+def test_exit_callbacks_run_when_the_monitor_finishes(engine_cls, tmp_path, monkeypatch):
+    monkeypatch.setattr("core.paths.get_logs_dir", lambda: tmp_path)
+    engine = engine_cls(source=str(tmp_path), dest=str(tmp_path / "dest"), job_id="job")
+    monkeypatch.setattr(engine, "_monitor_output", lambda: None)
+    calls = []
+
+    engine.on_exit(lambda: calls.append("registered"))
+    engine._run_monitor()
+    engine.on_exit(lambda: calls.append("late"))
+
+    assert calls == ["registered", "late"]
+
+
+class _PolledEngine:
+    """Engine that fails the test if cleanup polls it"""
+
+    def is_running(self):
+        raise AssertionError("running engine polled by cleanup")
+
+
+def test_cleanup_only_visits_finished_engines(manager):
+    running, finished, replaced = _PolledEngine(), _PolledEngine(), _PolledEngine()
+    manager.engines = {'running': running, 'finished': finished, 'restarted': _PolledEngine()}
+    long_ago = time.time() - 3600
+    manager._finished_engines.put(('finished', finished, long_ago))
+    # Exit notice from an engine the job has since replaced
+    manager._finished_engines.put(('restarted', replaced, long_ago))
+
+    assert manager.cleanup_stopped_engines() == 1
+    assert sorted(manager.engines) == ['restarted', 'running']
+    assert manager.engine_stop_times == {}
+
+
+def test_recently_finished_engine_is_kept(manager):
+    finished = _PolledEngine()
+    manager.engines = {'finished': finished}
+    manager._finished_engines.put(('finished', finished, time.time()))
+
+    assert manager.cleanup_stopped_engines() == 0
+    assert 'finished' in manager.engine_stop_times
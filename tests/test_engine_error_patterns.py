@@ -0,0 +1,40 @@
+"""
+Unit tests for network error classification in the transfer engines
+"""
+import sys
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engines.rclone_engine import RcloneEngine
+from engines.rsync_engine import RsyncEngine
+
+
+class TestRsyncNetworkErrors:
+    """Test code 23 disambiguation from rsync output"""
+
+    def setup_method(self):
+        self.engine = RsyncEngine(source="/tmp/test_source", dest="/tmp/test_dest", job_id="test-job-id")
+
+    def test_matches_patterns_regardless_of_case(self):
+        output = deque(["sending incremental file list", "rsync: Connection Reset by peer (104)"])
+
+        assert self.engine._is_network_error(23, output)
+
+    def test_no_pattern_in_output(self):
+        output = deque(["rsync: send_files failed to open: Permission denied (13)"])
+
+        assert not self.engine._is_network_error(23, output)
+
+    def test_only_ambiguous_codes_are_checked(self):
+        assert not self.engine._is_network_error(11, deque(["broken pipe"]))
+
+
+@pytest.mark.parametrize("engine_cls", [RsyncEngine, RcloneEngine])
+def test_compiled_pattern_covers_every_keyword(engine_cls):
+    for pattern in engine_cls.NETWORK_ERROR_PATTERNS:
+        assert engine_cls.NETWORK_ERROR_RE.search(f"ERROR: {pattern.upper()}!")
+    assert not engine_cls.NETWORK_ERROR_RE.search("checksum mismatch")
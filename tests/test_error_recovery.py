@@ -0,0 +1,140 @@
+"""
+Unit tests for core.error_recovery retry strategy
+"""
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.error_recovery as error_recovery
+from core import error_sink
+from core.error_recovery import CircuitBreaker, RecoveryStrategy, retry_with_backoff
+
+
+def test_retry_delay_is_jittered_exponential_backoff(monkeypatch):
+    strategy = RecoveryStrategy(max_retries=3, initial_delay=0.5)
+
+    monkeypatch.setattr(error_recovery.random, "random", lambda: 0.0)
+    assert [strategy.get_retry_delay(a) for a in (1, 2, 3)] == [0.25, 0.5, 1.0]
+
+    monkeypatch.setattr(error_recovery.random, "random", lambda: 1.0)
+    assert [strategy.get_retry_delay(a) for a in (1, 2, 3)] == [0.75, 1.5, 3.0]
+
+
+def test_retry_delay_past_max_retries_uses_the_longest_delay(monkeypatch):
+    monkeypatch.setattr(error_recovery.random, "random", lambda: 0.5)
+    strategy = RecoveryStrategy(max_retries=2, initial_delay=1.0)
+
+    assert strategy.get_retry_delay(10) == strategy.get_retry_delay(3) == 4.0
+
+
+def test_parallel_retries_are_spread_out():
+    strategy = RecoveryStrategy(max_retries=3, initial_delay=1.0)
+
+    delays = {strategy.get_retry_delay(2) for _ in range(50)}
+
+    assert len(delays) > 1
+    assert all(1.0 <= d <= 3.0 for d in delays)
+
+
+def test_should_retry_transient_errors_only():
+    strategy = RecoveryStrategy(max_retries=2)
+
+    for error in (IOError("disk"), TimeoutError(), ConnectionResetError(), BlockingIOError()):
+        assert strategy.should_retry(error, 1)
+    assert not strategy.should_retry(ValueError("bad"), 1)
+    assert not strategy.should_retry(OSError("disk"), 3)
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions under concurrent calls"""
+
+    def test_only_one_half_open_probe_runs(self, monkeypatch):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0, component="test")
+        monkeypatch.setattr(error_sink, "enqueue_exception", lambda *args, **kwargs: True)
+        breaker.call(_fail)
+        assert breaker.state == CircuitBreaker.STATE_OPEN
+
+        probing = threading.Event()
+        release = threading.Event()
+
+        def slow_probe():
+            probing.set()
+            release.wait(5)
+            return "ok"
+
+        results = []
+        probe = threading.Thread(target=lambda: results.append(breaker.call(slow_probe)))
+        probe.start()
+        probing.wait(5)
+
+        # A second caller while the probe is running is rejected
+        assert breaker.call(lambda: "other") == (False, None)
+
+        release.set()
+        probe.join(5)
+
+        assert results == [(True, "ok")]
+        assert breaker.state == CircuitBreaker.STATE_CLOSED
+        assert breaker.call(lambda: "after") == (True, "after")
+
+    def test_open_is_reported_once_for_concurrent_failures(self, monkeypatch):
+        events = []
+        monkeypatch.setattr(error_sink, "enqueue_exception", lambda e, **kwargs: events.append(e))
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0, component="test")
+        barrier = threading.Barrier(8)
+
+        def failing():
+            barrier.wait(5)
+            raise OSError("down")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: breaker.call(failing), range(8)))
+
+        assert results == [(False, None)] * 8
+        assert breaker.failure_count == 8
+        assert breaker.state == CircuitBreaker.STATE_OPEN
+        assert len(events) == 1
+
+
+def _fail():
+    raise OSError("down")
+
+
+def test_recovery_timeout_ignores_wall_clock_jumps(monkeypatch):
+    monkeypatch.setattr(error_sink, "enqueue_exception", lambda *args, **kwargs: True)
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0, component="test")
+    breaker.call(_fail)
+
+    # Wall clock jumps an hour ahead; the circuit stays open
+    wall_clock = error_recovery.time.time()
+    monkeypatch.setattr(error_recovery.time, "time", lambda: wall_clock + 3600)
+
+    assert breaker.call(lambda: "ok") == (False, None)
+    assert breaker.state == CircuitBreaker.STATE_OPEN
+
+
+def test_retry_decorator_without_retries_or_logging_returns_function():
+    def save():
+        return "saved"
+
+    assert retry_with_backoff(max_retries=0, log_errors=False)(save) is save
+    assert retry_with_backoff(max_retries=0, log_errors=True)(save) is not save
+
+
+def test_retry_decorator_retries_transient_errors(monkeypatch):
+    monkeypatch.setattr(error_recovery.time, "sleep", lambda delay: None)
+    calls = []
+
+    @retry_with_backoff(max_retries=2, component="test", log_errors=False)
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise OSError("busy")
+        return "done"
+
+    assert flaky() == "done"
+    assert len(calls) == 3
+    assert flaky.__name__ == "flaky"
@@ -0,0 +1,333 @@
+"""
+Tests for ErrorEventRepository queries
+"""
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import error_repository
+from core.database import close_connection, get_db, initialize_database
+from core.error_repository import ErrorEventRepository
+from models.error_event import ErrorEvent
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """ErrorEventRepository on a fresh database"""
+    close_connection()
+    yield ErrorEventRepository(str(tmp_path / "events.db"))
+    close_connection()
+
+
+def _plan(repo, sql, params):
+    with get_db(repo.db_path) as conn:
+        return ' '.join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+
+@pytest.mark.parametrize("column,value,index", [
+    ("resolved", 0, "idx_error_resolved"),
+    ("job_id", "abc", "idx_error_job_time"),
+    ("severity", 2, "idx_error_severity_time"),
+])
+def test_newest_errors_are_read_in_index_order(repo, column, value, index):
+    plan = _plan(repo, f"SELECT * FROM error_events WHERE {column} = ? ORDER BY timestamp DESC LIMIT 50", (value,))
+
+    assert f"USING INDEX {index}" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_single_column_indexes_are_replaced(repo):
+    with get_db(repo.db_path, write=True) as conn:
+        conn.execute('CREATE INDEX idx_error_job_id ON error_events(job_id)')
+    initialize_database(repo.db_path)
+
+    with get_db(repo.db_path) as conn:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    assert {'idx_error_job_time', 'idx_error_severity_time'} <= indexes
+    assert not {'idx_error_job_id', 'idx_error_severity'} & indexes
+
+
+def test_error_stats(repo):
+    old = datetime.now() - timedelta(days=3)
+    events = [
+        ErrorEvent(ErrorEvent.SEVERITY_HIGH, "storage", "OSError", "disk full"),
+        ErrorEvent(ErrorEvent.SEVERITY_HIGH, "storage", "OSError", "disk full", timestamp=old),
+        ErrorEvent(ErrorEvent.SEVERITY_LOW, "network", "TimeoutError", "slow", resolved=True),
+        ErrorEvent(ErrorEvent.SEVERITY_CRITICAL, "engine", "RuntimeError", "crash", timestamp=old, resolved=True),
+    ]
+    repo.log_errors(events)
+
+    assert repo.get_error_stats() == {
+        'total': 4,
+        'unresolved': 2,
+        'resolved': 2,
+        'by_severity': {'HIGH': 2},
+        'recent_24h': 2,
+    }
+
+
+def test_error_stats_on_empty_table(repo):
+    assert repo.get_error_stats() == {
+        'total': 0, 'unresolved': 0, 'resolved': 0, 'by_severity': {}, 'recent_24h': 0
+    }
+
+
+def test_delete_old_errors_seeks_the_resolved_index(repo):
+    old = datetime.now() - timedelta(days=40)
+    repo.log_errors([
+        ErrorEvent(ErrorEvent.SEVERITY_LOW, "network", "TimeoutError", "old", timestamp=old, resolved=True),
+        ErrorEvent(ErrorEvent.SEVERITY_LOW, "network", "TimeoutError", "old open", timestamp=old),
+        ErrorEvent(ErrorEvent.SEVERITY_LOW, "network", "TimeoutError", "new", resolved=True),
+    ])
+
+    plan = _plan(repo, "SELECT id FROM error_events WHERE resolved = 1 AND timestamp < ?", (repo._cutoff(30),))
+
+    assert "idx_error_resolved (resolved=? AND timestamp<?)" in plan
+    assert repo.delete_old_errors(days=30) == 1
+    assert sorted(e.message for e in repo.get_recent_errors()) == ["new", "old open"]
+
+
+def test_error_stats_are_cached_until_a_write(repo):
+    repo.STATS_CACHE_TTL = 60.0
+    first = repo.get_error_stats()
+
+    assert repo.get_error_stats() is first
+
+    event_id = repo.log_error(ErrorEvent(ErrorEvent.SEVERITY_HIGH, "storage", "OSError", "disk full"))
+    assert repo.get_error_stats()['unresolved'] == 1
+
+    repo.mark_resolved(event_id)
+    assert repo.get_error_stats()['unresolved'] == 0
+
+
+def test_error_stats_cache_expires(repo):
+    repo.STATS_CACHE_TTL = 0.0
+    first = repo.get_error_stats()
+
+    assert repo.get_error_stats() is not first
+
+
+def test_delete_old_errors_in_batches(repo):
+    old = datetime.now() - timedelta(days=40)
+    repo.log_errors([
+        ErrorEvent(ErrorEvent.SEVERITY_LOW, "network", "TimeoutError", f"old {i}", timestamp=old, resolved=True)
+        for i in range(5)
+    ] + [ErrorEvent(ErrorEvent.SEVERITY_LOW, "network", "TimeoutError", "new", resolved=True)])
+    repo.DELETE_BATCH_SIZE = 2
+
+    statements = []
+    with get_db(repo.db_path, write=True) as conn:
+        conn.set_trace_callback(statements.append)
+    try:
+        assert repo.delete_old_errors(days=30) == 5
+    finally:
+        with get_db(repo.db_path, write=True) as conn:
+            conn.set_trace_callback(None)
+
+    assert [s.split()[0] for s in statements].count('COMMIT') == 3
+    assert [e.message for e in repo.get_recent_errors()] == ["new"]
+
+
+def test_concurrent_first_calls_share_one_repository(monkeypatch):
+    created = []
+    barrier = threading.Barrier(8)
+
+    class SlowRepository:
+        def __init__(self):
+            created.append(self)
+            time.sleep(0.05)
+
+    def first_call(_):
+        barrier.wait()
+        return error_repository.get_error_repository()
+
+    monkeypatch.setattr(error_repository, "_error_repo", None)
+    monkeypatch.setattr(error_repository, "ErrorEventRepository", SlowRepository)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        repos = set(map(id, executor.map(first_call, range(8))))
+
+    assert len(created) == 1
+    assert repos == {id(created[0])}
+
+
+def test_events_round_trip_every_column(repo):
+    when = datetime(2025, 1, 2, 3, 4, 5, 678000)
+    event = ErrorEvent(
+        ErrorEvent.SEVERITY_CRITICAL, "engine", "RuntimeError", "crash", details="exit 12",
+        job_id="abc", job_name="photos", stack_trace="Traceback ...", timestamp=when
+    )
+    event_id = repo.log_error(event)
+    repo.mark_resolved(event_id)
+
+    loaded = repo.get_error(event_id)
+
+    assert loaded.to_dict() | {'resolved_at': None} == event.to_dict() | {
+        'id': event_id, 'resolved': True, 'resolved_at': None
+    }
+    assert isinstance(loaded.resolved_at, datetime)
+    assert repo.get_error(event_id + 1) is None
+
+
+def test_dashboard_snapshot_reads_stats_and_recent_in_one_transaction(repo):
+    repo.log_errors([
+        ErrorEvent(ErrorEvent.SEVERITY_HIGH, "storage", "OSError", f"failure {i}",
+                   timestamp=datetime(2025, 1, 1, 10, 0, i), resolved=i % 2 == 0)
+        for i in range(5)
+    ])
+    statements = []
+    with get_db(repo.db_path) as conn:
+        conn.set_trace_callback(statements.append)
+    try:
+        snapshot = repo.get_dashboard_snapshot(recent_limit=3, resolved=False)
+    finally:
+        with get_db(repo.db_path) as conn:
+            conn.set_trace_callback(None)
+
+    assert [s.split()[0] for s in statements] == ['BEGIN', 'SELECT', 'SELECT', 'COMMIT']
+    assert snapshot['stats'] == repo.get_error_stats()
+    assert snapshot['stats']['unresolved'] == 2
+    assert [e.message for e in snapshot['recent']] == ["failure 3", "failure 1"]
+
+
+def test_stack_traces_are_stored_apart_from_events(repo):
+    with_trace = ErrorEvent(ErrorEvent.SEVERITY_HIGH, "engine", "RuntimeError", "crash",
+                            stack_trace="Traceback (most recent call last): ...")
+    without_trace = ErrorEvent(ErrorEvent.SEVERITY_LOW, "network", "TimeoutError", "slow")
+    repo.log_errors([with_trace, without_trace])
+    traced_id, plain_id = sorted(e.id for e in repo.get_recent_errors())
+
+    assert all(e.stack_trace is None for e in repo.get_recent_errors())
+    assert repo.get_stack_trace(traced_id) == with_trace.stack_trace
+    assert repo.get_stack_trace(plain_id) is None
+    assert repo.get_error(traced_id).stack_trace == with_trace.stack_trace
+
+    repo.mark_resolved(traced_id)
+    with get_db(repo.db_path, write=True) as conn:
+        conn.execute("UPDATE error_events SET timestamp = '2000-01-01T00:00:00'")
+    repo.delete_old_errors(days=30)
+
+    assert repo.get_stack_trace(traced_id) is None
+
+
+def test_inline_stack_traces_are_migrated(repo):
+    with get_db(repo.db_path, write=True) as conn:
+        conn.execute(
+            "INSERT INTO error_events (severity, component, error_type, message, stack_trace) "
+            "VALUES (2, 'engine', 'RuntimeError', 'old', 'old trace')"
+        )
+    initialize_database(repo.db_path)
+
+    [event] = repo.get_recent_errors()
+    with get_db(repo.db_path) as conn:
+        inline = conn.execute("SELECT stack_trace FROM error_events").fetchone()[0]
+
+    assert inline is None
+    assert repo.get_stack_trace(event.id) == 'old trace'
+
+
+def test_batched_stack_traces_follow_their_events(repo):
+    first_id = repo.log_error(ErrorEvent(ErrorEvent.SEVERITY_LOW, "network", "TimeoutError", "first"))
+    repo.log_errors([
+        ErrorEvent(ErrorEvent.SEVERITY_HIGH, "engine", "RuntimeError", f"crash {i}",
+                   stack_trace=f"trace {i}" if i % 2 else None)
+        for i in range(6)
+    ])
+
+    events = {e.message: e.id for e in repo.get_recent_errors()}
+
+    assert events["first"] == first_id
+    assert all(repo.get_stack_trace(events[f"crash {i}"]) == (f"trace {i}" if i % 2 else None) for i in range(6))
+
+
+def test_text_severities_are_converted_to_codes(tmp_path):
+    db_path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE error_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            severity TEXT CHECK(severity IN ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')),
+            component TEXT NOT NULL,
+            error_type TEXT NOT NULL,
+            message TEXT NOT NULL,
+            details TEXT,
+            job_id TEXT,
+            job_name TEXT,
+            stack_trace TEXT,
+            resolved BOOLEAN DEFAULT 0,
+            resolved_at DATETIME,
+            indexed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.executemany(
+        "INSERT INTO error_events (severity, component, error_type, message, stack_trace) VALUES (?, 'engine', 'E', ?, ?)",
+        [("CRITICAL", "down", "trace"), ("LOW", "slow", None), ("LOW", "deleted", None)]
+    )
+    conn.execute("DELETE FROM error_events WHERE message = 'deleted'")
+    conn.commit()
+    conn.close()
+
+    close_connection()
+    try:
+        repo = ErrorEventRepository(db_path)
+        new_id = repo.log_error(ErrorEvent(ErrorEvent.SEVERITY_HIGH, "api", "E", "new"))
+
+        assert [e.message for e in repo.get_errors_by_severity(ErrorEvent.SEVERITY_CRITICAL)] == ["down"]
+        assert repo.get_error(1).stack_trace == "trace"
+        assert repo.get_error_stats()['by_severity'] == {'CRITICAL': 1, 'HIGH': 1, 'LOW': 1}
+        assert new_id == 4
+        with get_db(db_path) as conn:
+            assert sorted(r[0] for r in conn.execute("SELECT severity FROM error_events")) == [0, 2, 3]
+            assert conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE tbl_name = 'error_events' AND name LIKE 'idx_error_%'"
+            ).fetchone()[0] == 5
+    finally:
+        close_connection()
+
+
+def test_mark_resolved_bulk_commits_once(repo):
+    repo.log_errors([ErrorEvent(ErrorEvent.SEVERITY_LOW, "network", "TimeoutError", f"slow {i}") for i in range(5)])
+    ids = sorted(e.id for e in repo.get_recent_errors())
+    statements = []
+    with get_db(repo.db_path, write=True) as conn:
+        conn.set_trace_callback(statements.append)
+    try:
+        assert repo.mark_resolved_bulk(ids[:3] + [9999]) == 3
+    finally:
+        with get_db(repo.db_path, write=True) as conn:
+            conn.set_trace_callback(None)
+
+    resolved = {e.id: e for e in repo.get_recent_errors(resolved=True)}
+    assert sorted(resolved) == ids[:3]
+    assert len({e.resolved_at for e in resolved.values()}) == 1
+    assert statements.count("COMMIT") == 1
+    assert repo.mark_resolved(ids[3]) and not repo.mark_resolved(9999)
+
+
+def test_error_histogram_groups_by_bucket_and_severity(repo):
+    now = datetime.now().replace(minute=30)
+    an_hour_ago = now - timedelta(hours=1)
+    repo.log_errors([
+        ErrorEvent(ErrorEvent.SEVERITY_HIGH, "engine", "E", "a", timestamp=now),
+        ErrorEvent(ErrorEvent.SEVERITY_HIGH, "engine", "E", "b", timestamp=now),
+        ErrorEvent(ErrorEvent.SEVERITY_LOW, "engine", "E", "c", timestamp=an_hour_ago),
+        ErrorEvent(ErrorEvent.SEVERITY_LOW, "engine", "E", "old", timestamp=now - timedelta(days=3)),
+    ])
+
+    assert repo.get_error_histogram('hour') == {
+        an_hour_ago.strftime('%Y-%m-%dT%H'): {'LOW': 1},
+        now.strftime('%Y-%m-%dT%H'): {'HIGH': 2},
+    }
+    assert sum(sum(c.values()) for c in repo.get_error_histogram('day', days=7).values()) == 4
+    assert "idx_error_timestamp" in _plan(repo, repo._HISTOGRAM_SQL, (13, repo._cutoff(1)))
+    with pytest.raises(ValueError):
+        repo.get_error_histogram('minute')
@@ -0,0 +1,118 @@
+"""
+Tests for the background error event writer
+"""
+import queue
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import error_sink
+from core.database import close_connection
+from core.error_repository import ErrorEventRepository
+from models.error_event import ErrorEvent
+
+
+def _event(i):
+    return ErrorEvent(ErrorEvent.SEVERITY_MEDIUM, "storage", "OSError", f"failure {i}")
+
+
+class _RecordingRepository(ErrorEventRepository):
+    """Real repository that also records the size of each batch written"""
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.batches = []
+
+    def log_errors(self, error_events):
+        self.batches.append(len(error_events))
+        return super().log_errors(error_events)
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    repo = _RecordingRepository(str(tmp_path / "events.db"))
+    monkeypatch.setattr(error_sink, "get_error_repository", lambda: repo)
+    yield repo
+    close_connection()
+
+
+def test_events_from_many_threads_are_written_in_batches(repository):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(lambda i: error_sink.enqueue(_event(i)), range(200)))
+    error_sink.flush()
+
+    assert sum(repository.batches) == 200
+    assert len(repository.batches) < 200
+    assert repository.get_error_stats()['total'] == 200
+
+
+def test_write_failure_is_logged_not_raised(repository, monkeypatch):
+    def fail(events):
+        raise RuntimeError("database locked")
+
+    monkeypatch.setattr(repository, "log_errors", fail)
+
+    assert error_sink.enqueue(_event(1))
+    error_sink.flush()
+
+    assert repository.get_error_stats()['total'] == 0
+
+
+def test_full_queue_drops_events(monkeypatch):
+    monkeypatch.setattr(error_sink, "_queue", queue.Queue(maxsize=1))
+    # Pretend the flusher is running so nothing drains the queue
+    monkeypatch.setattr(error_sink, "_flusher_thread", object())
+
+    assert error_sink.enqueue(_event(1))
+    assert not error_sink.enqueue(_event(2))
+
+
+def test_exception_traceback_is_formatted_by_the_writer_thread(repository, monkeypatch):
+    formatting_threads = []
+    format_exception = traceback.format_exception
+
+    def recording_format(*args, **kwargs):
+        formatting_threads.append(threading.current_thread().name)
+        return format_exception(*args, **kwargs)
+
+    monkeypatch.setattr(traceback, "format_exception", recording_format)
+
+    try:
+        raise ConnectionResetError("peer gone")
+    except OSError as e:
+        assert error_sink.enqueue_exception(e, ErrorEvent.SEVERITY_HIGH, "network", "probe failed", job_id="abc")
+    assert formatting_threads == []
+
+    error_sink.flush()
+
+    [event] = repository.get_recent_errors()
+    assert formatting_threads == ["ErrorEventWriter"]
+    assert (event.error_type, event.details, event.job_id) == ("ConnectionResetError", "peer gone", "abc")
+    assert "raise ConnectionResetError" in repository.get_stack_trace(event.id)
+
+
+def test_background_task_errors_go_through_the_sink(repository, monkeypatch):
+    """Async tasks queue their failures instead of writing SQLite on the event loop"""
+    import asyncio
+    from fastapi_app import background
+
+    def failing_indexer(interval):
+        raise RuntimeError("logs dir missing")
+
+    async def notify(*args):
+        pass
+
+    monkeypatch.setattr(background, "LogIndexer", failing_indexer)
+    monkeypatch.setattr(background.manager, "broadcast_notification", notify)
+
+    asyncio.run(background.start_log_indexer())
+    error_sink.flush()
+
+    [event] = repository.get_recent_errors()
+    assert (event.component, event.details) == ("log_indexer", "logs dir missing")
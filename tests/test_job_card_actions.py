@@ -0,0 +1,106 @@
+"""
+Tests for Start/Pause/Delete buttons that update only their own job card
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi_app import templates
+from models.job import Job
+from storage.job_storage import JobStorage
+
+
+@pytest.fixture
+def job(manager, tmp_path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    src.mkdir()
+    dest.mkdir()
+    _, _, job = manager.create_job("photos", str(src), str(dest), Job.TYPE_RSYNC)
+    JobStorage._write_queue.join()
+    return job
+
+
+def _card_headers(job_id):
+    return {'HX-Request': 'true', 'HX-Target': f'job-{job_id}'}
+
+
+def test_card_buttons_target_their_own_card(manager, job):
+    html = templates.env.get_template('partials/jobs_list.html').render(jobs=manager.list_jobs())
+    card = BeautifulSoup(html, 'html.parser').find(id=f'job-{job.id}')
+
+    targets = {el['hx-target'] for el in card.find_all(attrs={'hx-target': True})}
+
+    assert card['data-job-id'] == job.id
+    assert targets == {f'#job-{job.id}'}
+
+
+def test_first_card_expands_by_default(manager, job):
+    html = templates.env.get_template('partials/jobs_list.html').render(jobs=manager.list_jobs())
+
+    assert ": true," in BeautifulSoup(html, 'html.parser').find(id=f'job-{job.id}')['x-data']
+
+
+class _FakeEngine:
+    """Running engine that stops when asked"""
+
+    def is_running(self):
+        return True
+
+    def get_progress(self):
+        return {'percent': 40}
+
+    def stop(self):
+        return True
+
+
+def _mark_running(manager, job):
+    job.update_status(Job.STATUS_RUNNING)
+    manager.storage.update_job(job)
+    JobStorage._write_queue.join()
+    manager.invalidate_job_list_cache()
+
+
+def test_card_action_returns_only_that_card(client, manager, job):
+    """A failed pause re-renders the card and sends the flash out-of-band"""
+    _mark_running(manager, job)
+    response = client.post(f'/jobs/{job.id}/pause', headers=_card_headers(job.id))
+    soup = BeautifulSoup(response.text, 'html.parser')
+
+    assert response.status_code == 200
+    assert [el['data-job-id'] for el in soup.find_all(attrs={'data-job-id': True})] == [job.id]
+    assert soup.find(id='jobs-content') is None
+    flash = soup.find(id='flash-messages')
+    assert flash['hx-swap-oob'] == 'true'
+    assert 'Failed to pause job' in flash.text
+
+
+def test_card_pause_removes_the_card(client, manager, job):
+    """A paused job leaves the running-only Jobs list"""
+    _mark_running(manager, job)
+    manager.engines[job.id] = _FakeEngine()
+
+    response = client.post(f'/jobs/{job.id}/pause', headers=_card_headers(job.id))
+    soup = BeautifulSoup(response.text, 'html.parser')
+
+    assert soup.find(attrs={'data-job-id': True}) is None
+    assert 'Job paused successfully' in soup.find(id='flash-messages').text
+
+
+def test_card_delete_removes_the_card(client, manager, job):
+    response = client.delete(f'/jobs/{job.id}/delete', headers=_card_headers(job.id))
+    soup = BeautifulSoup(response.text, 'html.parser')
+
+    assert response.status_code == 200
+    assert soup.find(attrs={'data-job-id': True}) is None
+    assert 'Job deleted successfully' in soup.find(id='flash-messages').text
+
+
+def test_list_targeted_action_still_returns_the_list(client, job):
+    response = client.post(f'/jobs/{job.id}/pause', headers={'HX-Request': 'true', 'HX-Target': 'jobs-content'})
+
+    assert BeautifulSoup(response.text, 'html.parser').find(id='jobs-list') is not None
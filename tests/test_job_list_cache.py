@@ -0,0 +1,226 @@
+"""
+Tests for the JobManager.list_jobs() cache
+
+Covers TTL reuse, invalidation on mutation and invalidation after
+out-of-band storage writes (crash recovery).
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.job import Job
+from services.dashboard_service import recover_interrupted_jobs
+from storage.job_storage import JobStorage
+
+
+def _flush_writes():
+    """Wait for queued JobStorage writes to hit disk"""
+    JobStorage._write_queue.join()
+
+
+@pytest.fixture
+def job_paths(tmp_path):
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    src.mkdir()
+    dest.mkdir()
+    return str(src), str(dest)
+
+
+def test_list_jobs_reuses_cache_within_ttl(manager, monkeypatch):
+    """A second call inside the TTL must not touch storage"""
+    manager.JOB_LIST_CACHE_TTL = 60.0
+    first = manager.list_jobs()
+
+    def fail_load():
+        raise AssertionError("storage read while cache is fresh")
+
+    monkeypatch.setattr(manager.storage, "load_jobs", fail_load)
+
+    assert manager.list_jobs() is first
+
+
+def test_out_of_band_write_invalidates_cache(manager, job_paths):
+    """Editing the jobs file directly is seen without waiting for the TTL"""
+    manager.JOB_LIST_CACHE_TTL = 60.0
+    assert manager.list_jobs() == []
+
+    src, dest = job_paths
+    manager.storage._write_jobs_immediate([Job("external", src, dest, Job.TYPE_RSYNC)])
+
+    assert [j['name'] for j in manager.list_jobs()] == ["external"]
+
+
+def test_create_job_invalidates_cache(manager, job_paths):
+    manager.JOB_LIST_CACHE_TTL = 60.0
+    assert manager.list_jobs() == []
+
+    src, dest = job_paths
+    success, _, _ = manager.create_job("cached", src, dest, Job.TYPE_RSYNC)
+    assert success
+    _flush_writes()
+
+    assert [j['name'] for j in manager.list_jobs()] == ["cached"]
+
+
+def test_recover_interrupted_jobs_invalidates_cache(manager, job_paths):
+    manager.JOB_LIST_CACHE_TTL = 60.0
+    src, dest = job_paths
+    _, _, job = manager.create_job("interrupted", src, dest, Job.TYPE_RSYNC)
+    _flush_writes()
+    job.update_status(Job.STATUS_RUNNING)
+    manager.storage.update_job(job)
+    _flush_writes()
+    manager.invalidate_job_list_cache()
+
+    assert manager.list_jobs()[0]['status'] == 'running'
+
+    count, _ = recover_interrupted_jobs([job.id])
+    _flush_writes()
+
+    assert count == 1
+    assert manager.list_jobs()[0]['status'] == 'paused'
+
+
+class _FakeEngine:
+    """Running engine whose progress advances on every read"""
+
+    def __init__(self):
+        self.percent = 0
+
+    def is_running(self):
+        return True
+
+    def get_progress(self):
+        self.percent += 10
+        return {'percent': self.percent}
+
+
+def test_cache_hit_overlays_live_progress(manager, job_paths, monkeypatch):
+    """Running jobs report current engine progress without a storage reload"""
+    manager.JOB_LIST_CACHE_TTL = 60.0
+    src, dest = job_paths
+    _, _, idle = manager.create_job("idle", src, dest, Job.TYPE_RSYNC)
+    _flush_writes()
+    _, _, busy = manager.create_job("busy", src, dest, Job.TYPE_RSYNC)
+    _flush_writes()
+    manager.engines[busy.id] = _FakeEngine()
+    first = {j['name']: j for j in manager.list_jobs()}
+
+    def fail_load():
+        raise AssertionError("storage read while cache is fresh")
+
+    monkeypatch.setattr(manager.storage, "load_jobs", fail_load)
+    second = {j['name']: j for j in manager.list_jobs()}
+
+    assert first['busy']['progress'] == {'percent': 10}
+    assert second['busy']['progress'] == {'percent': 20}
+    assert second['idle'] is first['idle']
+
+
+def test_importing_job_manager_skips_start_only_modules():
+    """Engines and validators are loaded by start_job(), not at import time"""
+    import subprocess
+
+    code = (
+        "import sys, core.job_manager; "
+        "print(','.join(m for m in ('engines.rsync_engine', 'utils.validation', "
+        "'utils.safety_checks', 'utils.deletion_logger') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(Path(__file__).parent.parent),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_list_jobs_reads_storage_once(manager, job_paths, monkeypatch):
+    """Job info is built from the loaded list, not re-fetched per job"""
+    src, dest = job_paths
+    for name in ("a", "b", "c"):
+        manager.create_job(name, src, dest, Job.TYPE_RSYNC)
+        _flush_writes()
+
+    def fail_get_job(job_id):
+        raise AssertionError("per-job storage read")
+
+    monkeypatch.setattr(manager.storage, "get_job", fail_get_job)
+
+    assert sorted(j['name'] for j in manager.list_jobs()) == ["a", "b", "c"]
+
+
+def test_get_job_status_reads_storage_once(manager, job_paths, monkeypatch):
+    """Polling a job's status is served from the job cache"""
+    src, dest = job_paths
+    _, _, job = manager.create_job("polled", src, dest, Job.TYPE_RSYNC)
+    _flush_writes()
+    assert manager.get_job_status(job.id)['name'] == "polled"
+
+    def fail_load():
+        raise AssertionError("storage read while jobs file is unchanged")
+
+    monkeypatch.setattr(manager.storage, "load_jobs", fail_load)
+
+    assert manager.get_job_status(job.id)['status'] == Job.STATUS_PENDING
+    assert manager.get_job_status("missing") is None
+
+
+def test_job_cache_follows_out_of_band_writes(manager, job_paths):
+    src, dest = job_paths
+    _, _, job = manager.create_job("edited", src, dest, Job.TYPE_RSYNC)
+    _flush_writes()
+    assert manager.get_job_status(job.id)['status'] == Job.STATUS_PENDING
+
+    job.update_status(Job.STATUS_FAILED)
+    manager.storage._write_jobs_immediate([job])
+
+    assert manager.get_job_status(job.id)['status'] == Job.STATUS_FAILED
+
+
+def test_job_copies_do_not_leak_into_cache(manager, job_paths):
+    """Changes are only cached once saved"""
+    src, dest = job_paths
+    _, _, job = manager.create_job("copied", src, dest, Job.TYPE_RSYNC)
+    _flush_writes()
+
+    copy = manager._get_job(job.id)
+    copy.update_status(Job.STATUS_RUNNING)
+    assert manager.get_job_status(job.id)['status'] == Job.STATUS_PENDING
+
+    assert manager._save_job(copy)
+    assert manager.get_job_status(job.id)['status'] == Job.STATUS_RUNNING
+
+
+class _StoppedEngine:
+    """Engine whose job finished"""
+
+    def is_running(self):
+        return False
+
+    def get_progress(self):
+        return {'status': 'completed', 'percent': 100}
+
+
+def test_update_from_engine_reads_jobs_from_cache(manager, job_paths, monkeypatch):
+    """The concurrent-modification check compares against the job cache"""
+    src, dest = job_paths
+    _, _, job = manager.create_job("finished", src, dest, Job.TYPE_RSYNC)
+    _flush_writes()
+    manager.engines[job.id] = _StoppedEngine()
+
+    def fail_get_job(job_id):
+        raise AssertionError("storage read while updating from engine")
+
+    monkeypatch.setattr(manager.storage, "get_job", fail_get_job)
+
+    assert manager.update_job_from_engine(job.id) == (
+        True, "Job completed with status: completed"
+    )
+    assert manager.get_job_status(job.id)['status'] == Job.STATUS_COMPLETED
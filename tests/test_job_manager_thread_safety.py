@@ -357,3 +357,30 @@ class TestJobManagerThreadSafety:
 
         # Check for errors
         assert len(errors) == 0, f"Encountered errors: {errors}"
+
+    def test_concurrent_first_construction_shares_one_instance(self):
+        """
+        Test that threads racing to build the singleton all get the same object
+
+        The background monitor and request handlers can call JobManager() at
+        the same moment on startup; each must see one storage and engines dict.
+        """
+        JobManager._instance = None
+        JobManager._initialized = False
+        barrier = threading.Barrier(8)
+        managers = []
+
+        def construct():
+            barrier.wait()
+            managers.append(JobManager())
+
+        threads = [threading.Thread(target=construct) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(managers) == 8
+        assert len({id(m) for m in managers}) == 1
+        assert len({id(m.engines) for m in managers}) == 1
+        self.manager = managers[0]
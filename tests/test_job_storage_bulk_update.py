@@ -0,0 +1,87 @@
+"""
+Tests for JobStorage batch updates and the batched crash recovery built on them
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.job import Job
+from storage.job_storage import JobStorage
+
+
+def _flush_writes():
+    """Wait for queued JobStorage writes to hit disk"""
+    JobStorage._write_queue.join()
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = JobStorage(str(tmp_path / "jobs.yaml"))
+    yield storage
+    _flush_writes()
+
+
+def _make_jobs(tmp_path, count):
+    jobs = []
+    for i in range(count):
+        job = Job(name=f"job-{i}", source=str(tmp_path), dest=str(tmp_path), job_type=Job.TYPE_RSYNC)
+        job.update_status(Job.STATUS_RUNNING)
+        jobs.append(job)
+    return jobs
+
+
+def test_bulk_update_status_reads_and_writes_once(storage, tmp_path, monkeypatch):
+    jobs = _make_jobs(tmp_path, 3)
+    jobs[2].update_status(Job.STATUS_COMPLETED)
+    storage._write_jobs_immediate(jobs)
+
+    loads, writes = [], []
+    load_jobs = storage.load_jobs
+    monkeypatch.setattr(storage, "load_jobs", lambda: loads.append(1) or load_jobs())
+    monkeypatch.setattr(storage, "_write_jobs", lambda jobs: writes.append(jobs))
+
+    ids = [job.id for job in jobs] + ["missing"]
+    assert storage.bulk_update_status(ids, Job.STATUS_PAUSED, from_status=Job.STATUS_RUNNING) == 2
+    assert len(loads) == 1
+    assert len(writes) == 1
+    assert [j.status for j in writes[0]] == [Job.STATUS_PAUSED, Job.STATUS_PAUSED, Job.STATUS_COMPLETED]
+
+
+def test_bulk_update_status_without_matches_does_not_write(storage, tmp_path, monkeypatch):
+    jobs = _make_jobs(tmp_path, 2)
+    storage._write_jobs_immediate(jobs)
+
+    writes = []
+    monkeypatch.setattr(storage, "_write_jobs", lambda jobs: writes.append(jobs))
+
+    assert storage.bulk_update_status([], Job.STATUS_PAUSED) == 0
+    assert storage.bulk_update_status([jobs[0].id], Job.STATUS_PAUSED, from_status=Job.STATUS_FAILED) == 0
+    assert writes == []
+
+
+def test_recover_interrupted_jobs_pauses_in_one_write(storage, tmp_path, monkeypatch):
+    from core.job_manager import JobManager
+    from services.dashboard_service import recover_interrupted_jobs
+
+    JobManager._instance = None
+    JobManager._initialized = False
+    manager = JobManager()
+    manager.storage = storage
+    try:
+        jobs = _make_jobs(tmp_path, 3)
+        storage._write_jobs_immediate(jobs)
+
+        writes = []
+        monkeypatch.setattr(storage, "_write_jobs", lambda jobs: (writes.append(jobs), storage._write_jobs_immediate(jobs)))
+
+        count, _ = recover_interrupted_jobs([job.id for job in jobs])
+
+        assert count == 3
+        assert len(writes) == 1
+        assert {job.status for job in storage.load_jobs()} == {Job.STATUS_PAUSED}
+    finally:
+        JobManager._instance = None
+        JobManager._initialized = False
@@ -0,0 +1,81 @@
+"""
+Tests for the mtime-keyed parse cache in JobStorage
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import storage.job_storage as job_storage
+from models.job import Job
+from storage.job_storage import JobStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = JobStorage(str(tmp_path / "jobs.yaml"))
+    job = Job(name="photos", source=str(tmp_path), dest=str(tmp_path), job_type=Job.TYPE_RSYNC)
+    storage._write_jobs_immediate([job])
+    return storage
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    parses = []
+    real_load = job_storage.yaml.load
+
+    def counting_load(stream, Loader):
+        parses.append(Loader)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(job_storage.yaml, "load", counting_load)
+    return parses
+
+
+def test_unchanged_file_is_parsed_once(storage, count_parses):
+    first = storage.load_jobs()
+    second = storage.load_jobs()
+
+    assert [j.name for j in first] == [j.name for j in second] == ["photos"]
+    assert len(count_parses) == 1
+
+
+def test_rewrite_is_picked_up(storage, tmp_path, count_parses):
+    storage.load_jobs()
+
+    job = Job(name="music", source=str(tmp_path), dest=str(tmp_path), job_type=Job.TYPE_RSYNC)
+    storage._write_jobs_immediate(storage.load_jobs() + [job])
+
+    assert [j.name for j in storage.load_jobs()] == ["photos", "music"]
+    assert len(count_parses) == 2
+
+
+def test_replacement_within_one_mtime_tick_is_picked_up(storage, tmp_path, count_parses):
+    """A same-size file swapped in with the old mtime still misses the cache"""
+    path = tmp_path / "jobs.yaml"
+    storage.load_jobs()
+    before = path.stat()
+
+    replacement = tmp_path / "jobs.yaml.new"
+    replacement.write_text(path.read_text().replace("photos", "videos"))
+    os.replace(replacement, path)
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert path.stat().st_size == before.st_size
+
+    assert [j.name for j in storage.load_jobs()] == ["videos"]
+    assert len(count_parses) == 2
+
+
+def test_callers_cannot_mutate_the_cache(storage):
+    job = storage.load_jobs()[0]
+    original_settings = dict(job.settings)
+    job.progress['percent'] = 99
+    job.settings['marker'] = True
+
+    fresh = storage.load_jobs()[0]
+
+    assert fresh.progress['percent'] == 0
+    assert fresh.settings == original_settings
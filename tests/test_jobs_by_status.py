@@ -0,0 +1,121 @@
+"""
+Tests for status-filtered job queries used by startup crash recovery
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.job_manager import JobManager
+from models.job import Job
+from storage.job_storage import JobStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return JobStorage(str(tmp_path / "jobs.yaml"))
+
+
+def _jobs(tmp_path):
+    jobs = []
+    for name, status in [("a", Job.STATUS_RUNNING), ("b", Job.STATUS_PAUSED),
+                         ("c", Job.STATUS_RUNNING), ("d", Job.STATUS_COMPLETED)]:
+        job = Job(name=name, source=str(tmp_path), dest=str(tmp_path), job_type=Job.TYPE_RSYNC)
+        job.status = status
+        jobs.append(job)
+    return jobs
+
+
+def test_manager_list_jobs_by_status_matches_list_jobs(storage, tmp_path):
+    JobManager._instance = None
+    JobManager._initialized = False
+    try:
+        manager = JobManager()
+        manager.storage = storage
+        storage._write_jobs_immediate(_jobs(tmp_path))
+
+        running = manager.list_jobs_by_status(Job.STATUS_RUNNING)
+
+        expected = [j for j in manager.list_jobs() if j['status'] == Job.STATUS_RUNNING]
+        assert running == expected
+    finally:
+        JobManager._instance = None
+        JobManager._initialized = False
+
+
+def test_startup_recovery_pauses_jobs_left_running(storage, tmp_path):
+    from services.dashboard_service import recover_jobs_left_running
+
+    JobManager._instance = None
+    JobManager._initialized = False
+    try:
+        manager = JobManager()
+        manager.storage = storage
+        storage._write_jobs_immediate(_jobs(tmp_path))
+
+        count, _ = recover_jobs_left_running()
+        JobStorage._write_queue.join()
+
+        assert count == 2
+        assert {j['name']: j['status'] for j in manager.list_jobs()} == {
+            "a": Job.STATUS_PAUSED, "b": Job.STATUS_PAUSED,
+            "c": Job.STATUS_PAUSED, "d": Job.STATUS_COMPLETED,
+        }
+        assert recover_jobs_left_running()[0] == 0
+    finally:
+        JobManager._instance = None
+        JobManager._initialized = False
+
+
+def test_startup_recovery_runs_off_the_event_loop(tmp_path, monkeypatch):
+    """The recovery scan runs in a worker thread, not on the event loop"""
+    import asyncio
+    import threading
+    import fastapi_app
+    import services.dashboard_service as dashboard_service
+
+    calls = []
+
+    def fake_recover():
+        calls.append(threading.current_thread() is threading.main_thread())
+        return 0, 'No interrupted jobs to recover'
+
+    monkeypatch.setattr(dashboard_service, "recover_jobs_left_running", fake_recover)
+
+    async def run():
+        await fastapi_app._recover_jobs_on_startup()
+
+    asyncio.run(run())
+
+    assert calls == [False]
+
+
+def test_recovery_keeps_a_job_created_just_before_it(storage, tmp_path, monkeypatch):
+    """The bulk pause sees jobs whose writes were still queued"""
+    import time
+    from services.dashboard_service import recover_interrupted_jobs
+
+    # Keep the create's write queued while recovery runs
+    perform_write = JobStorage._perform_write
+    monkeypatch.setattr(JobStorage, "_perform_write",
+                        staticmethod(lambda jobs, path: (time.sleep(0.1), perform_write(jobs, path))))
+
+    JobManager._instance = None
+    JobManager._initialized = False
+    try:
+        manager = JobManager()
+        manager.storage = storage
+        jobs = _jobs(tmp_path)
+        storage._write_jobs_immediate(jobs)
+
+        _, _, created = manager.create_job("new", str(tmp_path), str(tmp_path), Job.TYPE_RSYNC)
+        count, _ = recover_interrupted_jobs([job.id for job in jobs])
+
+        assert count == 2
+        assert storage.get_job(created.id) is not None
+    finally:
+        JobStorage._write_queue.join()
+        JobManager._instance = None
+        JobManager._initialized = False
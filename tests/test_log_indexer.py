@@ -0,0 +1,125 @@
+"""
+Tests for incremental log file indexing
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.log_indexer as log_indexer
+import core.log_repository as log_repository
+from core.database import close_connection
+from core.log_indexer import LogIndexer
+
+
+@pytest.fixture
+def indexer(tmp_path, monkeypatch):
+    """LogIndexer on a temporary database and logs directory"""
+    db_path = tmp_path / "logs.db"
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    monkeypatch.setattr(log_indexer, "get_db_path", lambda: db_path)
+    monkeypatch.setattr(log_indexer, "get_logs_dir", lambda: logs_dir)
+    monkeypatch.setattr(log_repository, "get_db_path", lambda: db_path)
+    close_connection()
+    yield LogIndexer()
+    close_connection()
+
+
+def _index(indexer, log):
+    asyncio.run(indexer._index_log_file(log, {'abc': 'Photos'}))
+
+
+def _messages(indexer):
+    return [r['message'] for r in sorted(indexer.repository.search_logs(limit=1000),
+                                         key=lambda r: r['line_number'])]
+
+
+def test_indexes_new_lines_incrementally(indexer):
+    log = indexer.logs_dir / "rsync_abc.log"
+    log.write_text("[2025-01-01 10:00:00] Starting\n\nERROR: disk full\n")
+    _index(indexer, log)
+
+    with open(log, 'a') as f:
+        f.write("[2025-01-01 10:05:00] Completed\n")
+    _index(indexer, log)
+
+    rows = sorted(indexer.repository.search_logs(limit=1000), key=lambda r: r['line_number'])
+    assert [(r['line_number'], r['level'], r['job_name']) for r in rows] == [
+        (1, 'INFO', 'Photos'), (2, 'ERROR', 'Photos'), (3, 'INFO', 'Photos')
+    ]
+    assert indexer.repository.get_checkpoint(str(log)) == (log.stat().st_size, 3)
+
+
+def test_partial_trailing_line_waits_for_its_newline(indexer):
+    log = indexer.logs_dir / "rsync_abc.log"
+    log.write_bytes(b"first\nsecond half-wri")
+    _index(indexer, log)
+
+    assert _messages(indexer) == ["first"]
+
+    with open(log, 'ab') as f:
+        f.write(b"tten\n")
+    _index(indexer, log)
+
+    assert _messages(indexer) == ["first", "second half-written"]
+
+
+def test_failed_insert_keeps_checkpoint(indexer, monkeypatch):
+    log = indexer.logs_dir / "rsync_abc.log"
+    log.write_text("one\ntwo\n")
+    monkeypatch.setattr(indexer.repository, "insert_batch", lambda entries: next(iter(entries)) and 0)
+    _index(indexer, log)
+
+    assert indexer.repository.get_checkpoint(str(log)) is None
+
+
+def test_invalid_utf8_is_replaced(indexer):
+    log = indexer.logs_dir / "rsync_abc.log"
+    log.write_bytes(b"bad \xff byte\n")
+    _index(indexer, log)
+
+    assert _messages(indexer) == ["bad � byte"]
+
+
+class _NoJobs:
+    def list_jobs(self):
+        return []
+
+
+def test_unchanged_files_are_skipped_between_passes(indexer, monkeypatch):
+    monkeypatch.setattr(log_indexer, "JobManager", _NoJobs)
+    log = indexer.logs_dir / "rsync_abc.log"
+    log.write_text("one\n")
+    asyncio.run(indexer._index_all_logs())
+
+    def fail_index(*args):
+        raise AssertionError("unchanged log file indexed again")
+
+    monkeypatch.setattr(indexer, "_index_log_file", fail_index)
+    asyncio.run(indexer._index_all_logs())
+
+    monkeypatch.undo()
+    monkeypatch.setattr(log_indexer, "JobManager", _NoJobs)
+    with open(log, 'a') as f:
+        f.write("two\n")
+    asyncio.run(indexer._index_all_logs())
+
+    assert _messages(indexer) == ["one", "two"]
+
+
+def test_failed_file_is_retried_next_pass(indexer, monkeypatch):
+    monkeypatch.setattr(log_indexer, "JobManager", _NoJobs)
+    log = indexer.logs_dir / "rsync_abc.log"
+    log.write_text("one\n")
+    insert_batch = indexer.repository.insert_batch
+    monkeypatch.setattr(indexer.repository, "insert_batch", lambda entries: 0)
+    asyncio.run(indexer._index_all_logs())
+
+    monkeypatch.setattr(indexer.repository, "insert_batch", insert_batch)
+    asyncio.run(indexer._index_all_logs())
+
+    assert _messages(indexer) == ["one"]
@@ -0,0 +1,243 @@
+"""
+Unit tests for utils.log_reader
+"""
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.log_reader as log_reader
+from utils.log_reader import read_last_lines, tail_matching, tail_search, list_log_files, parse_log_level, find_timestamp, parse_log_timestamp
+
+
+class TestReadLastLines:
+    """Test backward block tail reading"""
+
+    def test_returns_last_n_lines(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("".join(f"line {i}\n" for i in range(100)))
+
+        assert read_last_lines(log, 3) == ["line 97", "line 98", "line 99"]
+
+    def test_spans_multiple_blocks(self, tmp_path):
+        """Long lines must not cause fewer than N lines to be returned"""
+        log = tmp_path / "job.log"
+        lines = [f"{i:04d} " + "x" * 3000 for i in range(50)]
+        log.write_text("\n".join(lines) + "\n")
+
+        result = read_last_lines(log, 10, block_size=512)
+
+        assert result == lines[-10:]
+
+    def test_file_shorter_than_n(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("first\nsecond")
+
+        assert read_last_lines(log, 50) == ["first", "second"]
+
+    def test_empty_and_missing_files(self, tmp_path):
+        empty = tmp_path / "empty.log"
+        empty.write_text("")
+
+        assert read_last_lines(empty, 5) == []
+        assert read_last_lines(tmp_path / "missing.log", 5) == []
+
+    def test_invalid_utf8_is_ignored(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_bytes(b"ok\nbad \xff byte\nend\n")
+
+        assert read_last_lines(log, 2) == ["bad  byte", "end"]
+
+    def test_crlf_line_endings(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_bytes(b"one\r\ntwo\r\nthree\r\n")
+
+        assert read_last_lines(log, 2) == ["two", "three"]
+
+    def test_multibyte_characters_split_across_blocks(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("caf\u00e9 \u2713\n" * 20, encoding="utf-8")
+
+        assert read_last_lines(log, 15, block_size=7) == ["caf\u00e9 \u2713"] * 15
+
+
+class TestTailMatching:
+    """Test backward reading until N matching lines are found"""
+
+    def test_returns_last_n_matches(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("".join(f"{'ERROR' if i % 10 == 0 else 'ok'} {i}\n" for i in range(100)))
+
+        result = tail_matching(log, 3, lambda line: line.startswith("ERROR"), block_size=16)
+
+        assert result == ["ERROR 70", "ERROR 80", "ERROR 90"]
+
+    def test_stops_at_max_bytes(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("ERROR old\n" + "ok\n" * 1000)
+
+        assert tail_matching(log, 1, lambda line: "ERROR" in line, max_bytes=512, block_size=64) == []
+        assert tail_matching(log, 1, lambda line: "ERROR" in line, max_bytes=10_000) == ["ERROR old"]
+
+    def test_lines_spanning_blocks(self, tmp_path):
+        log = tmp_path / "job.log"
+        lines = [f"{i:03d} " + "x" * 100 for i in range(20)]
+        log.write_text("\r\n".join(lines) + "\r\n")
+
+        assert tail_matching(log, 5, lambda line: True, block_size=7) == lines[-5:]
+        assert tail_matching(log, 50, lambda line: True, block_size=7) == lines
+
+    def test_missing_file(self, tmp_path):
+        assert tail_matching(tmp_path / "missing.log", 5, lambda line: True) == []
+
+
+class TestTailSearch:
+    """Test memory-mapped search for lines containing a term"""
+
+    def test_returns_last_n_matches_ignoring_case(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("".join(f"{'Disk' if i % 10 == 0 else 'ok'} {i}\r\n" for i in range(100)))
+
+        assert tail_search(log, 3, "DISK") == ["Disk 70", "Disk 80", "Disk 90"]
+
+    def test_one_entry_per_line_with_repeated_term(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("aa aa aa\nb\naa\n")
+
+        assert tail_search(log, 10, "aa") == ["aa aa aa", "aa"]
+
+    def test_predicate_filters_matches(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("ERROR disk\nINFO disk\nERROR net\n")
+
+        assert tail_search(log, 5, "disk", lambda line: line.startswith("ERROR")) == ["ERROR disk"]
+
+    def test_stops_at_max_bytes_and_skips_cut_line(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("needle old\n" + "ok\n" * 1000 + "last needle")
+
+        assert tail_search(log, 5, "needle", max_bytes=512) == ["last needle"]
+        assert tail_search(log, 5, "needle", max_bytes=10_000) == ["needle old", "last needle"]
+        assert tail_search(log, 5, "needle", max_bytes=len("last needle") + 2) == ["last needle"]
+
+    def test_non_ascii_term_matches_like_tail_matching(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("CAF\u00c9 opened\nother\n", encoding="utf-8")
+
+        assert tail_search(log, 5, "caf\u00e9") == ["CAF\u00c9 opened"]
+
+    def test_non_ascii_content_keeps_match_offsets(self, tmp_path):
+        log = tmp_path / "job.log"
+        log.write_text("\u00c9t\u00e9 \u2713 DISK full\n\u00fcber ok\n\u65e5\u672c disk sync\n", encoding="utf-8")
+
+        assert tail_search(log, 5, "Disk") == ["\u00c9t\u00e9 \u2713 DISK full", "\u65e5\u672c disk sync"]
+
+    def test_empty_and_missing_files(self, tmp_path):
+        empty = tmp_path / "empty.log"
+        empty.write_text("")
+
+        assert tail_search(empty, 5, "x") == []
+        assert tail_search(tmp_path / "missing.log", 5, "x") == []
+
+
+class TestParseLogLevel:
+    """Test log level normalization"""
+
+    @pytest.mark.parametrize("line,expected", [
+        ("[2025-01-01 10:00:00] ERROR: disk full", "ERROR"),
+        ("rsync failed with code 23", "ERROR"),
+        ("warn: slow transfer", "WARNING"),
+        ("WARNING retrying", "WARNING"),
+        ("DEBUG chunk sent", "DEBUG"),
+        ("Backup completed", "INFO"),
+        ("Unhandled exception in worker", "ERROR"),
+        ("CRITICAL: out of memory", "ERROR"),
+        ("plain progress line", "INFO"),
+        ("INFO: recovered from exception", "INFO"),
+    ])
+    def test_levels(self, line, expected):
+        assert parse_log_level(line) == expected
+
+    def test_keyword_must_be_a_whole_word(self):
+        assert parse_log_level("errors_dir=/tmp/x") == "INFO"
+
+
+class TestTimestamps:
+    """Test timestamp extraction"""
+
+    def test_bracketed_timestamp_anywhere(self):
+        assert find_timestamp("rsync [2025/10/27 19:48:54] done") == "2025/10/27 19:48:54"
+
+    def test_leading_timestamp(self):
+        assert find_timestamp("2025-10-27 19:48:54 started") == "2025-10-27 19:48:54"
+
+    def test_no_timestamp(self):
+        assert find_timestamp("no time here") is None
+
+    def test_parse_both_separators(self):
+        expected = datetime(2025, 10, 27, 19, 48, 54)
+        assert parse_log_timestamp("2025-10-27 19:48:54") == expected
+        assert parse_log_timestamp("2025/10/27 19:48:54") == expected
+
+    def test_parse_invalid_date(self):
+        assert parse_log_timestamp("2025-13-40 19:48:54") is None
+
+    def test_parse_rejects_mixed_separators_and_garbage(self):
+        assert parse_log_timestamp("2025-10/27 19:48:54") is None
+        assert parse_log_timestamp("not a timestamp") is None
+
+
+class TestListLogFiles:
+    """Test log file discovery"""
+
+    def test_newest_first_and_filtered(self, tmp_path):
+        old = tmp_path / "rsync_old.log"
+        new = tmp_path / "rclone_new.log"
+        old.write_text("a\n")
+        new.write_text("b\n")
+        (tmp_path / "notes.txt").write_text("skip\n")
+        (tmp_path / "dir.log").mkdir()
+        os.utime(old, (1_000, 1_000))
+        os.utime(new, (2_000, 2_000))
+
+        assert list_log_files(tmp_path) == [(new, 2_000, 2), (old, 1_000, 2)]
+
+    def test_missing_directory(self, tmp_path):
+        assert list_log_files(tmp_path / "nope") == []
+
+    def test_listing_reused_until_directory_changes(self, tmp_path, monkeypatch):
+        log = tmp_path / "rsync_a.log"
+        log.write_text("a\n")
+        os.utime(tmp_path, (1_000, 1_000))
+        list_log_files(tmp_path)
+
+        def fail_scandir(path):
+            raise AssertionError("directory rescanned while unchanged")
+
+        monkeypatch.setattr(log_reader.os, "scandir", fail_scandir)
+        with log.open("a") as f:
+            f.write("appended\n")
+
+        # Appends are seen because files are still stat()ed
+        assert [f.size for f in list_log_files(tmp_path)] == [11]
+
+        monkeypatch.undo()
+        (tmp_path / "rclone_b.log").write_text("b\n")
+        os.utime(tmp_path, (2_000, 2_000))
+
+        assert sorted(f.path.name for f in list_log_files(tmp_path)) == ["rclone_b.log", "rsync_a.log"]
+
+    def test_recently_modified_directory_is_not_cached(self, tmp_path, monkeypatch):
+        (tmp_path / "rsync_a.log").write_text("a\n")
+        list_log_files(tmp_path)
+
+        scans = []
+        scandir = os.scandir
+        monkeypatch.setattr(log_reader.os, "scandir", lambda path: scans.append(path) or scandir(path))
+        list_log_files(tmp_path)
+
+        assert scans == [tmp_path]
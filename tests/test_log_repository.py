@@ -0,0 +1,282 @@
+"""
+Tests for LogRepository message search
+"""
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.database import close_connection, has_log_search_index, initialize_database
+from core.log_repository import LogRepository
+
+
+def _entry(job_id, message, line_number):
+    return (job_id, f"{job_id} job", datetime(2025, 1, 1, 10, 0, line_number), 'INFO',
+            message, f"/logs/rsync_{job_id}.log", line_number)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """LogRepository on a fresh database"""
+    close_connection()
+    repository = LogRepository()
+    repository.db_path = str(tmp_path / "logs.db")
+    initialize_database(repository.db_path)
+    yield repository
+    close_connection()
+
+
+def test_search_matches_substrings_case_insensitively(repo):
+    repo.insert_batch([
+        _entry('a', 'rsync: Connection reset by peer', 1),
+        _entry('a', 'sent 100 bytes', 2),
+        _entry('b', 'connection timed out', 3),
+    ])
+
+    assert sorted(r['message'] for r in repo.search_logs(search_term='CONNECT')) == [
+        'connection timed out', 'rsync: Connection reset by peer'
+    ]
+    assert [r['message'] for r in repo.search_logs(job_id='a', search_term='onnect')] == [
+        'rsync: Connection reset by peer'
+    ]
+
+
+def test_search_uses_full_text_index(repo):
+    repo.insert_batch([_entry('a', 'disk full', 1)])
+    with sqlite3.connect(repo.db_path) as conn:
+        # Empty the index while the row stays in log_entries
+        conn.execute("INSERT INTO log_entries_fts(log_entries_fts) VALUES ('delete-all')")
+
+    assert repo.search_logs(search_term='disk') == []
+    assert [r['message'] for r in repo.search_logs(search_term='di')] == ['disk full']
+
+
+def test_search_terms_are_literal(repo):
+    repo.insert_batch([
+        _entry('a', 'path "a b" OR NOT', 1),
+        _entry('a', '100% done', 2),
+        _entry('a', '1000 done', 3),
+    ])
+
+    assert [r['message'] for r in repo.search_logs(search_term='"a b" OR')] == ['path "a b" OR NOT']
+    assert [r['message'] for r in repo.search_logs(search_term='0% d')] == ['100% done']
+    assert repo.search_logs(search_term='10_0') == []
+
+
+def test_index_follows_updates_and_deletes(repo):
+    repo.insert_batch([_entry('a', 'old message', 1)])
+    with sqlite3.connect(repo.db_path) as conn:
+        conn.execute("UPDATE log_entries SET message = 'new message'")
+
+    assert repo.search_logs(search_term='old') == []
+    assert len(repo.search_logs(search_term='new')) == 1
+
+    with sqlite3.connect(repo.db_path) as conn:
+        conn.execute("DELETE FROM log_entries")
+
+    assert repo.search_logs(search_term='new') == []
+
+
+def test_index_is_built_for_existing_databases(tmp_path):
+    db_path = str(tmp_path / "old.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE log_entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL, job_name TEXT,
+                timestamp DATETIME NOT NULL, level TEXT, message TEXT, file_path TEXT NOT NULL,
+                line_number INTEGER, indexed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("INSERT INTO log_entries (job_id, timestamp, message, file_path) "
+                     "VALUES ('a', '2025-01-01', 'indexed before upgrade', '/x.log')")
+
+    close_connection()
+    try:
+        repo = LogRepository()
+        repo.db_path = db_path
+        initialize_database(db_path)
+
+        with sqlite3.connect(db_path) as conn:
+            assert has_log_search_index(conn)
+        assert [r['message'] for r in repo.search_logs(search_term='before')] == ['indexed before upgrade']
+    finally:
+        close_connection()
+
+
+def test_full_detail_index_is_rebuilt_without_positions(tmp_path):
+    db_path = str(tmp_path / "v1.db")
+    close_connection()
+    try:
+        initialize_database(db_path)
+        with sqlite3.connect(db_path) as conn:
+            # Recreate the index as the first schema version had it
+            conn.execute("DROP TABLE log_entries_fts")
+            conn.execute("CREATE VIRTUAL TABLE log_entries_fts USING fts5("
+                         "message, content='log_entries', content_rowid='id', tokenize='trigram')")
+            conn.execute("INSERT INTO log_entries (job_id, timestamp, message, file_path) "
+                         "VALUES ('a', '2025-01-01', 'written by v1', '/x.log')")
+
+        initialize_database(db_path)
+
+        with sqlite3.connect(db_path) as conn:
+            sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'log_entries_fts'").fetchone()[0]
+            triggers = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'log_entries'").fetchone()[0]
+        repo = LogRepository()
+        repo.db_path = db_path
+
+        assert 'detail=none' in sql
+        assert triggers == 3
+        assert [r['message'] for r in repo.search_logs(search_term='BY V1')] == ['written by v1']
+    finally:
+        close_connection()
+
+
+def test_bulk_insert_commits_once(repo):
+    """A generator of rows is inserted in chunks within a single transaction"""
+    from core.database import bulk_insert_log_entries, get_db
+
+    statements = []
+    with get_db(repo.db_path, write=True) as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            rows = (_entry('a', f'line {i}', i % 60) for i in range(2500))
+            assert bulk_insert_log_entries(repo.db_path, rows, chunk_size=1000) == 2500
+        finally:
+            conn.set_trace_callback(None)
+
+    assert [s for s in statements if s.split()[0] in ('BEGIN', 'COMMIT')] == ['BEGIN IMMEDIATE', 'COMMIT']
+    assert len(repo.search_logs(job_id='a', limit=5000)) == 2500
+    assert bulk_insert_log_entries(repo.db_path, iter(())) == 0
+
+
+def test_connection_tuning(tmp_path):
+    from core.database import get_db
+
+    close_connection()
+    try:
+        for write in (True, False):
+            with get_db(str(tmp_path / "new.db"), write=write) as conn:
+                assert conn.execute('PRAGMA page_size').fetchone()[0] == 8192
+                assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+                assert conn.execute('PRAGMA wal_autocheckpoint').fetchone()[0] == 10000
+                assert conn.execute('PRAGMA mmap_size').fetchone()[0] > 0
+    finally:
+        close_connection()
+
+
+def test_existing_database_keeps_its_page_size(tmp_path):
+    from core.database import get_db
+
+    db_path = str(tmp_path / "old.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('PRAGMA page_size=4096')
+        conn.execute('CREATE TABLE t (x)')
+
+    close_connection()
+    try:
+        with get_db(db_path) as conn:
+            assert conn.execute('PRAGMA page_size').fetchone()[0] == 4096
+    finally:
+        close_connection()
+
+
+def test_pool_reuses_a_bounded_set_of_connections(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from core.database import READ_POOL_SIZE, get_db
+
+    db_path = str(tmp_path / "pool.db")
+    close_connection()
+    try:
+        def reader(_):
+            with get_db(db_path) as conn:
+                conn.execute('SELECT 1').fetchone()
+                return id(conn)
+
+        with ThreadPoolExecutor(max_workers=READ_POOL_SIZE * 3) as executor:
+            readers = set(executor.map(reader, range(200)))
+
+        with get_db(db_path, write=True) as writer:
+            # Nested writes on the same thread share the write connection
+            with get_db(db_path, write=True) as nested:
+                assert nested is writer
+
+        assert len(readers) <= READ_POOL_SIZE
+        assert id(writer) not in readers
+    finally:
+        close_connection()
+
+
+def test_readers_are_opened_on_demand_and_read_only(tmp_path):
+    from core.database import _get_pool, get_db
+
+    db_path = str(tmp_path / "pool.db")
+    close_connection()
+    try:
+        for _ in range(5):
+            with get_db(db_path) as conn:
+                conn.execute('SELECT 1').fetchone()
+        assert _get_pool(db_path).readers.qsize() == 1
+
+        with pytest.raises(sqlite3.OperationalError):
+            with get_db(db_path) as conn:
+                conn.execute('CREATE TABLE t (x)')
+    finally:
+        close_connection()
+
+
+def test_recent_lines_for_a_job_come_from_the_covering_index(repo):
+    from core.database import get_db
+
+    with get_db(repo.db_path, write=True) as conn:
+        conn.execute('CREATE INDEX idx_job_id ON log_entries(job_id)')
+    initialize_database(repo.db_path)
+
+    with get_db(repo.db_path) as conn:
+        plan = [row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT job_id, timestamp, level, message FROM log_entries "
+            "WHERE job_id = ? AND level = ? ORDER BY timestamp DESC LIMIT 500", ('a', 'ERROR')
+        )]
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    assert plan == ['SEARCH log_entries USING COVERING INDEX idx_job_time_covering (job_id=?)']
+    assert 'idx_job_id' not in indexes
+
+
+def test_single_and_batch_inserts_share_one_statement(repo):
+    from core.database import INSERT_LOG_SQL, get_db
+
+    statements = []
+    with get_db(repo.db_path, write=True) as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            assert repo.insert_log_entry(*_entry('a', 'single', 1))
+            assert repo.insert_batch([_entry('a', 'batched', 2)]) == 1
+        finally:
+            conn.set_trace_callback(None)
+
+    inserts = {s for s in statements if s.startswith('INSERT INTO log_entries ')}
+    assert len(inserts) == 2
+    assert all(s.startswith(INSERT_LOG_SQL.split('VALUES')[0]) for s in inserts)
+    assert sorted(r['message'] for r in repo.search_logs(job_id='a')) == ['batched', 'single']
+
+
+def test_checkpoint_truncates_the_wal(repo):
+    import os
+
+    from core.database import WAL_SIZE_LIMIT, checkpoint_wal, get_db
+
+    repo.insert_batch(_entry('a', f'line {i}', i % 60) for i in range(2000))
+    wal = repo.db_path + '-wal'
+    assert os.path.getsize(wal) > 0
+
+    busy, wal_pages, checkpointed = checkpoint_wal(repo.db_path)
+
+    assert busy == 0 and checkpointed == wal_pages
+    assert os.path.getsize(wal) == 0
+    with get_db(repo.db_path) as conn:
+        assert conn.execute('PRAGMA journal_size_limit').fetchone()[0] == WAL_SIZE_LIMIT
@@ -0,0 +1,202 @@
+"""
+Tests for the file-based log reader used when the log database is unavailable
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import fastapi_app.routers.logs as logs_router
+from fastapi_app.routers.logs import get_all_logs, parse_log_tail
+
+JOBS = [{'id': 'abc', 'name': 'Photos'}]
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    parse_log_tail.cache_clear()
+    yield
+    parse_log_tail.cache_clear()
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    log = tmp_path / "rsync_abc.log"
+    log.write_text(
+        "[2025-01-01 10:00:00] Starting backup\n"
+        "[2025-01-01 10:00:05] ERROR: permission denied\n"
+    )
+    os.utime(log, (1_000, 1_000))
+    return tmp_path
+
+
+def test_maps_job_names_and_parses_lines(logs_dir):
+    logs = get_all_logs(logs_dir, jobs=JOBS)
+
+    assert [(l['job_name'], l['level'], l['timestamp']) for l in logs] == [
+        ('Photos', 'INFO', '2025-01-01 10:00:00'),
+        ('Photos', 'ERROR', '2025-01-01 10:00:05'),
+    ]
+
+
+def test_unchanged_file_is_not_reread(logs_dir, monkeypatch):
+    get_all_logs(logs_dir, jobs=JOBS)
+    get_all_logs(logs_dir, level_filter='ERROR', jobs=JOBS)
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("unchanged log file was read again")
+
+    monkeypatch.setattr(logs_router, "read_last_lines", fail_read)
+    monkeypatch.setattr(logs_router, "tail_matching", fail_read)
+
+    assert len(get_all_logs(logs_dir, jobs=JOBS)) == 2
+    assert len(get_all_logs(logs_dir, level_filter='ERROR', jobs=JOBS)) == 1
+
+
+def test_level_filter_reaches_past_the_line_budget(tmp_path):
+    log = tmp_path / "rsync_abc.log"
+    log.write_text("ERROR: early failure\n" + "".join(f"copied file {i}\n" for i in range(50)))
+
+    logs = get_all_logs(tmp_path, level_filter='ERROR', max_lines=10, jobs=JOBS)
+
+    assert [l['line'] for l in logs] == ["ERROR: early failure"]
+
+
+def test_appended_file_is_reread(logs_dir):
+    get_all_logs(logs_dir, jobs=JOBS)
+
+    log = logs_dir / "rsync_abc.log"
+    with open(log, 'a') as f:
+        f.write("[2025-01-01 10:01:00] Backup completed\n")
+    os.utime(log, (2_000, 2_000))
+
+    assert get_all_logs(logs_dir, jobs=JOBS)[-1]['line'].endswith("Backup completed")
+
+
+def test_stops_after_max_lines_from_newest_files(logs_dir, monkeypatch):
+    newer = logs_dir / "rclone_new.log"
+    newer.write_text("".join(f"new {i}\n" for i in range(5)))
+    os.utime(newer, (5_000, 5_000))
+
+    opened = []
+    real_parse = logs_router.parse_log_tail
+
+    def tracking_parse(log_path, *args):
+        opened.append(Path(log_path).name)
+        return real_parse(log_path, *args)
+
+    monkeypatch.setattr(logs_router, "parse_log_tail", tracking_parse)
+    monkeypatch.setattr(logs_router, "LOG_PARSE_WORKERS", 1)
+
+    logs = get_all_logs(logs_dir, max_lines=3, jobs=JOBS)
+
+    assert [l['line'] for l in logs] == ["new 2", "new 3", "new 4"]
+    assert opened == ["rclone_new.log"]
+
+
+def test_concurrent_batches_keep_newest_first_order(tmp_path, monkeypatch):
+    for i in range(5):
+        log = tmp_path / f"rsync_job{i}.log"
+        log.write_text(f"file {i} line a\nfile {i} line b\n")
+        os.utime(log, (1_000 + i, 1_000 + i))
+    monkeypatch.setattr(logs_router, "LOG_PARSE_WORKERS", 2)
+
+    logs = get_all_logs(tmp_path, jobs=[])
+
+    assert [l['line'] for l in logs] == [
+        f"file {i} line {part}" for i in reversed(range(5)) for part in "ab"
+    ]
+    assert [l['line_number'] for l in logs] == list(range(1, 11))
+
+
+def test_search_is_case_insensitive_and_stops_at_budget(tmp_path):
+    for i in range(3):
+        log = tmp_path / f"rsync_job{i}.log"
+        log.write_text(f"Sent file {i}\nskipped {i}\nSENT again {i}\n")
+        os.utime(log, (1_000 + i, 1_000 + i))
+
+    logs = get_all_logs(tmp_path, search_term='sent', max_lines=3, jobs=[])
+
+    assert [l['line'] for l in logs] == ["Sent file 2", "SENT again 2", "Sent file 1"]
+
+
+def test_search_reaches_past_the_line_budget(tmp_path):
+    log = tmp_path / "rsync_abc.log"
+    log.write_text("ERROR: disk full\nINFO: disk check\n" + "".join(f"copied file {i}\n" for i in range(50)))
+
+    assert [l['line'] for l in get_all_logs(tmp_path, search_term='DISK', max_lines=10, jobs=JOBS)] == [
+        "ERROR: disk full", "INFO: disk check"
+    ]
+    assert [l['line'] for l in get_all_logs(tmp_path, search_term='disk', level_filter='ERROR',
+                                            max_lines=10, jobs=JOBS)] == ["ERROR: disk full"]
+
+
+def test_logs_page_reads_off_the_event_loop(client, monkeypatch):
+    calls = []
+
+    def fake_load(job_id, search, level):
+        # Raises if called on the event loop thread
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        calls.append((job_id, search, level))
+        return [], []
+
+    monkeypatch.setattr(logs_router, "_load_logs", fake_load)
+
+    response = client.get('/logs/?search=disk&level=ERROR')
+
+    assert response.status_code == 200
+    assert calls == [('all', 'disk', 'ERROR')]
+
+
+def test_export_streams_lines_in_chunks(client, monkeypatch):
+    logs = [{'job_name': 'Photos', 'line': f'line {i}'} for i in range(5)]
+    monkeypatch.setattr(logs_router, "get_all_logs", lambda *args, **kwargs: logs)
+
+    assert list(logs_router._export_lines(logs, chunk_lines=2)) == [
+        "[Photos] line 0\n[Photos] line 1",
+        "\n[Photos] line 2\n[Photos] line 3",
+        "\n[Photos] line 4",
+    ]
+
+    response = client.get('/logs/export?job_id=abc')
+
+    assert response.status_code == 200
+    assert response.headers['content-disposition'].startswith('attachment; filename=backup_logs_abc_')
+    assert response.text == "\n".join(f"[Photos] line {i}" for i in range(5))
+
+
+class _RecordingRepository:
+    def __init__(self):
+        self.calls = []
+
+    def search_logs(self, **kwargs):
+        self.calls.append(kwargs)
+        return []
+
+
+def test_export_keeps_indentation(client, tmp_path, monkeypatch):
+    log = tmp_path / "rsync_abc.log"
+    log.write_text("Traceback (most recent call last):\n  File \"x.py\", line 1   \n")
+    monkeypatch.setattr("core.paths.get_logs_dir", lambda: tmp_path)
+
+    response = client.get('/logs/export?job_id=abc')
+
+    assert response.text.splitlines()[-1].endswith(']   File "x.py", line 1')
+
+
+def test_database_query_filters_by_job_id(monkeypatch):
+    repository = _RecordingRepository()
+    monkeypatch.setattr(logs_router, "log_repository", repository)
+    monkeypatch.setattr(logs_router, "USE_DATABASE", True)
+
+    logs_router.get_logs_from_database(job_filter='Photos', jobs=JOBS)
+    logs_router.get_logs_from_database(job_filter='Deleted job', jobs=JOBS)
+
+    assert [(c['job_id'], c['job_name']) for c in repository.calls] == [
+        ('abc', None), (None, 'Deleted job')
+    ]
@@ -0,0 +1,124 @@
+"""
+Tests for the cached network reachability check
+"""
+import socket
+import time
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.network_monitor as network_monitor
+from core.network_monitor import check_network_online, clear_network_check_cache
+from core.settings import get_settings
+
+
+class _FakeConnection:
+    """Stand-in for a socket returned by create_connection"""
+
+    def __init__(self):
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    clear_network_check_cache()
+    yield
+    clear_network_check_cache()
+
+
+def test_result_is_cached_within_ttl(monkeypatch):
+    calls = []
+
+    def fake_connect(address, timeout):
+        calls.append((address, timeout))
+        return _FakeConnection()
+
+    monkeypatch.setattr(network_monitor.socket, "create_connection", fake_connect)
+
+    assert check_network_online() is True
+    assert check_network_online() is True
+    assert calls == [(('8.8.8.8', 53), 1.0)]
+
+
+def test_probe_socket_is_closed(monkeypatch):
+    conn = _FakeConnection()
+    monkeypatch.setattr(network_monitor.socket, "create_connection", lambda *a, **kw: conn)
+
+    check_network_online()
+
+    assert conn.closed
+
+
+def test_offline_when_all_targets_fail(monkeypatch):
+    def refuse(address, timeout):
+        raise socket.timeout("timed out")
+
+    monkeypatch.setattr(network_monitor.socket, "create_connection", refuse)
+
+    assert check_network_online() is False
+
+
+def test_cache_expires(monkeypatch):
+    results = iter([OSError("down"), OSError("down"), _FakeConnection()])
+
+    def flaky(address, timeout):
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(network_monitor.socket, "create_connection", flaky)
+    monkeypatch.setattr(network_monitor, "NETWORK_CHECK_CACHE_TTL", 0)
+
+    assert check_network_online() is False
+    assert check_network_online() is True
+
+
+def test_get_network_online_never_probes(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("get_network_online() must not open a socket")
+
+    monkeypatch.setattr(network_monitor.socket, "create_connection", fail)
+
+    assert network_monitor.get_network_online() is True
+
+
+def test_background_probe_updates_state(monkeypatch):
+    def refuse(address, timeout):
+        raise OSError("down")
+
+    monkeypatch.setattr(network_monitor.socket, "create_connection", refuse)
+
+    assert network_monitor.start_network_probe(interval=60) is True
+    try:
+        assert network_monitor.start_network_probe(interval=60) is False
+        for _ in range(100):
+            if network_monitor._network_online_cache is not None:
+                break
+            time.sleep(0.01)
+        assert network_monitor.get_network_online() is False
+    finally:
+        network_monitor.stop_network_probe()
+
+    assert network_monitor._network_probe_thread is None
+
+
+def test_probe_interval_follows_settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setitem(settings._settings, 'network_check_interval', 45)
+    assert network_monitor._network_probe_interval() == 45
+
+    monkeypatch.setitem(settings._settings, 'network_check_interval', 1)
+    assert network_monitor._network_probe_interval() == 5
+
+    monkeypatch.setitem(settings._settings, 'network_check_interval', 'soon')
+    assert network_monitor._network_probe_interval() == network_monitor.NETWORK_CHECK_CACHE_TTL
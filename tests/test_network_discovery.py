@@ -0,0 +1,52 @@
+"""
+Unit tests for utils.network_discovery.list_directory
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.network_discovery as network_discovery
+from utils.network_discovery import list_directory
+
+
+def test_directories_first_then_by_name(tmp_path):
+    (tmp_path / "b.txt").write_text("x" * 2048)
+    (tmp_path / "A.txt").write_text("a")
+    (tmp_path / "zdir").mkdir()
+    (tmp_path / ".hidden").write_text("h")
+
+    items = list_directory(str(tmp_path))
+
+    assert [(i['name'], i['is_dir'], i['size']) for i in items] == [
+        ("zdir", True, ""),
+        ("A.txt", False, "1 B"),
+        ("b.txt", False, "2.0 KB"),
+    ]
+    assert items[0]['path'] == str(tmp_path / "zdir")
+    assert [i['name'] for i in list_directory(str(tmp_path), show_hidden=True)] == [
+        "zdir", ".hidden", "A.txt", "b.txt"
+    ]
+
+
+def test_each_entry_is_stat_at_most_once(tmp_path, monkeypatch):
+    for i in range(5):
+        (tmp_path / f"file{i}.log").write_text("data")
+        (tmp_path / f"dir{i}").mkdir()
+
+    calls = []
+    real_stat = os.stat
+    monkeypatch.setattr(network_discovery.os, "stat",
+                        lambda p, *a, **kw: calls.append(p) or real_stat(p, *a, **kw))
+
+    assert len(list_directory(str(tmp_path))) == 10
+    assert len(calls) <= 10
+
+
+def test_missing_path_and_file_path(tmp_path):
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("x")
+
+    assert list_directory(str(tmp_path / "missing")) == []
+    assert list_directory(str(file_path)) == []
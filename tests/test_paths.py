@@ -0,0 +1,52 @@
+"""
+Tests for central data directory resolution
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.paths as paths
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    paths.clear_path_cache()
+    yield
+    paths.clear_path_cache()
+
+
+def test_env_override_is_created_once(tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    monkeypatch.setenv('BACKUP_MANAGER_DATA_DIR', str(data_dir))
+
+    assert paths.get_data_dir() == data_dir.resolve()
+    assert paths.get_logs_dir() == data_dir.resolve() / 'logs'
+    assert paths.get_logs_dir().is_dir()
+
+    def fail_mkdir(self, *args, **kwargs):
+        raise AssertionError("directory re-created on a cached lookup")
+
+    monkeypatch.setattr(Path, "mkdir", fail_mkdir)
+
+    assert paths.get_logs_dir() == data_dir.resolve() / 'logs'
+    assert paths.get_jobs_file() == data_dir.resolve() / 'jobs.yaml'
+
+
+def test_changing_override_is_picked_up(tmp_path, monkeypatch):
+    monkeypatch.setenv('BACKUP_MANAGER_DATA_DIR', str(tmp_path / "a"))
+    first = paths.get_data_dir()
+    monkeypatch.setenv('BACKUP_MANAGER_DATA_DIR', str(tmp_path / "b"))
+
+    assert paths.get_data_dir() != first
+    assert paths.get_data_dir() == (tmp_path / "b").resolve()
+
+
+def test_default_is_under_home(tmp_path, monkeypatch):
+    monkeypatch.delenv('BACKUP_MANAGER_DATA_DIR', raising=False)
+    monkeypatch.setenv('HOME', str(tmp_path))
+
+    assert paths.get_data_dir() == tmp_path / 'backup-manager'
+    assert paths.get_db_path() == tmp_path / 'backup-manager' / 'data' / 'logs.db'
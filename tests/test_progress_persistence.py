@@ -0,0 +1,63 @@
+"""
+Tests for how often JobManager writes engine progress to storage
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.job import Job
+from storage.job_storage import JobStorage
+
+
+def _progress(percent, bytes_transferred, status='running'):
+    return {'percent': percent, 'bytes_transferred': bytes_transferred, 'status': status}
+
+
+def test_unchanged_progress_is_never_rewritten(manager):
+    manager.last_progress_save['job'] = (time.time() - 3600, 40, 1000)
+
+    assert not manager._should_persist_progress('job', _progress(40, 1000))
+
+
+def test_percent_change_is_saved_immediately(manager):
+    manager.last_progress_save['job'] = (time.time(), 40, 1000)
+
+    assert manager._should_persist_progress('job', _progress(41, 1100))
+
+
+def test_small_changes_wait_for_the_interval(manager):
+    manager.last_progress_save['job'] = (time.time(), 40, 1000)
+    assert not manager._should_persist_progress('job', _progress(40, 1100))
+
+    manager.last_progress_save['job'] = (time.time() - manager.PROGRESS_SAVE_INTERVAL, 40, 1000)
+    assert manager._should_persist_progress('job', _progress(40, 1100))
+
+
+class _FinishedEngine:
+    def is_running(self):
+        return False
+
+    def get_progress(self):
+        return _progress(100, 5000, status='completed')
+
+
+def test_finished_job_is_saved_once(manager, tmp_path, monkeypatch):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.mkdir()
+    dest.mkdir()
+    _, _, job = manager.create_job("done", str(src), str(dest), Job.TYPE_RSYNC)
+    JobStorage._write_queue.join()
+    manager.engines[job.id] = _FinishedEngine()
+
+    saved = []
+    update_job = manager.storage.update_job
+    monkeypatch.setattr(manager.storage, "update_job", lambda j: saved.append(j.status) or update_job(j))
+
+    assert manager.update_job_from_engine(job.id)[0]
+    JobStorage._write_queue.join()
+
+    assert saved == [Job.STATUS_COMPLETED]
+    stored = manager.storage.get_job(job.id)
+    assert (stored.status, stored.progress['percent']) == (Job.STATUS_COMPLETED, 100)
@@ -0,0 +1,98 @@
+"""
+Tests for cached rclone lookups in utils.rclone_helper
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.rclone_helper as rclone_helper
+from utils.rclone_helper import clear_rclone_cache, is_rclone_installed, list_remotes
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    clear_rclone_cache()
+    yield
+    clear_rclone_cache()
+
+
+@pytest.fixture
+def fake_rclone(monkeypatch):
+    """Pretend rclone is installed and count subprocess invocations"""
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="gdrive:\ns3:\n", stderr="")
+
+    monkeypatch.setattr(rclone_helper.shutil, "which", lambda name: "/usr/bin/rclone")
+    monkeypatch.setattr(rclone_helper.subprocess, "run", fake_run)
+    return calls
+
+
+def test_list_remotes_runs_subprocess_once(fake_rclone):
+    assert list_remotes() == ["gdrive", "s3"]
+    assert list_remotes() == ["gdrive", "s3"]
+    assert len(fake_rclone) == 1
+
+
+def test_cached_remotes_are_not_shared_mutable_state(fake_rclone):
+    list_remotes().append("bogus")
+    assert list_remotes() == ["gdrive", "s3"]
+
+
+def test_clear_rclone_cache_forces_recheck(fake_rclone, monkeypatch):
+    assert is_rclone_installed() == (True, "/usr/bin/rclone")
+    list_remotes()
+
+    monkeypatch.setattr(rclone_helper.shutil, "which", lambda name: None)
+    assert is_rclone_installed()[0] is True  # still cached
+
+    clear_rclone_cache()
+    assert is_rclone_installed()[0] is False
+    assert list_remotes() == []
+    assert len(fake_rclone) == 1
+
+
+def test_cache_expires_after_ttl(fake_rclone, monkeypatch):
+    monkeypatch.setattr(rclone_helper, "RCLONE_CACHE_TTL", 0)
+
+    list_remotes()
+    list_remotes()
+
+    assert len(fake_rclone) == 2
+
+
+def test_concurrent_callers_share_one_subprocess(monkeypatch):
+    """Callers arriving while a refresh is running wait for its result"""
+    import threading
+
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_run(cmd, **kwargs):
+        calls.append(cmd)
+        started.set()
+        release.wait(5)
+        return subprocess.CompletedProcess(cmd, 0, stdout="gdrive:\n", stderr="")
+
+    monkeypatch.setattr(rclone_helper.shutil, "which", lambda name: "/usr/bin/rclone")
+    monkeypatch.setattr(rclone_helper.subprocess, "run", slow_run)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(list_remotes())) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [["gdrive"]] * 4
+    assert len(calls) == 1
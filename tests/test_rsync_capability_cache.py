@@ -0,0 +1,69 @@
+"""
+Tests for the cached rsync PATH lookup and --append-verify capability probe
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import engines.rsync_engine as rsync_engine
+from engines.rsync_engine import RsyncEngine, clear_rsync_cache, is_rsync_installed
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    clear_rsync_cache()
+    yield
+    clear_rsync_cache()
+
+
+def _engine(job_id):
+    return RsyncEngine(source="/tmp/test_source", dest="/tmp/test_dest", job_id=job_id)
+
+
+def test_probe_runs_once_for_many_engines(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="  --append-verify  like --append\n", stderr="")
+
+    monkeypatch.setattr(rsync_engine.subprocess, "run", fake_run)
+
+    engines = [_engine(f"job-{i}") for i in range(3)]
+
+    assert all(engine.supports_append_verify for engine in engines)
+    assert calls == [['rsync', '--help']]
+
+
+def test_failed_probe_is_not_cached(monkeypatch):
+    def missing(args, **kwargs):
+        raise FileNotFoundError("rsync")
+
+    monkeypatch.setattr(rsync_engine.subprocess, "run", missing)
+    assert _engine("job-a").supports_append_verify is False
+
+    monkeypatch.setattr(rsync_engine.subprocess, "run",
+                        lambda args, **kwargs: subprocess.CompletedProcess(args, 0, stdout="--append-verify", stderr=""))
+    assert _engine("job-b").supports_append_verify is True
+
+
+def test_path_lookup_is_cached_until_cleared(monkeypatch):
+    calls = []
+
+    def fake_which(name):
+        calls.append(name)
+        return None
+
+    monkeypatch.setattr(rsync_engine.shutil, "which", fake_which)
+
+    assert is_rsync_installed() is False
+    assert is_rsync_installed() is False
+    assert calls == ['rsync']
+
+    monkeypatch.setattr(rsync_engine.shutil, "which", lambda name: "/usr/bin/rsync")
+    clear_rsync_cache()
+    assert is_rsync_installed() is True
@@ -0,0 +1,60 @@
+"""
+Tests for the cached Settings singleton, its reload hook and batch updates
+"""
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.settings as settings_module
+from core.settings import Settings, get_settings, reload_settings
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    path = tmp_path / "settings.yaml"
+    monkeypatch.setattr(settings_module, "_settings_instance", Settings(str(path)))
+    return path
+
+
+def test_get_settings_does_not_reread_file(settings_file, monkeypatch):
+    settings = get_settings()
+
+    def fail_load():
+        raise AssertionError("settings file re-read")
+
+    monkeypatch.setattr(settings, "_load", fail_load)
+
+    assert get_settings() is settings
+    assert get_settings().get('auto_refresh_interval') == 2
+
+
+def test_reload_picks_up_external_edits(settings_file):
+    get_settings().set('max_retry_attempts', 3)
+    settings_file.write_text(yaml.safe_dump({'max_retry_attempts': 7}))
+
+    assert get_settings().get('max_retry_attempts') == 3
+    assert reload_settings().get('max_retry_attempts') == 7
+    assert get_settings().get('max_retry_attempts') == 7
+
+
+def test_update_saves_once(settings_file, monkeypatch):
+    settings = get_settings()
+    saves = []
+    real_save = settings._save
+
+    def counting_save():
+        saves.append(1)
+        real_save()
+
+    monkeypatch.setattr(settings, "_save", counting_save)
+
+    settings.update({'max_retry_attempts': 3, 'auto_refresh_interval': 5})
+
+    assert saves == [1]
+    on_disk = yaml.safe_load(settings_file.read_text())
+    assert on_disk['max_retry_attempts'] == 3
+    assert on_disk['auto_refresh_interval'] == 5
@@ -0,0 +1,138 @@
+"""
+Tests for the display lookup tables and helpers used by templates
+"""
+from bs4 import BeautifulSoup
+from markupsafe import Markup
+
+from fastapi_app import templates
+from fastapi_app.display import START_BUTTONS, STATUS_BADGE_CLASSES, format_eta, format_mb, format_speed, highlight
+from models.job import Job
+
+
+def _job(status):
+    return {
+        'id': f'job-{status}',
+        'name': f'{status} job',
+        'type': 'rsync',
+        'source': '/src',
+        'dest': '/dest',
+        'status': status,
+        'created_at': '2025-01-01T00:00:00',
+        'updated_at': '2025-01-02T00:00:00',
+        'progress': {'percent': 0, 'bytes_transferred': 0, 'total_bytes': 0,
+                     'speed_bytes': 0, 'eta_seconds': 0},
+        'settings': {},
+    }
+
+
+def test_job_card_badge_uses_status_table():
+    template = templates.env.get_template('partials/job_card.html')
+
+    for status, classes in STATUS_BADGE_CLASSES.items():
+        html = template.render(job=_job(status))
+        badge = BeautifulSoup(html, 'html.parser').find(class_='status-badge')
+        assert set(classes.split()) <= set(badge['class'])
+
+
+def test_recent_activity_unknown_status_falls_back_to_gray():
+    template = templates.env.get_template('partials/dashboard_recent_activity.html')
+
+    html = template.render(recent_jobs=[_job('running'), _job('mystery')])
+
+    assert 'bg-blue-500 animate-pulse' in html
+    assert 'text-blue-600' in html
+    assert 'bg-gray-400' in html
+    assert 'text-gray-600' in html
+
+
+def test_active_job_renders_stats_in_one_row():
+    template = templates.env.get_template('partials/dashboard_active_jobs.html')
+    job = _job('running')
+    job['progress'].update(percent=40, speed_bytes=2048, bytes_transferred=1048576,
+                           total_bytes=2097152, eta_seconds=120)
+
+    row = BeautifulSoup(template.render(active_jobs=[job]), 'html.parser').find(attrs={'data-job-id': job['id']})
+
+    cells = row.find_all(recursive=False)
+    assert len(cells) == 4
+    assert cells[0].find(class_='percent-info').get_text(strip=True) == '40%'
+    assert [c['class'][0] for c in cells[1:]] == ['speed-info', 'transfer-info', 'eta-info']
+    assert cells[3].get_text(strip=True) == 'ETA: 2.0 min'
+
+
+def test_start_button_label_follows_status():
+    template = templates.env.get_template('partials/job_card.html')
+
+    for status, (title, verb) in START_BUTTONS.items():
+        html = template.render(job=_job(status))
+        button = BeautifulSoup(html, 'html.parser').find('button', attrs={'hx-post': f'/jobs/job-{status}/start'})
+        assert button['title'] == title
+        assert button['aria-label'] == f'{verb} {status} job'
+
+    for status in ('running', 'completed'):
+        html = template.render(job=_job(status))
+        assert '/start"' not in html
+    assert set(START_BUTTONS) == Job.STARTABLE_STATUSES
+
+
+def test_highlight_ignores_case_and_escapes():
+    html = str(highlight('<b>Error</b> then ERROR', 'error'))
+
+    assert html == ('&lt;b&gt;<mark class="bg-yellow-300 px-1 rounded">Error</mark>&lt;/b&gt; then '
+                    '<mark class="bg-yellow-300 px-1 rounded">ERROR</mark>')
+    assert str(highlight('<i>', None)) == '&lt;i&gt;'
+
+
+def test_highlight_escapes_matched_markup():
+    html = highlight('a <x> b', '<X>')
+
+    assert isinstance(html, Markup)
+    assert str(html) == 'a <mark class="bg-yellow-300 px-1 rounded">&lt;x&gt;</mark> b'
+
+
+def test_logs_list_highlights_search_matches():
+    template = templates.env.get_template('partials/logs_list.html')
+    log = {'line': 'Transfer FAILED <x>', 'level': 'ERROR', 'timestamp': None,
+           'job_name': 'Photos', 'line_number': 1, 'highlighted': 'failed'}
+
+    html = template.render(logs=[log], search_term='failed')
+
+    assert '<mark class="bg-yellow-300 px-1 rounded">FAILED</mark> &lt;x&gt;' in html
+
+
+def test_logs_list_styles_rows_by_level():
+    template = templates.env.get_template('partials/logs_list.html')
+    logs = [
+        {'line': line, 'level': level, 'timestamp': None, 'job_name': 'Photos',
+         'line_number': i, 'highlighted': None}
+        for i, (level, line) in enumerate([('ERROR', 'boom'), ('INFO', 'ok'), ('TRACE', 'odd')], 1)
+    ]
+
+    rows = BeautifulSoup(template.render(logs=logs), 'html.parser').select('div.flex.gap-2')
+
+    assert 'border-red-500' in rows[0]['class']
+    assert '🔴' in rows[0].get_text()
+    assert 'border-red-500' not in rows[1]['class']
+    assert '🔵' in rows[1].get_text()
+    assert 'odd' in rows[2].get_text()
+
+
+def test_delete_confirmation_uses_shared_store():
+    """Every card reads one pending-delete slot instead of keeping its own flag"""
+    job = _job('failed')
+
+    for name in ('partials/job_card.html', 'partials/jobs_list.html'):
+        kwargs = {'job': job} if name.endswith('job_card.html') else {'jobs': [job]}
+        html = templates.env.get_template(name).render(**kwargs)
+        assert 'confirming' not in html
+        assert f"$store.jobs.pendingDelete = '{job['id']}'" in html
+        assert f"$store.jobs.pendingDelete === '{job['id']}'" in html
+
+
+def test_progress_formatters():
+    assert format_mb(0) == 0.0
+    assert format_mb(3 * 1024 * 1024 + 5243) == 3.01
+    assert format_speed(2048) == '2.0 KB/s'
+    assert format_speed(123457) == '120.56 KB/s'
+    assert format_eta(125) == '2.1 min'
+    assert format_eta(0) == 'calculating...'
@@ -0,0 +1,51 @@
+"""
+Unit tests for ConnectionManager.broadcast
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi_app.websocket.manager import ConnectionManager
+
+
+class _FakeWebSocket:
+    """Records the frames sent to one client"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("client went away")
+        self.sent.append(text)
+
+
+def test_broadcast_sends_one_encoded_frame_to_every_client():
+    manager = ConnectionManager()
+    clients = [_FakeWebSocket(), _FakeWebSocket()]
+    manager.active_connections.extend(clients)
+    message = {'type': 'job_updates', 'updates': [
+        {'type': 'job_update', 'job_id': 'a', 'progress': {'percent': 10}},
+        {'type': 'job_update', 'job_id': 'b', 'progress': {'percent': 20}},
+    ]}
+
+    asyncio.run(manager.broadcast(message))
+
+    assert clients[0].sent == clients[1].sent
+    assert len(clients[0].sent) == 1
+    assert json.loads(clients[0].sent[0]) == message
+
+
+def test_broadcast_drops_dead_connections():
+    manager = ConnectionManager()
+    alive, dead = _FakeWebSocket(), _FakeWebSocket(fail=True)
+    manager.active_connections.extend([alive, dead])
+
+    asyncio.run(manager.broadcast({'type': 'notification'}))
+
+    assert manager.active_connections == [alive]
+    assert len(alive.sent) == 1
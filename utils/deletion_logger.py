@@ -9,6 +9,9 @@ from datetime import datetime
 from typing import List, Dict, Optional
 import os
 
+from core.paths import get_logs_dir
+from utils.log_reader import tail_matching
+
 
 class DeletionLogger:
     """Logs file deletions for audit and recovery purposes"""
@@ -21,8 +24,7 @@ class DeletionLogger:
             job_id: UUID of the backup job
         """
         self.job_id = job_id
-        self.log_dir = Path.home() / 'backup-manager' / 'logs'
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_dir = get_logs_dir()
         self.log_file = self.log_dir / f'deletions_{job_id}.log'
 
     def log_deletion(self, file_path: str, file_size: int = 0, extra_info: str = "") -> bool:
@@ -212,14 +214,17 @@ class DeletionLogger:
 
             entries = []
 
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            # Read backwards from EOF until `limit` DELETED lines are found,
+            # instead of loading the whole (one line per file) audit log
+            lines = tail_matching(
+                self.log_file,
+                limit,
+                lambda line: '] DELETED: ' in line,
+                max_bytes=os.path.getsize(self.log_file)
+            )
 
             # Parse DELETED entries (reverse order for most recent first)
             for line in reversed(lines):
-                if ' DELETED: ' not in line:
-                    continue
-
                 try:
                     # Parse: [2025-01-15 10:30:45] DELETED: /path/to/file (size: 1.5 MB) | extra
                     parts = line.strip().split('] DELETED: ', 1)
@@ -252,9 +257,6 @@ class DeletionLogger:
                         'extra_info': extra_info
                     })
 
-                    if len(entries) >= limit:
-                        break
-
                 except Exception:
                     # Skip malformed lines
                     continue
@@ -0,0 +1,376 @@
+"""
+Log file reading and parsing helpers
+"""
+import mmap
+import os
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+# Explicit level keywords, matched case-insensitively; first match wins
+_LEVEL_RE = re.compile(r'\b(ERROR|FAIL|FAILED|WARN|WARNING|INFO|DEBUG|SUCCESS|COMPLETED)\b', re.IGNORECASE)
+
+# Heuristic for lines without a level keyword ("error"/"fail" are covered above)
+_ERROR_HINT_RE = re.compile(r'\b(exception|critical)\b', re.IGNORECASE)
+
+# Normalized level for each keyword
+_LEVEL_ALIASES = {
+    'ERROR': 'ERROR',
+    'FAIL': 'ERROR',
+    'FAILED': 'ERROR',
+    'WARN': 'WARNING',
+    'WARNING': 'WARNING',
+    'INFO': 'INFO',
+    'DEBUG': 'DEBUG',
+    'SUCCESS': 'INFO',
+    'COMPLETED': 'INFO',
+}
+
+# Timestamp formats, tried in order:
+#   [2025-10-27 19:48:54] anywhere in the line
+#   2025-10-27 19:48:54 at the start of the line
+# Either may use '/' as the date separator.
+_TIMESTAMP_RES = (
+    re.compile(r'\[(\d{4}[-/]\d{2}[-/]\d{2}\s+\d{2}:\d{2}:\d{2})\]'),
+    re.compile(r'^(\d{4}[-/]\d{2}[-/]\d{2}\s+\d{2}:\d{2}:\d{2})'),
+)
+
+# Fields of a timestamp returned by find_timestamp(); both date separators
+# must match
+_TIMESTAMP_FIELDS_RE = re.compile(r'(\d{4})([-/])(\d{2})\2(\d{2})\s+(\d{2}):(\d{2}):(\d{2})')
+
+# Directory listings reused by list_log_files(): (dir, suffix) -> (dir mtime_ns, file paths)
+_log_dir_index: Dict[Tuple[str, str], Tuple[int, List[str]]] = {}
+
+# A directory modified this recently may change again within the same
+# mtime tick, so its listing isn't cached (nanoseconds)
+_LOG_DIR_SETTLE_NS = 2_000_000_000
+
+
+class LogFile(NamedTuple):
+    """A log file found by list_log_files()"""
+    path: Path
+    mtime: float
+    size: int
+
+
+def read_last_lines(file_path: Union[str, Path], n: int = 500, block_size: int = 4096) -> List[str]:
+    """
+    Read the last N lines of a file without loading the whole file
+
+    Seeks to EOF and reads backwards in fixed-size blocks until more than
+    N newlines have been seen (or the start of the file is reached), so the
+    cost is proportional to the size of the tail rather than the file.
+
+    Args:
+        file_path: Path to the log file
+        n: Number of lines to return
+        block_size: Bytes to read per backward step
+
+    Returns:
+        List of up to N lines (without line endings), oldest first.
+        Empty list if the file cannot be read.
+    """
+    if n <= 0:
+        return []
+
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(0, 2)
+            pos = f.tell()
+            chunks = []
+            newlines = 0
+
+            while pos > 0 and newlines <= n:
+                read = min(block_size, pos)
+                pos -= read
+                f.seek(pos)
+                chunk = f.read(read)
+                newlines += chunk.count(b'\n')
+                chunks.append(chunk)
+    except OSError:
+        return []
+
+    # Split as bytes and decode only the lines being returned; the partial
+    # leading block is usually mostly lines that get discarded
+    chunks.reverse()
+    lines = b''.join(chunks).splitlines()[-n:]
+    return [line.decode('utf-8', errors='ignore') for line in lines]
+
+
+def tail_matching(
+    file_path: Union[str, Path],
+    n: int,
+    predicate: Callable[[str], object],
+    max_bytes: int = 65536,
+    block_size: int = 4096
+) -> List[str]:
+    """
+    Read the last N lines of a file that satisfy a predicate
+
+    Like read_last_lines(), but keeps reading backwards until N matching
+    lines are found, so filtered views aren't starved by a tail full of
+    non-matching lines. max_bytes bounds the work on files with few or no
+    matches.
+
+    Args:
+        file_path: Path to the log file
+        n: Number of matching lines to return
+        predicate: Called with each decoded line; truthy to keep it
+        max_bytes: Stop after reading this many bytes from the end
+        block_size: Bytes to read per backward step
+
+    Returns:
+        List of up to N matching non-empty lines, oldest first.
+        Empty list if the file cannot be read.
+    """
+    if n <= 0:
+        return []
+
+    matches = []
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(0, 2)
+            pos = f.tell()
+            bytes_read = 0
+            remainder = b''
+
+            while pos > 0 and len(matches) < n and bytes_read < max_bytes:
+                read = min(block_size, pos)
+                pos -= read
+                bytes_read += read
+                f.seek(pos)
+                lines = (f.read(read) + remainder).splitlines()
+
+                # The first line may continue in the previous block; carry
+                # it over unless the start of the file has been reached
+                remainder = lines.pop(0) if pos > 0 and lines else b''
+
+                for raw in reversed(lines):
+                    line = raw.decode('utf-8', errors='ignore')
+                    if line and predicate(line):
+                        matches.append(line)
+                        if len(matches) >= n:
+                            break
+    except OSError:
+        return []
+
+    matches.reverse()
+    return matches
+
+
+def tail_search(
+    file_path: Union[str, Path],
+    n: int,
+    term: str,
+    predicate: Optional[Callable[[str], object]] = None,
+    max_bytes: int = 65536
+) -> List[str]:
+    """
+    Read the last N lines of a file containing a search term
+
+    Memory-maps the file and searches the raw bytes of its last max_bytes
+    for the term, so only lines that contain it are decoded. Matching is
+    case-insensitive like the log viewer's highlighting. Terms that aren't
+    plain ASCII (where byte-level case folding would differ) go through
+    tail_matching().
+
+    Args:
+        file_path: Path to the log file
+        n: Number of matching lines to return
+        term: Literal text to look for
+        predicate: Optional further filter, called with each decoded match
+        max_bytes: Only search this many bytes from the end of the file
+
+    Returns:
+        List of up to N matching lines, oldest first.
+        Empty list if the file cannot be read.
+    """
+    if n <= 0 or not term:
+        return []
+
+    if not term.isascii() or '\n' in term or '\r' in term:
+        pattern = re.compile(re.escape(term), re.IGNORECASE)
+
+        def wanted(line):
+            return pattern.search(line) and (predicate is None or predicate(line))
+
+        return tail_matching(file_path, n, wanted, max_bytes=max_bytes)
+
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _search_mapped(mm, size, n, term.lower().encode('ascii'), predicate, max_bytes)
+    except (OSError, ValueError):
+        return []
+
+
+def _search_mapped(mm: mmap.mmap, size: int, n: int, needle: bytes,
+                   predicate: Optional[Callable[[str], object]], max_bytes: int) -> List[str]:
+    """Return the last N lines of a mapped file that contain needle (ASCII, lowercase) and match predicate"""
+    start = max(0, size - max_bytes)
+    if start > 0:
+        # Skip the line cut by the window, as tail_matching() does
+        newline = mm.find(b'\n', start - 1)
+        if newline == -1:
+            return []
+        start = newline + 1
+
+    # Case-fold the window once and search it with bytes.find(), several
+    # times faster than an IGNORECASE regex. bytes.lower() only changes
+    # ASCII letters, so offsets in the copy are offsets in the file.
+    haystack = mm[start:size].lower()
+
+    # Line spans containing a match, in file order
+    spans = []
+    pos = 0
+    while True:
+        index = haystack.find(needle, pos)
+        if index == -1:
+            break
+        line_start = haystack.rfind(b'\n', 0, index) + 1
+        line_end = haystack.find(b'\n', index + len(needle))
+        if line_end == -1:
+            line_end = len(haystack)
+        spans.append((start + line_start, start + line_end))
+        pos = line_end + 1
+
+    matches = []
+    for line_start, line_end in reversed(spans):
+        line = mm[line_start:line_end].rstrip(b'\r').decode('utf-8', errors='ignore')
+        if predicate is None or predicate(line):
+            matches.append(line)
+            if len(matches) >= n:
+                break
+
+    matches.reverse()
+    return matches
+
+
+def list_log_files(logs_dir: Union[str, Path], suffix: str = '.log') -> List[LogFile]:
+    """
+    List log files in a directory, newest first
+
+    The directory listing is cached on the directory's mtime, which only
+    changes when files are added, removed or renamed, so repeat calls skip
+    the readdir. Each file is still stat()ed on every call because appends
+    change a file's mtime and size without touching the directory.
+
+    Args:
+        logs_dir: Directory to scan (not recursive)
+        suffix: File name suffix to include
+
+    Returns:
+        List of LogFile (path, mtime, size) sorted by mtime descending.
+        Empty list if the directory does not exist.
+    """
+    try:
+        dir_mtime = os.stat(logs_dir).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    key = (str(logs_dir), suffix)
+    cached = _log_dir_index.get(key)
+    if cached is not None and cached[0] == dir_mtime:
+        paths = cached[1]
+    else:
+        paths = _scan_log_dir(logs_dir, suffix)
+        if paths is None:
+            return []
+        if time.time_ns() - dir_mtime > _LOG_DIR_SETTLE_NS:
+            _log_dir_index[key] = (dir_mtime, paths)
+
+    entries = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # File removed since the directory was scanned
+            continue
+        entries.append(LogFile(Path(path), stat.st_mtime, stat.st_size))
+
+    entries.sort(key=lambda item: item.mtime, reverse=True)
+    return entries
+
+
+def _scan_log_dir(logs_dir: Union[str, Path], suffix: str) -> Optional[List[str]]:
+    """Return paths of regular files in logs_dir ending with suffix, or None if it doesn't exist"""
+    paths = []
+    try:
+        with os.scandir(logs_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(suffix):
+                    continue
+                try:
+                    if entry.is_file():
+                        paths.append(entry.path)
+                except OSError:
+                    continue
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return paths
+
+
+def parse_log_level(line: str) -> str:
+    """
+    Extract a normalized log level from a log line
+
+    Args:
+        line: Raw log line
+
+    Returns:
+        One of 'ERROR', 'WARNING', 'INFO' or 'DEBUG' (defaults to 'INFO')
+    """
+    match = _LEVEL_RE.search(line)
+    if match:
+        return _LEVEL_ALIASES[match.group(1).upper()]
+
+    if _ERROR_HINT_RE.search(line):
+        return 'ERROR'
+
+    return 'INFO'
+
+
+def find_timestamp(line: str) -> Optional[str]:
+    """
+    Find the raw timestamp text in a log line
+
+    Args:
+        line: Raw log line
+
+    Returns:
+        Timestamp string as written in the line, or None if not found
+    """
+    for pattern in _TIMESTAMP_RES:
+        match = pattern.search(line)
+        if match:
+            return match.group(1)
+    return None
+
+
+def parse_log_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """
+    Parse a timestamp string returned by find_timestamp()
+
+    Args:
+        timestamp_str: Timestamp in 'YYYY-MM-DD HH:MM:SS' or 'YYYY/MM/DD HH:MM:SS' form
+
+    Returns:
+        datetime, or None if the string is not a valid date
+    """
+    # Build the datetime from the regex groups; strptime() is several times
+    # slower and this runs for every displayed or indexed log line
+    match = _TIMESTAMP_FIELDS_RE.fullmatch(timestamp_str)
+    if not match:
+        return None
+
+    year, _, month, day, hour, minute, second = match.groups()
+    try:
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+    except ValueError:
+        return None
@@ -226,36 +226,44 @@ def list_directory(path: str, show_hidden: bool = False) -> List[Dict[str, any]]
         if not path_obj.is_dir():
             return items
 
-        # List directory contents
-        for item in sorted(path_obj.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower())):
-            # Skip hidden files unless requested
-            if not show_hidden and item.name.startswith('.'):
-                continue
+        # scandir() reports the entry type from the directory read, and
+        # DirEntry caches its stat() result, so each entry costs at most
+        # one stat() call instead of one per is_dir()/is_file()/stat()
+        with os.scandir(path_obj) as it:
+            for entry in it:
+                # Skip hidden files unless requested
+                if not show_hidden and entry.name.startswith('.'):
+                    continue
 
-            try:
-                # Get size for files
-                size_str = ""
-                if item.is_file():
-                    size = item.stat().st_size
-                    if size > 1024**3:
-                        size_str = f"{size / 1024**3:.1f} GB"
-                    elif size > 1024**2:
-                        size_str = f"{size / 1024**2:.1f} MB"
-                    elif size > 1024:
-                        size_str = f"{size / 1024:.1f} KB"
-                    else:
-                        size_str = f"{size} B"
-
-                items.append({
-                    'name': item.name,
-                    'path': str(item),
-                    'is_dir': item.is_dir(),
-                    'size': size_str,
-                    'readable': os.access(str(item), os.R_OK)
-                })
-            except Exception as e:
-                logger.warning(f"Error getting info for {item}: {e}")
-                continue
+                try:
+                    is_dir = entry.is_dir()
+
+                    # Get size for files
+                    size_str = ""
+                    if not is_dir and entry.is_file():
+                        size = entry.stat().st_size
+                        if size > 1024**3:
+                            size_str = f"{size / 1024**3:.1f} GB"
+                        elif size > 1024**2:
+                            size_str = f"{size / 1024**2:.1f} MB"
+                        elif size > 1024:
+                            size_str = f"{size / 1024:.1f} KB"
+                        else:
+                            size_str = f"{size} B"
+
+                    items.append({
+                        'name': entry.name,
+                        'path': entry.path,
+                        'is_dir': is_dir,
+                        'size': size_str,
+                        'readable': os.access(entry.path, os.R_OK)
+                    })
+                except Exception as e:
+                    logger.warning(f"Error getting info for {entry.path}: {e}")
+                    continue
+
+        # Directories first, then by name
+        items.sort(key=lambda x: (not x['is_dir'], x['name'].lower()))
 
     except PermissionError:
         logger.warning(f"Permission denied: {path}")
@@ -4,30 +4,78 @@ Rclone configuration helper utilities
 import subprocess
 import shutil
 import re
-from typing import List, Tuple
+import threading
+import time
+from typing import List, Optional, Tuple
+
+# Seconds that rclone install/remote lookups are reused before re-checking
+RCLONE_CACHE_TTL = 300
+
+# Module-level caches: (checked_at, result)
+_rclone_installed_cache: Optional[Tuple[float, Tuple[bool, str]]] = None
+_remotes_cache: Optional[Tuple[float, List[str]]] = None
+
+# Serializes remote list refreshes so concurrent callers share one subprocess
+_remotes_lock = threading.Lock()
 
 
 def is_rclone_installed() -> Tuple[bool, str]:
     """
     Check if rclone is installed and accessible
 
+    The result is cached for RCLONE_CACHE_TTL seconds; call
+    clear_rclone_cache() to force a fresh check.
+
     Returns:
         Tuple of (is_installed, path_or_error_message)
     """
+    global _rclone_installed_cache
+
+    now = time.monotonic()
+    if _rclone_installed_cache is not None and now - _rclone_installed_cache[0] < RCLONE_CACHE_TTL:
+        return _rclone_installed_cache[1]
+
     rclone_path = shutil.which('rclone')
     if rclone_path:
-        return True, rclone_path
+        result = (True, rclone_path)
     else:
-        return False, "rclone not found in PATH. Install with: brew install rclone"
+        result = (False, "rclone not found in PATH. Install with: brew install rclone")
+
+    _rclone_installed_cache = (now, result)
+    return result
 
 
 def list_remotes() -> List[str]:
     """
     List all configured rclone remotes
 
+    Runs `rclone listremotes` at most once every RCLONE_CACHE_TTL seconds,
+    even when several requests ask at the same time; call
+    clear_rclone_cache() after changing the rclone config.
+
     Returns:
         List of remote names (empty list if rclone not installed or no remotes)
     """
+    global _remotes_cache
+
+    cached = _remotes_cache
+    if cached is not None and time.monotonic() - cached[0] < RCLONE_CACHE_TTL:
+        return list(cached[1])
+
+    with _remotes_lock:
+        # Another caller may have refreshed while we waited for the lock
+        cached = _remotes_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < RCLONE_CACHE_TTL:
+            return list(cached[1])
+
+        remotes = _list_remotes_uncached()
+        _remotes_cache = (now, remotes)
+        return list(remotes)
+
+
+def _list_remotes_uncached() -> List[str]:
+    """Run `rclone listremotes` and parse its output"""
     try:
         # Check if rclone is installed
         is_installed, _ = is_rclone_installed()
@@ -241,3 +289,16 @@ def get_rclone_version() -> str:
     except Exception as e:
         _rclone_version_cache = f"Error: {str(e)}"
         return _rclone_version_cache
+
+
+def clear_rclone_cache():
+    """
+    Forget cached rclone install status, remotes and version
+
+    Call after installing rclone or editing its configuration so the
+    next lookup re-runs the underlying checks.
+    """
+    global _rclone_installed_cache, _remotes_cache, _rclone_version_cache
+    _rclone_installed_cache = None
+    _remotes_cache = None
+    _rclone_version_cache = None